@@ -11,14 +11,18 @@ from .windows.widgets.appearance_mode import AppearanceModeTracker
 from .windows.widgets.font import FontManager
 from .windows.widgets.scaling import ScalingTracker
 from .windows.widgets.theme import ThemeManager
+from .windows.widgets.color import ColorManager
 from .windows.widgets.core_rendering import DrawEngine
+from .windows.widgets.core_widget_classes import SharedBindings
 
 # import widgets
 from .windows.widgets import CTkButton
+from .windows.widgets import CTkCanvasContainer
 from .windows.widgets import CTkCheckBox
 from .windows.widgets import CTkComboBox
 from .windows.widgets import CTkEntry
 from .windows.widgets import CTkFrame
+from .windows.widgets import CTkHeatmap
 from .windows.widgets import CTkLabel
 from .windows.widgets import CTkOptionMenu
 from .windows.widgets import CTkProgressBar
@@ -30,16 +34,26 @@ from .windows.widgets import CTkSwitch
 from .windows.widgets import CTkTabview
 from .windows.widgets import CTkTextbox
 
+# import lightweight canvas widgets
+from .windows.widgets import CTkCanvasButton, CTkCanvasCheckBox, CTkCanvasLabel, CTkCanvasProgressBar, CTkCanvasSwitch
+
 # import windows
 from .windows import CTk
 from .windows import CTkToplevel
 from .windows import CTkInputDialog
+from .windows import CTkToplevelPool
 
 # import font classes
 from .windows.widgets.font import CTkFont
 
 # import image classes
-from .windows.widgets.image import CTkImage
+from .windows.widgets.image import CTkImage, CTkAnimatedImage, CTkFrameBuffer, ImageCache
+
+# import style classes
+from .windows.widgets.style import CTkStyle
+
+# import textbox classes
+from .windows.widgets.textbox import MappedDocument, CTkLexer, RegexLexer, PythonLexer, CTkTextSearch
 
 _ = Variable, StringVar, IntVar, DoubleVar, BooleanVar, CENTER, filedialog  # prevent IDE from removing unused imports
 
@@ -1,3 +1,4 @@
 from .ctk_tk import CTk
 from .ctk_toplevel import CTkToplevel
 from .ctk_input_dialog import CTkInputDialog
+from .ctk_toplevel_pool import CTkToplevelPool
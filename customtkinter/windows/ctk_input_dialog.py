@@ -1,3 +1,4 @@
+import tkinter
 from typing import Union, Tuple, Optional
 
 from .widgets import CTkLabel
@@ -40,12 +41,14 @@ class CTkInputDialog(CTkToplevel):
         self._user_input: Union[str, None] = None
         self._running: bool = False
         self._text = text
+        self._input_finished: bool = False
+        self._input_finished_variable = tkinter.BooleanVar(master=self, value=False)  # used by get_input() if dialog is pooled
 
         self.title(title)
         self.lift()  # lift window on top
         self.attributes("-topmost", True)  # stay on top
         self.protocol("WM_DELETE_WINDOW", self._on_closing)
-        self.after(10, self._create_widgets)  # create widgets with slight delay, to avoid white flickering of background
+        self.add_build_stage(self._create_widgets)  # create widgets after first frame is painted, to avoid white flickering of background
         self.resizable(False, False)
         self.grab_set()  # make other windows not clickable
 
@@ -92,19 +95,47 @@ class CTkInputDialog(CTkToplevel):
         self.after(150, lambda: self._entry.focus())  # set focus to entry with slight delay, otherwise it won't work
         self._entry.bind("<Return>", self._ok_event)
 
+    def _pool_reset(self, text: Optional[str] = None, title: Optional[str] = None):
+        """ called by CTkToplevelPool to reuse the dialog with new text and title """
+        self.finish_build_stages()  # make sure widgets exist if dialog was not shown yet
+
+        self._user_input = None
+        self._input_finished = False
+        if text is not None:
+            self._text = text
+            self._label.configure(text=self._text)
+        if title is not None:
+            self.title(title)
+        self._entry.delete(0, "end")
+
+        self.attributes("-topmost", True)
+        self.grab_set()
+        self.after(150, lambda: self._entry.focus())
+
+    def _close(self):
+        """ destroy dialog or give it back to the CTkToplevelPool it belongs to """
+        self.grab_release()
+        self._input_finished = True
+        self._input_finished_variable.set(True)
+
+        if self._toplevel_pool is not None:
+            self._toplevel_pool.release(self)
+        else:
+            self.destroy()
+
     def _ok_event(self, event=None):
         self._user_input = self._entry.get()
-        self.grab_release()
-        self.destroy()
+        self._close()
 
     def _on_closing(self):
-        self.grab_release()
-        self.destroy()
+        self._close()
 
     def _cancel_event(self):
-        self.grab_release()
-        self.destroy()
+        self._close()
 
     def get_input(self):
-        self.master.wait_window(self)
+        if self._toplevel_pool is None:
+            self.master.wait_window(self)
+        elif not self._input_finished:
+            self.master.wait_variable(self._input_finished_variable)
         return self._user_input
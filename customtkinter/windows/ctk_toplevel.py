@@ -1,4 +1,5 @@
 import tkinter
+import time
 from distutils.version import StrictVersion as Version
 import sys
 import os
@@ -9,11 +10,12 @@ from typing import Union, Tuple, Optional
 from .widgets.theme import ThemeManager
 from .widgets.scaling import CTkScalingBaseClass
 from .widgets.appearance_mode import CTkAppearanceModeBaseClass
+from .staged_build_base_class import CTkStagedBuildBaseClass
 
 from customtkinter.windows.widgets.utility.utility_functions import pop_from_dict_by_set, check_kwargs_empty
 
 
-class CTkToplevel(tkinter.Toplevel, CTkAppearanceModeBaseClass, CTkScalingBaseClass):
+class CTkToplevel(tkinter.Toplevel, CTkAppearanceModeBaseClass, CTkScalingBaseClass, CTkStagedBuildBaseClass):
     """
     Toplevel window with dark titlebar on Windows and macOS.
     For detailed information check out the documentation.
@@ -30,12 +32,15 @@ class CTkToplevel(tkinter.Toplevel, CTkAppearanceModeBaseClass, CTkScalingBaseCl
                  fg_color: Optional[Union[str, Tuple[str, str]]] = None,
                  **kwargs):
 
+        construction_start_time = time.perf_counter()  # reference for time to first frame and time to interactive
         self._enable_macos_dark_title_bar()
 
         # call init methods of super classes
         super().__init__(*args, **pop_from_dict_by_set(kwargs, self._valid_tk_toplevel_arguments))
         CTkAppearanceModeBaseClass.__init__(self)
         CTkScalingBaseClass.__init__(self, scaling_type="window")
+        CTkStagedBuildBaseClass.__init__(self, construction_start_time=construction_start_time)
+        ThemeManager._add_widget(self)
         check_kwargs_empty(kwargs, raise_error=True)
 
         self._current_width = 200  # initial window size, always without scaling
@@ -66,14 +71,23 @@ class CTkToplevel(tkinter.Toplevel, CTkAppearanceModeBaseClass, CTkScalingBaseCl
         self.bind('<FocusIn>', self._focus_in_event)
 
         self._block_update_dimensions_event = False
+        self._toplevel_pool = None  # CTkToplevelPool which manages this window, set by the pool
 
     def destroy(self):
         self._disable_macos_dark_title_bar()
 
         # call destroy methods of super classes
+        CTkStagedBuildBaseClass.destroy(self)
         tkinter.Toplevel.destroy(self)
         CTkAppearanceModeBaseClass.destroy(self)
         CTkScalingBaseClass.destroy(self)
+        ThemeManager._remove_widget(self)
+
+    def _pool_reset(self, title: Optional[str] = None, **kwargs):
+        """ called by CTkToplevelPool before a pooled window gets shown again, can be overridden """
+        if title is not None:
+            self.title(title)
+        self.configure(**kwargs)
 
     def _focus_in_event(self, event):
         # sometimes window looses jumps back on macOS if window is selected from Mission Control, so has to be lifted again
@@ -270,3 +284,7 @@ class CTkToplevel(tkinter.Toplevel, CTkAppearanceModeBaseClass, CTkScalingBaseCl
             self._windows_set_titlebar_color(mode_string)
 
         super().configure(bg=self._apply_appearance_mode(self._fg_color))
+
+    def _apply_theme_colors(self):
+        """ called by ThemeManager.apply_theme() after theme color attributes were replaced """
+        super().configure(bg=self._apply_appearance_mode(self._fg_color))
@@ -0,0 +1,90 @@
+from typing import List, Type
+
+from .ctk_toplevel import CTkToplevel
+
+
+class CTkToplevelPool:
+    """
+    Pool of pre-built, withdrawn CTkToplevel windows (or sub-classes like CTkInputDialog), that get reused
+    instead of being created and destroyed every time. Pooled windows stay registered at the
+    AppearanceModeTracker and ScalingTracker, so they are always up to date when they get shown again.
+
+    window_class: CTkToplevel or sub-class, must be constructable with window_kwargs
+    window_kwargs: keyword arguments passed to window_class when a new window is created
+    max_size: maximum number of withdrawn windows kept in the pool, surplus windows get destroyed on release
+
+    - prefill() create and build windows in advance
+    - acquire() take window from pool (or create new one), reset it with the given kwargs and show it
+    - release() withdraw window and put it back into the pool
+    - clear() destroy all pooled windows
+    """
+
+    def __init__(self,
+                 window_class: Type[CTkToplevel] = CTkToplevel,
+                 max_size: int = 2,
+                 **window_kwargs):
+
+        self._window_class = window_class
+        self._window_kwargs = window_kwargs
+        self._max_size = max_size
+        self._pooled_windows: List[CTkToplevel] = []
+
+    def __len__(self) -> int:
+        return len(self._pooled_windows)
+
+    def _create_window(self) -> CTkToplevel:
+        window = self._window_class(**self._window_kwargs)
+        window._toplevel_pool = self
+
+        # closing the window releases it to the pool, if the window class has no own close handler
+        if not window.protocol("WM_DELETE_WINDOW"):
+            window.protocol("WM_DELETE_WINDOW", lambda: self.release(window))
+        return window
+
+    def prefill(self, count: int = None):
+        """ create withdrawn windows until count (default max_size) windows are in the pool """
+        count = self._max_size if count is None else min(count, self._max_size)
+
+        while len(self._pooled_windows) < count:
+            window = self._create_window()
+            window.withdraw()  # withdraw before the window gets mapped for the first time
+            window.grab_release()
+            window.finish_build_stages()
+            self._pooled_windows.append(window)
+
+    def acquire(self, **kwargs) -> CTkToplevel:
+        """ returns pooled window or new window if pool is empty, kwargs are passed to _pool_reset() of the window before it is shown """
+        window = None
+        while window is None and len(self._pooled_windows) > 0:
+            candidate = self._pooled_windows.pop()
+            if candidate.winfo_exists():  # skip windows which got destroyed from outside
+                window = candidate
+
+        if window is None:
+            window = self._create_window()
+
+        window._pool_reset(**kwargs)
+        window.deiconify()
+        window.lift()
+        return window
+
+    def release(self, window: CTkToplevel):
+        """ withdraw window and keep it in the pool, window gets destroyed if pool is full """
+        if not window.winfo_exists() or window in self._pooled_windows:
+            return
+
+        window.grab_release()
+        if len(self._pooled_windows) < self._max_size:
+            window.withdraw()
+            self._pooled_windows.append(window)
+        else:
+            window._toplevel_pool = None
+            window.destroy()
+
+    def clear(self):
+        """ destroy all windows in the pool """
+        for window in self._pooled_windows:
+            if window.winfo_exists():
+                window._toplevel_pool = None
+                window.destroy()
+        self._pooled_windows = []
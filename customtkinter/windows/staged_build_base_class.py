@@ -0,0 +1,148 @@
+import sys
+import time
+import tkinter
+from typing import Union, Callable, List, Dict, Optional
+
+try:
+    from typing import TypedDict
+except ImportError:
+    from typing_extensions import TypedDict
+
+from .widgets.font import FontManager
+
+
+class CTkStagedBuildBaseClass:
+    """
+    Super-class for CTk and CTkToplevel that manages staged construction of the window content.
+    The window gets painted with cheap placeholder widgets first, afterwards the registered build
+    stages are executed incrementally in small time slices, visible placeholders first. Methods:
+
+    - add_build_stage() register function which builds content, optionally into a placeholder widget
+    - finish_build_stages() execute all pending build stages immediately
+    - get_startup_times() get 'first_frame' and 'interactive' time in seconds since window creation and 'font_setup' time
+    - destroy() must be called when sub-class is destroyed
+
+    An exception in a build stage is reported with report_callback_exception(), the remaining stages are still built.
+    """
+
+    _build_stage_time_budget: int = 12  # ms, time per slice in which build stages are executed before the event loop gets control again
+    _build_stage_interval: int = 1  # ms, pause between two slices
+
+    def __init__(self, construction_start_time: Optional[float] = None):
+        class BuildStageDict(TypedDict):
+            function: Callable
+            placeholder: Union[tkinter.Misc, None]
+            priority: int
+
+        self.__build_stages: List[BuildStageDict] = []
+        self.__build_stages_sorted: bool = True
+        self.__construction_start_time: float = time.perf_counter() if construction_start_time is None else construction_start_time
+        self.__first_frame_time: Union[float, None] = None
+        self.__interactive_time: Union[float, None] = None
+        self.__build_stage_after_id: Union[str, None] = None
+
+        self.bind("<Map>", self.__map_event, add="+")
+
+    def destroy(self):
+        if self.__build_stage_after_id is not None:
+            try:
+                self.after_cancel(self.__build_stage_after_id)
+            except Exception:
+                pass
+            self.__build_stage_after_id = None
+        self.__build_stages = []
+
+    def add_build_stage(self, build_function: Callable, placeholder: Optional[tkinter.Misc] = None, priority: int = 0):
+        """
+        Register function that builds part of the window content after the first frame is painted.
+        If a placeholder widget (for example an empty CTkFrame that is already placed) is given, it gets
+        passed to build_function as the only argument and stages with a visible placeholder are built first.
+        Stages with a lower priority value are built earlier than stages with the same visibility.
+        """
+        self.__build_stages.append({"function": build_function, "placeholder": placeholder, "priority": priority})
+        self.__build_stages_sorted = False
+
+        # window was already painted and no build loop is running -> start loop directly
+        if self.__first_frame_time is not None and self.__build_stage_after_id is None:
+            self.__interactive_time = None
+            self.__build_stage_after_id = self.after(self._build_stage_interval, self.__execute_build_stages)
+
+    def finish_build_stages(self):
+        """ execute all pending build stages immediately, for example to pre-build a window that is not shown yet """
+        if self.__build_stage_after_id is not None:
+            self.after_cancel(self.__build_stage_after_id)
+            self.__build_stage_after_id = None
+
+        self.__build_stages.sort(key=lambda stage: stage["priority"])
+        while len(self.__build_stages) > 0:
+            self.__execute_build_stage(self.__build_stages.pop(0))
+
+        self.__build_stages_sorted = True
+        self.__interactive_time = time.perf_counter()
+
+    def get_startup_times(self) -> Dict[str, Union[float, None]]:
+        """
+        returns dict with 'first_frame' and 'interactive' time in seconds since the creation of the window,
+        values are None if the state is not reached yet, and 'font_setup' time in seconds needed on import of customtkinter
+        """
+        return {"first_frame": None if self.__first_frame_time is None else self.__first_frame_time - self.__construction_start_time,
+                "interactive": None if self.__interactive_time is None else self.__interactive_time - self.__construction_start_time,
+                "font_setup": FontManager.setup_time}
+
+    def __map_event(self, event):
+        # <Map> binding of toplevel window is also triggered for all children, so check the widget
+        if event.widget is not self or self.__first_frame_time is not None:
+            return
+
+        self.update_idletasks()  # flush pending redraws, so that the first frame is actually painted
+        self.__first_frame_time = time.perf_counter()
+
+        if len(self.__build_stages) > 0:
+            self.__build_stage_after_id = self.after(self._build_stage_interval, self.__execute_build_stages)
+        else:
+            self.__interactive_time = self.__first_frame_time
+
+    def __sort_build_stages(self):
+        """ sort build stages: visible placeholders first (from top to bottom), then invisible ones, then by priority """
+        window_width, window_height = self.winfo_width(), self.winfo_height()
+        window_x, window_y = self.winfo_rootx(), self.winfo_rooty()
+
+        def sort_key(stage):
+            placeholder = stage["placeholder"]
+            if placeholder is None:
+                return 0, stage["priority"], 0
+            try:
+                if not placeholder.winfo_ismapped():
+                    return 1, stage["priority"], 0
+                x, y = placeholder.winfo_rootx() - window_x, placeholder.winfo_rooty() - window_y
+                visible = x < window_width and y < window_height and x + placeholder.winfo_width() > 0 and y + placeholder.winfo_height() > 0
+                return 0 if visible else 1, stage["priority"], max(y, 0)
+            except tkinter.TclError:
+                return 1, stage["priority"], 0
+
+        self.__build_stages.sort(key=sort_key)  # sort is stable, so registration order is kept for equal keys
+        self.__build_stages_sorted = True
+
+    def __execute_build_stage(self, stage):
+        try:
+            if stage["placeholder"] is None:
+                stage["function"]()
+            elif stage["placeholder"].winfo_exists():
+                stage["function"](stage["placeholder"])
+        except Exception:
+            self.report_callback_exception(*sys.exc_info())  # report like a failing callback and build the other stages
+
+    def __execute_build_stages(self):
+        self.__build_stage_after_id = None
+        if not self.__build_stages_sorted:
+            self.__sort_build_stages()  # only sort when new stages were added, because every sort needs winfo calls
+
+        slice_end_time = time.perf_counter() + self._build_stage_time_budget / 1000
+        while len(self.__build_stages) > 0 and time.perf_counter() < slice_end_time:
+            self.__execute_build_stage(self.__build_stages.pop(0))
+
+        if len(self.__build_stages) > 0:
+            self.__build_stage_after_id = self.after(self._build_stage_interval, self.__execute_build_stages)
+        else:
+            self.update_idletasks()
+            self.__interactive_time = time.perf_counter()
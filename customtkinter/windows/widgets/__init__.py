@@ -1,8 +1,10 @@
 from .ctk_button import CTkButton
+from .ctk_canvas_container import CTkCanvasContainer
 from .ctk_checkbox import CTkCheckBox
 from .ctk_combobox import CTkComboBox
 from .ctk_entry import CTkEntry
 from .ctk_frame import CTkFrame
+from .ctk_heatmap import CTkHeatmap
 from .ctk_label import CTkLabel
 from .ctk_optionmenu import CTkOptionMenu
 from .ctk_progressbar import CTkProgressBar
@@ -13,3 +15,5 @@ from .ctk_slider import CTkSlider
 from .ctk_switch import CTkSwitch
 from .ctk_tabview import CTkTabview
 from .ctk_textbox import CTkTextbox
+
+from .canvas_items import CTkCanvasButton, CTkCanvasCheckBox, CTkCanvasLabel, CTkCanvasProgressBar, CTkCanvasSwitch
@@ -0,0 +1,6 @@
+from .ctk_canvas_item import CTkCanvasItem
+from .ctk_canvas_button import CTkCanvasButton
+from .ctk_canvas_checkbox import CTkCanvasCheckBox
+from .ctk_canvas_label import CTkCanvasLabel
+from .ctk_canvas_progressbar import CTkCanvasProgressBar
+from .ctk_canvas_switch import CTkCanvasSwitch
@@ -0,0 +1,199 @@
+import tkinter
+from typing import Union, Tuple, Callable, Optional
+
+from ..core_rendering import CanvasText
+from ..ctk_canvas_container import CTkCanvasContainer
+from ..theme import ThemeManager
+from ..font import CTkFont
+from .ctk_canvas_item import CTkCanvasItem
+
+
+class CTkCanvasButton(CTkCanvasItem):
+    """
+    Lightweight button with rounded corners, border, hover effect and command, drawn on a CTkCanvasContainer.
+    For detailed information check out the documentation.
+    """
+
+    _clickable: bool = True
+    _takes_focus: bool = True
+
+    def __init__(self,
+                 master: CTkCanvasContainer,
+                 width: int = 140,
+                 height: int = 28,
+                 corner_radius: Optional[int] = None,
+                 border_width: Optional[int] = None,
+
+                 fg_color: Optional[Union[str, Tuple[str, str]]] = None,
+                 hover_color: Optional[Union[str, Tuple[str, str]]] = None,
+                 border_color: Optional[Union[str, Tuple[str, str]]] = None,
+                 text_color: Optional[Union[str, Tuple[str, str]]] = None,
+                 text_color_disabled: Optional[Union[str, Tuple[str, str]]] = None,
+
+                 text: str = "CTkCanvasButton",
+                 font: Optional[Union[tuple, CTkFont]] = None,
+                 state: str = tkinter.NORMAL,
+                 hover: bool = True,
+                 command: Union[Callable[[], None], None] = None,
+                 anchor: str = "center"):
+
+        # transfer basic functionality (size, font, state, scaling) to CTkCanvasItem
+        super().__init__(master=master, width=width, height=height, font=font, state=state)
+
+        # color
+        self._fg_color = ThemeManager.theme["CTkButton"]["fg_color"] if fg_color is None else self._check_color_type(fg_color, transparency=True)
+        self._hover_color = ThemeManager.theme["CTkButton"]["hover_color"] if hover_color is None else self._check_color_type(hover_color)
+        self._border_color = ThemeManager.theme["CTkButton"]["border_color"] if border_color is None else self._check_color_type(border_color)
+        self._text_color = ThemeManager.theme["CTkButton"]["text_color"] if text_color is None else self._check_color_type(text_color)
+        self._text_color_disabled = ThemeManager.theme["CTkButton"]["text_color_disabled"] if text_color_disabled is None else self._check_color_type(text_color_disabled)
+
+        # shape
+        self._corner_radius = ThemeManager.theme["CTkButton"]["corner_radius"] if corner_radius is None else corner_radius
+        self._border_width = ThemeManager.theme["CTkButton"]["border_width"] if border_width is None else border_width
+
+        # text, command and hover
+        self._text = text
+        self._anchor = anchor
+        self._command = command
+        self._hover = hover
+        self._canvas_text = CanvasText(self._group)
+
+    def _draw(self, no_color_updates: bool = False):
+        if not self._placed:
+            return
+
+        width, height = self._apply_widget_scaling(self._desired_width), self._apply_widget_scaling(self._desired_height)
+        requires_recoloring = self._draw_engine.draw_rounded_rect_with_border(width, height,
+                                                                              self._apply_widget_scaling(self._corner_radius),
+                                                                              self._apply_widget_scaling(self._border_width))
+
+        if not self._canvas_text.exists():
+            self._canvas_text.configure(text=self._text, justify=tkinter.CENTER, font=self._apply_font_scaling())
+            requires_recoloring = True
+        elif requires_recoloring:
+            self._group.tag_raise("text_item")  # draw engine created new shapes on top of the text
+
+        if no_color_updates is False or requires_recoloring:
+            self._group.itemconfig("border_parts",
+                                   fill=self._apply_appearance_mode(self._border_color),
+                                   outline=self._apply_appearance_mode(self._border_color))
+            self._group.itemconfig("inner_parts",
+                                   fill=self._apply_appearance_mode(self._get_inner_color()),
+                                   outline=self._apply_appearance_mode(self._get_inner_color()))
+
+            if self._state == tkinter.DISABLED:
+                self._canvas_text.configure(fill=self._apply_appearance_mode(self._text_color_disabled))
+            else:
+                self._canvas_text.configure(fill=self._apply_appearance_mode(self._text_color))
+
+        # same minimum padding as the outer rows and columns of the CTkButton grid
+        text_size = self._canvas_text.get_size(self._get_font(), self._get_widget_scaling())
+        padding_x = self._apply_widget_scaling(max(self._corner_radius, self._border_width + 1))
+        padding_y = self._apply_widget_scaling(self._border_width + 1)
+        _, text_position, _ = CanvasText.layout(text_size, None, "center", self._anchor, width, height, padding_x, padding_y, 0)
+        self._canvas_text.place(*text_position)
+
+    def _get_inner_color(self) -> Union[str, Tuple[str, str]]:
+        if self._hover_state and self._hover and self._state != tkinter.DISABLED:
+            return self._hover_color
+        elif self._fg_color == "transparent":
+            return self._get_bg_color()
+        else:
+            return self._fg_color
+
+    def _on_enter(self):
+        super()._on_enter()
+        if self._hover and self._state != tkinter.DISABLED:
+            self._group.itemconfig("inner_parts",
+                                   fill=self._apply_appearance_mode(self._get_inner_color()),
+                                   outline=self._apply_appearance_mode(self._get_inner_color()))
+
+    def _on_leave(self):
+        super()._on_leave()
+        self._group.itemconfig("inner_parts",
+                               fill=self._apply_appearance_mode(self._get_inner_color()),
+                               outline=self._apply_appearance_mode(self._get_inner_color()))
+
+    def _clicked(self):
+        if self._state != tkinter.DISABLED and self._command is not None:
+            self._command()
+
+    def invoke(self):
+        """ calls command function if button is not disabled """
+        if self._state != tkinter.DISABLED and self._command is not None:
+            return self._command()
+
+    def configure(self, require_redraw=False, **kwargs):
+        if "corner_radius" in kwargs:
+            self._corner_radius = kwargs.pop("corner_radius")
+            require_redraw = True
+
+        if "border_width" in kwargs:
+            self._border_width = kwargs.pop("border_width")
+            require_redraw = True
+
+        if "fg_color" in kwargs:
+            self._fg_color = self._check_color_type(kwargs.pop("fg_color"), transparency=True)
+            require_redraw = True
+
+        if "hover_color" in kwargs:
+            self._hover_color = self._check_color_type(kwargs.pop("hover_color"))
+            require_redraw = True
+
+        if "border_color" in kwargs:
+            self._border_color = self._check_color_type(kwargs.pop("border_color"))
+            require_redraw = True
+
+        if "text_color" in kwargs:
+            self._text_color = self._check_color_type(kwargs.pop("text_color"))
+            require_redraw = True
+
+        if "text_color_disabled" in kwargs:
+            self._text_color_disabled = self._check_color_type(kwargs.pop("text_color_disabled"))
+            require_redraw = True
+
+        if "text" in kwargs:
+            self._text = kwargs.pop("text")
+            if self._canvas_text.exists():
+                self._canvas_text.configure(text=self._text)
+            require_redraw = True
+
+        if "anchor" in kwargs:
+            self._anchor = kwargs.pop("anchor")
+            require_redraw = True
+
+        if "hover" in kwargs:
+            self._hover = kwargs.pop("hover")
+
+        if "command" in kwargs:
+            self._command = kwargs.pop("command")
+
+        super().configure(require_redraw=require_redraw, **kwargs)
+
+    def cget(self, attribute_name: str) -> any:
+        if attribute_name == "corner_radius":
+            return self._corner_radius
+        elif attribute_name == "border_width":
+            return self._border_width
+
+        elif attribute_name == "fg_color":
+            return self._fg_color
+        elif attribute_name == "hover_color":
+            return self._hover_color
+        elif attribute_name == "border_color":
+            return self._border_color
+        elif attribute_name == "text_color":
+            return self._text_color
+        elif attribute_name == "text_color_disabled":
+            return self._text_color_disabled
+
+        elif attribute_name == "text":
+            return self._text
+        elif attribute_name == "anchor":
+            return self._anchor
+        elif attribute_name == "hover":
+            return self._hover
+        elif attribute_name == "command":
+            return self._command
+        else:
+            return super().cget(attribute_name)
@@ -0,0 +1,210 @@
+import tkinter
+from typing import Union, Tuple, Callable, Optional
+
+from ..core_rendering import DrawEngine
+from ..core_rendering import CanvasText
+from ..core_rendering.canvas_item_group import CanvasItemGroup
+from ..ctk_canvas_container import CTkCanvasContainer
+from ..font import CTkFont
+from ..utility import check_kwargs_empty
+
+
+class CTkCanvasItem:
+    """
+    Base class of the lightweight widgets of a CTkCanvasContainer, handles position, size, state, font,
+    scaling and appearance mode through the container. Lightweight widgets have no Tk window, their shapes
+    are drawn by a DrawEngine into a CanvasItemGroup on the canvas of the container. They are shown with
+    .place(x, y) (unscaled coordinates relative to the container) and hidden with .place_forget().
+    """
+
+    _clickable: bool = False  # container calls _clicked() and shows hand cursor
+    _takes_focus: bool = False  # container moves keyboard focus to the widget
+
+    _item_counter: int = 0  # used for unique group tags
+
+    def __init__(self,
+                 master: CTkCanvasContainer,
+                 width: int = 0,
+                 height: int = 0,
+                 font: Optional[Union[tuple, CTkFont]] = None,
+                 state: str = tkinter.NORMAL):
+
+        if not isinstance(master, CTkCanvasContainer):
+            raise ValueError(f"{type(self).__name__} can only be placed on a CTkCanvasContainer, not on {type(master).__name__}")
+
+        self._container = master
+        self._canvas = master._canvas
+        CTkCanvasItem._item_counter += 1
+        self._group = CanvasItemGroup(self._canvas, f"ctk_canvas_item_{CTkCanvasItem._item_counter}")
+        self._draw_engine = DrawEngine(self._group)
+        self._canvas_text: Union[CanvasText, None] = None
+
+        # dimensions and position independent of scaling
+        self._desired_width = width
+        self._desired_height = height
+        self._x: float = 0
+        self._y: float = 0
+        self._placed: bool = False
+
+        self._state = state
+        self._hover_state: bool = False
+
+        # font, None means font of the container
+        self._font = None if font is None else master._check_font_type(font)
+        if isinstance(self._font, CTkFont):
+            self._font.add_size_configure_callback(self._update_font)
+
+        master._add_item(self)
+
+    def destroy(self):
+        self.place_forget()
+        if isinstance(self._font, CTkFont):
+            self._font.remove_size_configure_callback(self._update_font)
+        self._container._release_font_scaling(font_slot=self)
+        self._container._remove_item(self)
+
+    def place(self, x: float = 0, y: float = 0):
+        """ show widget at position x, y (unscaled, relative to the container) """
+        self._x, self._y = x, y
+        self._group.move_to(*self._get_group_origin())
+        if not self._placed:
+            self._placed = True
+            self._draw()
+        self._container._update_focus_ring()
+
+    def place_forget(self):
+        if self._placed:
+            self._placed = False
+            self._group.delete_all()
+            if self._canvas_text is not None:
+                self._canvas_text.delete()
+            self._container._remove_item_state(self)
+
+    def place_info(self) -> dict:
+        return {"x": self._x, "y": self._y} if self._placed else {}
+
+    def winfo_ismapped(self) -> bool:
+        return self._placed
+
+    def focus_set(self):
+        if self._takes_focus:
+            self._container._set_focus_item(self)
+
+    def bind(self, sequence: str = None, command: Callable = None, add: str = None) -> str:
+        """ called on all canvas items of the widget """
+        return self._canvas.tag_bind(self._group.tag, sequence, command, add)
+
+    def unbind(self, sequence: str, funcid: str = None):
+        """ called on all canvas items of the widget """
+        self._canvas.tag_unbind(self._group.tag, sequence, funcid)
+
+    def _apply_widget_scaling(self, value: Union[int, float]) -> float:
+        return self._container._apply_widget_scaling(value)
+
+    def _get_widget_scaling(self) -> float:
+        return self._container._get_widget_scaling()
+
+    def _apply_appearance_mode(self, color: Union[str, Tuple[str, str]]) -> str:
+        return self._container._apply_appearance_mode(color)
+
+    def _check_color_type(self, color: any, transparency: bool = False) -> Union[str, Tuple[str, str]]:
+        return self._container._check_color_type(color, transparency=transparency)
+
+    def _get_font(self) -> Union[tuple, CTkFont]:
+        return self._container._font if self._font is None else self._font
+
+    def _apply_font_scaling(self) -> Union[tuple, str]:
+        return self._container._apply_font_scaling(self._get_font(), font_slot=self)
+
+    def _get_bg_color(self) -> Union[str, Tuple[str, str]]:
+        return self._container._get_item_bg_color()
+
+    def _get_size(self) -> Tuple[float, float]:
+        """ returns current unscaled size, can be overridden if the size depends on the content """
+        return self._desired_width, self._desired_height
+
+    def _get_scaled_bounds(self) -> Tuple[float, float, float, float]:
+        """ returns x, y, width, height on the canvas """
+        width, height = self._get_size()
+        return (self._apply_widget_scaling(self._x), self._apply_widget_scaling(self._y),
+                self._apply_widget_scaling(width), self._apply_widget_scaling(height))
+
+    def _get_group_origin(self) -> Tuple[float, float]:
+        """ returns position of the canvas item group, which is the origin of the DrawEngine shapes """
+        return self._apply_widget_scaling(self._x), self._apply_widget_scaling(self._y)
+
+    def _contains(self, x: float, y: float) -> bool:
+        if not self._placed:
+            return False
+        item_x, item_y, width, height = self._get_scaled_bounds()
+        return item_x <= x < item_x + width and item_y <= y < item_y + height
+
+    def _set_scaling(self):
+        if self._canvas_text is not None and self._canvas_text.exists():
+            self._canvas_text.configure(font=self._apply_font_scaling())
+        self._group.move_to(*self._get_group_origin())
+        self._draw(no_color_updates=True)
+
+    def _update_font(self):
+        if self._canvas_text is not None and self._canvas_text.exists():
+            self._canvas_text.configure(font=self._apply_font_scaling())
+        self._draw(no_color_updates=True)
+
+    def _draw(self, no_color_updates: bool = False):
+        """ has to be overridden, must only draw if widget is placed """
+        pass
+
+    def _on_enter(self):
+        self._hover_state = True
+
+    def _on_leave(self):
+        self._hover_state = False
+
+    def _clicked(self):
+        """ called by the container on click or space/Return key if the widget is clickable """
+        pass
+
+    def configure(self, require_redraw=False, **kwargs):
+        """ basic configure with width, height, font and state support, redraws in the end """
+        if "width" in kwargs:
+            self._desired_width = kwargs.pop("width")
+            require_redraw = True
+
+        if "height" in kwargs:
+            self._desired_height = kwargs.pop("height")
+            self._group.move_to(*self._get_group_origin())
+            require_redraw = True
+
+        if "font" in kwargs:
+            if isinstance(self._font, CTkFont):
+                self._font.remove_size_configure_callback(self._update_font)
+            font = kwargs.pop("font")
+            self._font = None if font is None else self._container._check_font_type(font)
+            if isinstance(self._font, CTkFont):
+                self._font.add_size_configure_callback(self._update_font)
+            self._update_font()
+
+        if "state" in kwargs:
+            self._state = kwargs.pop("state")
+            self._container._update_item_state(self)
+            require_redraw = True
+
+        # if there are still items in the kwargs dict, raise ValueError
+        check_kwargs_empty(kwargs, raise_error=True)
+
+        if require_redraw:
+            self._draw()
+            self._container._update_focus_ring()
+
+    def cget(self, attribute_name: str) -> any:
+        """ basic cget with width, height, font and state support """
+        if attribute_name == "width":
+            return self._desired_width
+        elif attribute_name == "height":
+            return self._desired_height
+        elif attribute_name == "font":
+            return self._font
+        elif attribute_name == "state":
+            return self._state
+        else:
+            raise ValueError(f"'{attribute_name}' is not a supported argument. Look at the documentation for supported arguments.")
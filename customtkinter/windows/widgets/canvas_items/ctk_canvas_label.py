@@ -0,0 +1,151 @@
+import tkinter
+from typing import Union, Tuple, Optional
+
+from ..core_rendering import CanvasText
+from ..ctk_canvas_container import CTkCanvasContainer
+from ..theme import ThemeManager
+from ..font import CTkFont
+from .ctk_canvas_item import CTkCanvasItem
+
+
+class CTkCanvasLabel(CTkCanvasItem):
+    """
+    Lightweight label with rounded corners, drawn on a CTkCanvasContainer. Default is fg_color=None (transparent fg_color).
+    With width=0 the label is as wide as its text.
+    For detailed information check out the documentation.
+    """
+
+    def __init__(self,
+                 master: CTkCanvasContainer,
+                 width: int = 0,
+                 height: int = 28,
+                 corner_radius: Optional[int] = None,
+
+                 fg_color: Optional[Union[str, Tuple[str, str]]] = None,
+                 text_color: Optional[Union[str, Tuple[str, str]]] = None,
+
+                 text: str = "CTkCanvasLabel",
+                 font: Optional[Union[tuple, CTkFont]] = None,
+                 anchor: str = "center",
+                 wraplength: int = 0,
+                 justify: str = tkinter.CENTER):
+
+        # transfer basic functionality (size, font, scaling) to CTkCanvasItem
+        super().__init__(master=master, width=width, height=height, font=font)
+
+        # color
+        self._fg_color = ThemeManager.theme["CTkLabel"]["fg_color"] if fg_color is None else self._check_color_type(fg_color, transparency=True)
+        self._text_color = ThemeManager.theme["CTkLabel"]["text_color"] if text_color is None else self._check_color_type(text_color)
+
+        # shape
+        self._corner_radius = ThemeManager.theme["CTkLabel"]["corner_radius"] if corner_radius is None else corner_radius
+
+        # text
+        self._text = text
+        self._anchor = anchor
+        self._wraplength = wraplength
+        self._justify = justify
+        self._canvas_text = CanvasText(self._group)
+
+    def _get_padding_x(self) -> float:
+        """ same padding as the grid of the CTkLabel """
+        return min(self._corner_radius, round(self._desired_height / 2))
+
+    def _get_size(self) -> Tuple[float, float]:
+        if not self._canvas_text.exists():
+            return self._desired_width, self._desired_height
+
+        # label grows to fit its text like the CTkLabel grid
+        text_width, text_height = self._canvas_text.get_size(self._get_font(), self._get_widget_scaling())
+        scaling = self._get_widget_scaling()
+        return (max(self._desired_width, text_width / scaling + 2 * self._get_padding_x()),
+                max(self._desired_height, text_height / scaling))
+
+    def _set_scaling(self):
+        if self._canvas_text.exists():
+            self._canvas_text.configure(width=self._apply_widget_scaling(self._wraplength))
+        super()._set_scaling()
+
+    def _draw(self, no_color_updates: bool = False):
+        if not self._placed:
+            return
+
+        requires_recoloring = False
+        if not self._canvas_text.exists():
+            self._canvas_text.configure(text=self._text, font=self._apply_font_scaling(), justify=self._justify,
+                                        width=self._apply_widget_scaling(self._wraplength))
+            requires_recoloring = True
+
+        width, height = self._get_size()
+        width, height = self._apply_widget_scaling(width), self._apply_widget_scaling(height)
+        if self._draw_engine.draw_rounded_rect_with_border(width, height, self._apply_widget_scaling(self._corner_radius), 0):
+            self._group.tag_raise("text_item")  # draw engine created new shapes on top of the text
+            requires_recoloring = True
+
+        if no_color_updates is False or requires_recoloring:
+            inner_color = self._get_bg_color() if self._fg_color == "transparent" else self._fg_color
+            self._group.itemconfig("inner_parts",
+                                   fill=self._apply_appearance_mode(inner_color),
+                                   outline=self._apply_appearance_mode(inner_color))
+            self._canvas_text.configure(fill=self._apply_appearance_mode(self._text_color))
+
+        text_size = self._canvas_text.get_size(self._get_font(), self._get_widget_scaling())
+        _, text_position, _ = CanvasText.layout(text_size, None, "center", self._anchor, width, height,
+                                                self._apply_widget_scaling(self._get_padding_x()), 0, 0)
+        self._canvas_text.place(*text_position)
+
+    def configure(self, require_redraw=False, **kwargs):
+        if "corner_radius" in kwargs:
+            self._corner_radius = kwargs.pop("corner_radius")
+            require_redraw = True
+
+        if "fg_color" in kwargs:
+            self._fg_color = self._check_color_type(kwargs.pop("fg_color"), transparency=True)
+            require_redraw = True
+
+        if "text_color" in kwargs:
+            self._text_color = self._check_color_type(kwargs.pop("text_color"))
+            require_redraw = True
+
+        if "text" in kwargs:
+            self._text = kwargs.pop("text")
+            if self._canvas_text.exists():
+                self._canvas_text.configure(text=self._text)
+            require_redraw = True
+
+        if "anchor" in kwargs:
+            self._anchor = kwargs.pop("anchor")
+            require_redraw = True
+
+        if "wraplength" in kwargs:
+            self._wraplength = kwargs.pop("wraplength")
+            if self._canvas_text.exists():
+                self._canvas_text.configure(width=self._apply_widget_scaling(self._wraplength))
+            require_redraw = True
+
+        if "justify" in kwargs:
+            self._justify = kwargs.pop("justify")
+            if self._canvas_text.exists():
+                self._canvas_text.configure(justify=self._justify)
+
+        super().configure(require_redraw=require_redraw, **kwargs)
+
+    def cget(self, attribute_name: str) -> any:
+        if attribute_name == "corner_radius":
+            return self._corner_radius
+
+        elif attribute_name == "fg_color":
+            return self._fg_color
+        elif attribute_name == "text_color":
+            return self._text_color
+
+        elif attribute_name == "text":
+            return self._text
+        elif attribute_name == "anchor":
+            return self._anchor
+        elif attribute_name == "wraplength":
+            return self._wraplength
+        elif attribute_name == "justify":
+            return self._justify
+        else:
+            return super().cget(attribute_name)
@@ -0,0 +1,174 @@
+import tkinter
+from typing import Union, Tuple, Optional
+
+from ..ctk_canvas_container import CTkCanvasContainer
+from ..theme import ThemeManager
+from .ctk_canvas_item import CTkCanvasItem
+
+
+class CTkCanvasProgressBar(CTkCanvasItem):
+    """
+    Lightweight determinate progressbar with rounded corners, border and variable support,
+    drawn on a CTkCanvasContainer. Can be horizontal or vertical.
+    For detailed information check out the documentation.
+    """
+
+    def __init__(self,
+                 master: CTkCanvasContainer,
+                 width: Optional[int] = None,
+                 height: Optional[int] = None,
+                 corner_radius: Optional[int] = None,
+                 border_width: Optional[int] = None,
+
+                 fg_color: Optional[Union[str, Tuple[str, str]]] = None,
+                 border_color: Optional[Union[str, Tuple[str, str]]] = None,
+                 progress_color: Optional[Union[str, Tuple[str, str]]] = None,
+
+                 variable: Union[tkinter.Variable, None] = None,
+                 orientation: str = "horizontal"):
+
+        # set default dimensions according to orientation
+        if width is None:
+            width = 8 if orientation.lower() == "vertical" else 200
+        if height is None:
+            height = 200 if orientation.lower() == "vertical" else 8
+
+        # transfer basic functionality (size, scaling) to CTkCanvasItem
+        super().__init__(master=master, width=width, height=height)
+
+        # color
+        self._border_color = ThemeManager.theme["CTkProgressBar"]["border_color"] if border_color is None else self._check_color_type(border_color)
+        self._fg_color = ThemeManager.theme["CTkProgressBar"]["fg_color"] if fg_color is None else self._check_color_type(fg_color)
+        self._progress_color = ThemeManager.theme["CTkProgressBar"]["progress_color"] if progress_color is None else self._check_color_type(progress_color)
+
+        # shape
+        self._corner_radius = ThemeManager.theme["CTkProgressBar"]["corner_radius"] if corner_radius is None else corner_radius
+        self._border_width = ThemeManager.theme["CTkProgressBar"]["border_width"] if border_width is None else border_width
+
+        # control variable
+        self._variable = variable
+        self._variable_callback_blocked = False
+        self._variable_callback_name = None
+        self._loop_value: float = 0.5
+        self._orientation = orientation
+
+        if self._variable is not None:
+            self._variable_callback_name = self._variable.trace_add("write", self._variable_callback)
+            self._variable_callback_blocked = True
+            self.set(self._variable.get(), from_variable_callback=True)
+            self._variable_callback_blocked = False
+
+    def destroy(self):
+        if self._variable is not None and self._variable_callback_name is not None:
+            self._variable.trace_remove("write", self._variable_callback_name)
+        super().destroy()
+
+    def _draw(self, no_color_updates: bool = False):
+        if not self._placed:
+            return
+
+        if self._orientation.lower() == "horizontal":
+            orientation = "w"
+        elif self._orientation.lower() == "vertical":
+            orientation = "s"
+        else:
+            orientation = "w"
+
+        requires_recoloring = self._draw_engine.draw_rounded_progress_bar_with_border(self._apply_widget_scaling(self._desired_width),
+                                                                                      self._apply_widget_scaling(self._desired_height),
+                                                                                      self._apply_widget_scaling(self._corner_radius),
+                                                                                      self._apply_widget_scaling(self._border_width),
+                                                                                      0,
+                                                                                      self._loop_value,
+                                                                                      orientation)
+
+        if no_color_updates is False or requires_recoloring:
+            self._group.itemconfig("border_parts",
+                                   fill=self._apply_appearance_mode(self._border_color),
+                                   outline=self._apply_appearance_mode(self._border_color))
+            self._group.itemconfig("inner_parts",
+                                   fill=self._apply_appearance_mode(self._fg_color),
+                                   outline=self._apply_appearance_mode(self._fg_color))
+            self._group.itemconfig("progress_parts",
+                                   fill=self._apply_appearance_mode(self._progress_color),
+                                   outline=self._apply_appearance_mode(self._progress_color))
+
+    def _variable_callback(self, var_name, index, mode):
+        if not self._variable_callback_blocked:
+            self.set(self._variable.get(), from_variable_callback=True)
+
+    def set(self, value, from_variable_callback=False):
+        """ set determinate value """
+        self._loop_value = value
+
+        if self._loop_value > 1:
+            self._loop_value = 1
+        elif self._loop_value < 0:
+            self._loop_value = 0
+
+        self._draw(no_color_updates=True)
+
+        if self._variable is not None and not from_variable_callback:
+            self._variable_callback_blocked = True
+            self._variable.set(round(self._loop_value) if isinstance(self._variable, tkinter.IntVar) else self._loop_value)
+            self._variable_callback_blocked = False
+
+    def get(self) -> float:
+        """ get determinate value """
+        return self._loop_value
+
+    def configure(self, require_redraw=False, **kwargs):
+        if "corner_radius" in kwargs:
+            self._corner_radius = kwargs.pop("corner_radius")
+            require_redraw = True
+
+        if "border_width" in kwargs:
+            self._border_width = kwargs.pop("border_width")
+            require_redraw = True
+
+        if "fg_color" in kwargs:
+            self._fg_color = self._check_color_type(kwargs.pop("fg_color"))
+            require_redraw = True
+
+        if "border_color" in kwargs:
+            self._border_color = self._check_color_type(kwargs.pop("border_color"))
+            require_redraw = True
+
+        if "progress_color" in kwargs:
+            self._progress_color = self._check_color_type(kwargs.pop("progress_color"))
+            require_redraw = True
+
+        if "variable" in kwargs:
+            if self._variable is not None and self._variable_callback_name is not None:
+                self._variable.trace_remove("write", self._variable_callback_name)
+                self._variable_callback_name = None
+
+            self._variable = kwargs.pop("variable")
+
+            if self._variable is not None and self._variable != "":
+                self._variable_callback_name = self._variable.trace_add("write", self._variable_callback)
+                self.set(self._variable.get(), from_variable_callback=True)
+            else:
+                self._variable = None
+
+        super().configure(require_redraw=require_redraw, **kwargs)
+
+    def cget(self, attribute_name: str) -> any:
+        if attribute_name == "corner_radius":
+            return self._corner_radius
+        elif attribute_name == "border_width":
+            return self._border_width
+
+        elif attribute_name == "fg_color":
+            return self._fg_color
+        elif attribute_name == "border_color":
+            return self._border_color
+        elif attribute_name == "progress_color":
+            return self._progress_color
+
+        elif attribute_name == "variable":
+            return self._variable
+        elif attribute_name == "orientation":
+            return self._orientation
+        else:
+            return super().cget(attribute_name)
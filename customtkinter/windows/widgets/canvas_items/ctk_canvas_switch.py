@@ -0,0 +1,326 @@
+import tkinter
+from typing import Union, Tuple, Callable, Optional
+
+from ..core_rendering import CanvasText
+from ..ctk_canvas_container import CTkCanvasContainer
+from ..theme import ThemeManager
+from ..font import CTkFont
+from .ctk_canvas_item import CTkCanvasItem
+
+
+class CTkCanvasSwitch(CTkCanvasItem):
+    """
+    Lightweight switch with rounded corners, border, variable support, hover effect and command,
+    drawn on a CTkCanvasContainer.
+    For detailed information check out the documentation.
+    """
+
+    _clickable: bool = True
+    _takes_focus: bool = True
+
+    def __init__(self,
+                 master: CTkCanvasContainer,
+                 width: int = 100,
+                 height: int = 24,
+                 switch_width: int = 36,
+                 switch_height: int = 18,
+                 corner_radius: Optional[int] = None,
+                 border_width: Optional[int] = None,
+                 button_length: Optional[int] = None,
+
+                 fg_color: Optional[Union[str, Tuple[str, str]]] = None,
+                 border_color: Union[str, Tuple[str, str]] = "transparent",
+                 progress_color: Optional[Union[str, Tuple[str, str]]] = None,
+                 button_color: Optional[Union[str, Tuple[str, str]]] = None,
+                 button_hover_color: Optional[Union[str, Tuple[str, str]]] = None,
+                 text_color: Optional[Union[str, Tuple[str, str]]] = None,
+                 text_color_disabled: Optional[Union[str, Tuple[str, str]]] = None,
+
+                 text: str = "CTkCanvasSwitch",
+                 font: Optional[Union[tuple, CTkFont]] = None,
+                 state: str = tkinter.NORMAL,
+                 hover: bool = True,
+                 command: Union[Callable[[], None], None] = None,
+                 onvalue: Union[int, str] = 1,
+                 offvalue: Union[int, str] = 0,
+                 variable: Union[tkinter.Variable, None] = None):
+
+        # transfer basic functionality (size, font, state, scaling) to CTkCanvasItem
+        super().__init__(master=master, width=width, height=height, font=font, state=state)
+
+        # dimensions
+        self._switch_width = switch_width
+        self._switch_height = switch_height
+
+        # color
+        self._border_color = self._check_color_type(border_color, transparency=True)
+        self._fg_color = ThemeManager.theme["CTkSwitch"]["fg_Color"] if fg_color is None else self._check_color_type(fg_color)
+        self._progress_color = ThemeManager.theme["CTkSwitch"]["progress_color"] if progress_color is None else self._check_color_type(progress_color, transparency=True)
+        self._button_color = ThemeManager.theme["CTkSwitch"]["button_color"] if button_color is None else self._check_color_type(button_color)
+        self._button_hover_color = ThemeManager.theme["CTkSwitch"]["button_hover_color"] if button_hover_color is None else self._check_color_type(button_hover_color)
+        self._text_color = ThemeManager.theme["CTkSwitch"]["text_color"] if text_color is None else self._check_color_type(text_color)
+        self._text_color_disabled = ThemeManager.theme["CTkSwitch"]["text_color_disabled"] if text_color_disabled is None else self._check_color_type(text_color_disabled)
+
+        # shape
+        self._corner_radius = ThemeManager.theme["CTkSwitch"]["corner_radius"] if corner_radius is None else corner_radius
+        self._border_width = ThemeManager.theme["CTkSwitch"]["border_width"] if border_width is None else border_width
+        self._button_length = ThemeManager.theme["CTkSwitch"]["button_length"] if button_length is None else button_length
+
+        # text
+        self._text = text
+        self._canvas_text = CanvasText(self._group)
+
+        # callback and hover functionality
+        self._command = command
+        self._hover = hover
+        self._check_state: bool = False  # True if switch is activated
+
+        self._onvalue = onvalue
+        self._offvalue = offvalue
+        self._variable: tkinter.Variable = variable
+        self._variable_callback_blocked = False
+        self._variable_callback_name = None
+
+        if self._variable is not None and self._variable != "":
+            self._variable_callback_name = self._variable.trace_add("write", self._variable_callback)
+            self._check_state = True if self._variable.get() == self._onvalue else False
+
+    def destroy(self):
+        if self._variable is not None and self._variable_callback_name is not None:
+            self._variable.trace_remove("write", self._variable_callback_name)
+        super().destroy()
+
+    def _get_group_origin(self) -> Tuple[float, float]:
+        # switch is centered vertically like in the CTkSwitch grid
+        return (self._apply_widget_scaling(self._x),
+                self._apply_widget_scaling(self._y + (self._get_size()[1] - self._switch_height) / 2))
+
+    def _get_size(self) -> Tuple[float, float]:
+        text_width, text_height = self._canvas_text.get_size(self._get_font(), self._get_widget_scaling())
+        scaling = self._get_widget_scaling()
+        return (max(self._desired_width, self._switch_width + 6 + text_width / scaling),
+                max(self._desired_height, self._switch_height, text_height / scaling))
+
+    def _draw(self, no_color_updates: bool = False):
+        if not self._placed:
+            return
+
+        requires_recoloring = self._draw_engine.draw_rounded_slider_with_border_and_button(self._apply_widget_scaling(self._switch_width),
+                                                                                           self._apply_widget_scaling(self._switch_height),
+                                                                                           self._apply_widget_scaling(self._corner_radius),
+                                                                                           self._apply_widget_scaling(self._border_width),
+                                                                                           self._apply_widget_scaling(self._button_length),
+                                                                                           self._apply_widget_scaling(self._corner_radius),
+                                                                                           1 if self._check_state is True else 0, "w")
+
+        if not self._canvas_text.exists():
+            self._canvas_text.configure(text=self._text, justify=tkinter.LEFT, font=self._apply_font_scaling())
+            requires_recoloring = True
+
+        if no_color_updates is False or requires_recoloring:
+            border_color = self._get_bg_color() if self._border_color == "transparent" else self._border_color
+            self._group.itemconfig("border_parts", fill=self._apply_appearance_mode(border_color),
+                                   outline=self._apply_appearance_mode(border_color))
+            self._group.itemconfig("inner_parts", fill=self._apply_appearance_mode(self._fg_color),
+                                   outline=self._apply_appearance_mode(self._fg_color))
+
+            progress_color = self._fg_color if self._progress_color == "transparent" else self._progress_color
+            self._group.itemconfig("progress_parts", fill=self._apply_appearance_mode(progress_color),
+                                   outline=self._apply_appearance_mode(progress_color))
+            self._update_button_color()
+
+            if self._state == tkinter.DISABLED:
+                self._canvas_text.configure(fill=self._apply_appearance_mode(self._text_color_disabled))
+            else:
+                self._canvas_text.configure(fill=self._apply_appearance_mode(self._text_color))
+
+        self._canvas_text.place(self._apply_widget_scaling(self._switch_width + 6),
+                                self._apply_widget_scaling(self._switch_height / 2), "w")
+        self._group.move_to(*self._get_group_origin())
+
+    def _update_button_color(self):
+        if self._hover_state and self._hover and self._state == tkinter.NORMAL:
+            button_color = self._button_hover_color
+        else:
+            button_color = self._button_color
+        self._group.itemconfig("slider_parts", fill=self._apply_appearance_mode(button_color),
+                               outline=self._apply_appearance_mode(button_color))
+
+    def _on_enter(self):
+        super()._on_enter()
+        if self._placed:
+            self._update_button_color()
+
+    def _on_leave(self):
+        super()._on_leave()
+        if self._placed:
+            self._update_button_color()
+
+    def _clicked(self):
+        self.toggle()
+
+    def _variable_callback(self, var_name, index, mode):
+        if not self._variable_callback_blocked:
+            if self._variable.get() == self._onvalue:
+                self.select(from_variable_callback=True)
+            elif self._variable.get() == self._offvalue:
+                self.deselect(from_variable_callback=True)
+
+    def toggle(self):
+        if self._state != tkinter.DISABLED:
+            self._check_state = not self._check_state
+            self._draw(no_color_updates=True)
+
+            if self._variable is not None:
+                self._variable_callback_blocked = True
+                self._variable.set(self._onvalue if self._check_state is True else self._offvalue)
+                self._variable_callback_blocked = False
+
+            if self._command is not None:
+                self._command()
+
+    def select(self, from_variable_callback=False):
+        if self._state != tkinter.DISABLED or from_variable_callback:
+            self._check_state = True
+            self._draw(no_color_updates=True)
+
+            if self._variable is not None and not from_variable_callback:
+                self._variable_callback_blocked = True
+                self._variable.set(self._onvalue)
+                self._variable_callback_blocked = False
+
+    def deselect(self, from_variable_callback=False):
+        if self._state != tkinter.DISABLED or from_variable_callback:
+            self._check_state = False
+            self._draw(no_color_updates=True)
+
+            if self._variable is not None and not from_variable_callback:
+                self._variable_callback_blocked = True
+                self._variable.set(self._offvalue)
+                self._variable_callback_blocked = False
+
+    def get(self) -> Union[int, str]:
+        return self._onvalue if self._check_state is True else self._offvalue
+
+    def configure(self, require_redraw=False, **kwargs):
+        if "corner_radius" in kwargs:
+            self._corner_radius = kwargs.pop("corner_radius")
+            require_redraw = True
+
+        if "border_width" in kwargs:
+            self._border_width = kwargs.pop("border_width")
+            require_redraw = True
+
+        if "button_length" in kwargs:
+            self._button_length = kwargs.pop("button_length")
+            require_redraw = True
+
+        if "switch_width" in kwargs:
+            self._switch_width = kwargs.pop("switch_width")
+            require_redraw = True
+
+        if "switch_height" in kwargs:
+            self._switch_height = kwargs.pop("switch_height")
+            require_redraw = True
+
+        if "fg_color" in kwargs:
+            self._fg_color = self._check_color_type(kwargs.pop("fg_color"))
+            require_redraw = True
+
+        if "border_color" in kwargs:
+            self._border_color = self._check_color_type(kwargs.pop("border_color"), transparency=True)
+            require_redraw = True
+
+        if "progress_color" in kwargs:
+            self._progress_color = self._check_color_type(kwargs.pop("progress_color"), transparency=True)
+            require_redraw = True
+
+        if "button_color" in kwargs:
+            self._button_color = self._check_color_type(kwargs.pop("button_color"))
+            require_redraw = True
+
+        if "button_hover_color" in kwargs:
+            self._button_hover_color = self._check_color_type(kwargs.pop("button_hover_color"))
+            require_redraw = True
+
+        if "text_color" in kwargs:
+            self._text_color = self._check_color_type(kwargs.pop("text_color"))
+            require_redraw = True
+
+        if "text_color_disabled" in kwargs:
+            self._text_color_disabled = self._check_color_type(kwargs.pop("text_color_disabled"))
+            require_redraw = True
+
+        if "text" in kwargs:
+            self._text = kwargs.pop("text")
+            if self._canvas_text.exists():
+                self._canvas_text.configure(text=self._text)
+            require_redraw = True
+
+        if "hover" in kwargs:
+            self._hover = kwargs.pop("hover")
+
+        if "command" in kwargs:
+            self._command = kwargs.pop("command")
+
+        if "onvalue" in kwargs:
+            self._onvalue = kwargs.pop("onvalue")
+
+        if "offvalue" in kwargs:
+            self._offvalue = kwargs.pop("offvalue")
+
+        if "variable" in kwargs:
+            if self._variable is not None and self._variable_callback_name is not None:
+                self._variable.trace_remove("write", self._variable_callback_name)
+                self._variable_callback_name = None
+
+            self._variable = kwargs.pop("variable")
+
+            if self._variable is not None and self._variable != "":
+                self._variable_callback_name = self._variable.trace_add("write", self._variable_callback)
+                self._check_state = True if self._variable.get() == self._onvalue else False
+                require_redraw = True
+
+        super().configure(require_redraw=require_redraw, **kwargs)
+
+    def cget(self, attribute_name: str) -> any:
+        if attribute_name == "corner_radius":
+            return self._corner_radius
+        elif attribute_name == "border_width":
+            return self._border_width
+        elif attribute_name == "button_length":
+            return self._button_length
+        elif attribute_name == "switch_width":
+            return self._switch_width
+        elif attribute_name == "switch_height":
+            return self._switch_height
+
+        elif attribute_name == "fg_color":
+            return self._fg_color
+        elif attribute_name == "border_color":
+            return self._border_color
+        elif attribute_name == "progress_color":
+            return self._progress_color
+        elif attribute_name == "button_color":
+            return self._button_color
+        elif attribute_name == "button_hover_color":
+            return self._button_hover_color
+        elif attribute_name == "text_color":
+            return self._text_color
+        elif attribute_name == "text_color_disabled":
+            return self._text_color_disabled
+
+        elif attribute_name == "text":
+            return self._text
+        elif attribute_name == "hover":
+            return self._hover
+        elif attribute_name == "command":
+            return self._command
+        elif attribute_name == "onvalue":
+            return self._onvalue
+        elif attribute_name == "offvalue":
+            return self._offvalue
+        elif attribute_name == "variable":
+            return self._variable
+        else:
+            return super().cget(attribute_name)
@@ -0,0 +1 @@
+from .color_manager import ColorManager
@@ -0,0 +1,129 @@
+import tkinter
+from typing import Union, Tuple, List, Dict
+
+
+class ColorManager:
+    """
+    Normalizes colors (hex strings or Tk color names) to packed RGB integers (0xRRGGBB) and provides
+    cached color operations. Tk color names are resolved once with winfo_rgb(), hex colors are parsed
+    without Tk. Results of blend, lighten, darken and alpha_over are cached by their arguments, so
+    derived colors (like automatic hover colors) cost no Tk round trip after the first calculation.
+
+    All operations accept single colors or (light_color, dark_color) tuples, tuple colors are processed per
+    appearance mode and a tuple is returned.
+    """
+
+    _rgb_cache: Dict[str, int] = {}  # color string -> packed RGB
+    _derived_cache: Dict[tuple, Union[str, Tuple[str, str]]] = {}  # (operation, arguments) -> derived color
+    _derived_cache_max_size: int = 4096
+
+    hover_darken_amount: float = 0.2
+    disabled_alpha: float = 0.5
+
+    @classmethod
+    def to_rgb(cls, color: str, widget: tkinter.Misc = None) -> int:
+        """ returns color as packed RGB integer, widget is needed to resolve Tk color names (default: tkinter default root) """
+        rgb = cls._rgb_cache.get(color)
+        if rgb is not None:
+            return rgb
+
+        if not isinstance(color, str) or color == "transparent":
+            raise ValueError(f"color {color} can not be converted to RGB, must be hex-color or color-name")
+
+        if color.startswith("#") and len(color) in (4, 7, 13):
+            digits = len(color) // 3  # digits per channel
+            try:
+                red, green, blue = (int(color[1 + i * digits:1 + (i + 1) * digits], 16) for i in range(3))
+            except ValueError:
+                raise ValueError(f"color {color} is not a valid hex-color")
+            if digits == 1:
+                red, green, blue = red * 17, green * 17, blue * 17
+            elif digits == 4:
+                red, green, blue = red >> 8, green >> 8, blue >> 8
+        else:
+            if widget is None:
+                widget = tkinter._default_root
+            if widget is None:
+                raise ValueError(f"color-name {color} can not be resolved without a tkinter root window")
+            try:
+                red, green, blue = (value >> 8 for value in widget.winfo_rgb(color))
+            except tkinter.TclError:
+                raise ValueError(f"color {color} is not a valid hex-color or color-name")
+
+        rgb = (red << 16) | (green << 8) | blue
+        cls._rgb_cache[color] = rgb
+        return rgb
+
+    @staticmethod
+    def to_hex(rgb: int) -> str:
+        """ returns packed RGB integer as hex-color string """
+        return f"#{rgb:06X}"
+
+    @classmethod
+    def blend(cls, color_1: Union[str, Tuple[str, str]], color_2: Union[str, Tuple[str, str]], factor: float,
+              widget: tkinter.Misc = None) -> Union[str, Tuple[str, str]]:
+        """ mix two colors, factor 0 returns color_1 and factor 1 returns color_2 """
+        return cls._derive("blend", color_1, color_2, factor, widget)
+
+    @classmethod
+    def lighten(cls, color: Union[str, Tuple[str, str]], amount: float, widget: tkinter.Misc = None) -> Union[str, Tuple[str, str]]:
+        """ blend color with white, amount between 0 and 1 """
+        return cls._derive("blend", color, "#FFFFFF", amount, widget)
+
+    @classmethod
+    def darken(cls, color: Union[str, Tuple[str, str]], amount: float, widget: tkinter.Misc = None) -> Union[str, Tuple[str, str]]:
+        """ blend color with black, amount between 0 and 1 """
+        return cls._derive("blend", color, "#000000", amount, widget)
+
+    @classmethod
+    def alpha_over(cls, color: Union[str, Tuple[str, str]], background_color: Union[str, Tuple[str, str]], alpha: float,
+                   widget: tkinter.Misc = None) -> Union[str, Tuple[str, str]]:
+        """ color drawn with opacity alpha over background_color """
+        return cls._derive("blend", background_color, color, alpha, widget)
+
+    @classmethod
+    def derive_hover_color(cls, fg_color: Union[str, Tuple[str, str]], widget: tkinter.Misc = None) -> Union[str, Tuple[str, str]]:
+        """ hover color derived from fg_color """
+        return cls.darken(fg_color, cls.hover_darken_amount, widget)
+
+    @classmethod
+    def derive_disabled_color(cls, color: Union[str, Tuple[str, str]], background_color: Union[str, Tuple[str, str]],
+                              widget: tkinter.Misc = None) -> Union[str, Tuple[str, str]]:
+        """ disabled color (for example text_color_disabled) derived from color faded into background_color """
+        return cls.alpha_over(color, background_color, cls.disabled_alpha, widget)
+
+    @classmethod
+    def clear_cache(cls):
+        cls._rgb_cache.clear()
+        cls._derived_cache.clear()
+
+    @classmethod
+    def _derive(cls, operation: str, color_1: Union[str, Tuple[str, str], List[str]], color_2: Union[str, Tuple[str, str], List[str]],
+                factor: float, widget: Union[tkinter.Misc, None]) -> Union[str, Tuple[str, str]]:
+        # tuple and list colors are handled the same, lists are not hashable
+        if isinstance(color_1, list):
+            color_1 = tuple(color_1)
+        if isinstance(color_2, list):
+            color_2 = tuple(color_2)
+
+        cache_key = (operation, color_1, color_2, factor)
+        derived_color = cls._derived_cache.get(cache_key)
+        if derived_color is not None:
+            return derived_color
+
+        if isinstance(color_1, tuple) or isinstance(color_2, tuple):
+            # process light and dark mode color separately
+            colors_1 = color_1 if isinstance(color_1, tuple) else (color_1, color_1)
+            colors_2 = color_2 if isinstance(color_2, tuple) else (color_2, color_2)
+            derived_color = (cls._derive(operation, colors_1[0], colors_2[0], factor, widget),
+                             cls._derive(operation, colors_1[1], colors_2[1], factor, widget))
+        else:
+            rgb_1, rgb_2 = cls.to_rgb(color_1, widget), cls.to_rgb(color_2, widget)
+            factor = min(max(factor, 0), 1)
+            derived_color = cls.to_hex(sum(round(((rgb_1 >> shift) & 0xFF) * (1 - factor) + ((rgb_2 >> shift) & 0xFF) * factor) << shift
+                                           for shift in (16, 8, 0)))
+
+        if len(cls._derived_cache) >= cls._derived_cache_max_size:
+            cls._derived_cache.clear()  # animations can create many distinct factors, keep memory bounded
+        cls._derived_cache[cache_key] = derived_color
+        return derived_color
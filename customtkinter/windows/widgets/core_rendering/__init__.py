@@ -2,6 +2,8 @@ import sys
 
 from .ctk_canvas import CTkCanvas
 from .draw_engine import DrawEngine
+from .canvas_text import CanvasText
+from .visual_states import VisualStates
 
 CTkCanvas.init_font_character_mapping()
 
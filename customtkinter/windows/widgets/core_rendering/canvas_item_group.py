@@ -0,0 +1,133 @@
+from __future__ import annotations
+from typing import Union, Tuple, Callable, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ..core_rendering import CTkCanvas
+
+
+class CanvasItemGroup:
+    """
+    Group of items on a shared CTkCanvas, which behaves like an own canvas for the DrawEngine and CanvasText.
+
+    All tags are prefixed with the group tag, so several groups can use the same tag names (like 'inner_parts')
+    on one canvas, and every item gets the group tag itself. Coordinates are relative to the group position,
+    which can be changed with move_to() without redrawing. tag_lower() without second argument only lowers
+    the items below the other items of the group, so the group stays above shapes drawn directly on the canvas.
+    """
+
+    def __init__(self, canvas: CTkCanvas, group_tag: str):
+        self._canvas = canvas
+        self._group_tag = group_tag
+        self._x: int = 0
+        self._y: int = 0
+
+    @property
+    def tag(self) -> str:
+        return self._group_tag
+
+    @property
+    def canvas(self) -> CTkCanvas:
+        return self._canvas
+
+    def move_to(self, x: float, y: float):
+        x, y = round(x), round(y)
+        if (x, y) != (self._x, self._y):
+            self._canvas.move(self._group_tag, x - self._x, y - self._y)
+            self._x, self._y = x, y
+
+    def delete_all(self):
+        self._canvas.delete(self._group_tag)
+
+    def _map_tag(self, tag_or_id: Union[str, int]) -> Union[str, int]:
+        return tag_or_id if isinstance(tag_or_id, int) else f"{self._group_tag}.{tag_or_id}"
+
+    def _map_tags(self, tags: Union[str, Tuple[str, ...]]) -> Tuple[str, ...]:
+        if isinstance(tags, str):
+            tags = (tags,) if tags != "" else ()
+        return tuple(self._map_tag(tag) for tag in tags) + (self._group_tag,)
+
+    def _offset_coords(self, coords: tuple) -> list:
+        if len(coords) == 1 and isinstance(coords[0], (tuple, list)):
+            coords = coords[0]
+        return [value + (self._x if index % 2 == 0 else self._y) for index, value in enumerate(coords)]
+
+    def _create(self, create_function: Callable, coords: tuple, kwargs: dict) -> int:
+        kwargs["tags"] = self._map_tags(kwargs.get("tags", ()))
+        return create_function(*self._offset_coords(coords), **kwargs)
+
+    def create_rectangle(self, *coords, **kwargs) -> int:
+        return self._create(self._canvas.create_rectangle, coords, kwargs)
+
+    def create_oval(self, *coords, **kwargs) -> int:
+        return self._create(self._canvas.create_oval, coords, kwargs)
+
+    def create_polygon(self, *coords, **kwargs) -> int:
+        return self._create(self._canvas.create_polygon, coords, kwargs)
+
+    def create_line(self, *coords, **kwargs) -> int:
+        return self._create(self._canvas.create_line, coords, kwargs)
+
+    def create_text(self, *coords, **kwargs) -> int:
+        return self._create(self._canvas.create_text, coords, kwargs)
+
+    def create_image(self, *coords, **kwargs) -> int:
+        return self._create(self._canvas.create_image, coords, kwargs)
+
+    def create_aa_circle(self, x_pos: int, y_pos: int, radius: int, angle: int = 0, fill: str = "white",
+                         tags: Union[str, Tuple[str, ...]] = "", anchor: str = "center") -> int:
+        return self._canvas.create_aa_circle(x_pos + self._x, y_pos + self._y, radius, angle=angle, fill=fill,
+                                             tags=self._map_tags(tags), anchor=anchor)
+
+    def coords(self, tag_or_id: Union[str, int], *args):
+        if len(args) == 0:
+            return [value - (self._x if index % 2 == 0 else self._y) for index, value in enumerate(self._canvas.coords(self._map_tag(tag_or_id)))]
+        elif len(args) == 3:  # x, y and radius of aa-circle
+            return self._canvas.coords(self._map_tag(tag_or_id), args[0] + self._x, args[1] + self._y, args[2])
+        else:
+            return self._canvas.coords(self._map_tag(tag_or_id), *self._offset_coords(args))
+
+    def itemconfig(self, tag_or_id: Union[str, int], *args, **kwargs):
+        return self._canvas.itemconfig(self._map_tag(tag_or_id), *args, **kwargs)
+
+    itemconfigure = itemconfig
+
+    def find_withtag(self, tag_or_id: Union[str, int]) -> tuple:
+        return self._canvas.find_withtag(self._map_tag(tag_or_id))
+
+    def gettags(self, tag_or_id: Union[str, int]) -> tuple:
+        prefix = self._group_tag + "."
+        return tuple(tag[len(prefix):] for tag in self._canvas.gettags(self._map_tag(tag_or_id)) if tag.startswith(prefix))
+
+    def delete(self, *tags_or_ids: Union[str, int]):
+        self._canvas.delete(*(self._map_tag(tag_or_id) for tag_or_id in tags_or_ids))
+
+    def bbox(self, *tags_or_ids: Union[str, int]) -> Union[Tuple[int, int, int, int], None]:
+        bbox = self._canvas.bbox(*(self._map_tag(tag_or_id) for tag_or_id in tags_or_ids))
+        if bbox is None:
+            return None
+        return bbox[0] - self._x, bbox[1] - self._y, bbox[2] - self._x, bbox[3] - self._y
+
+    def tag_raise(self, tag_or_id: Union[str, int], above_this: Union[str, int, None] = None):
+        if above_this is None:
+            self._canvas.tag_raise(self._map_tag(tag_or_id))
+        else:
+            self._canvas.tag_raise(self._map_tag(tag_or_id), self._map_tag(above_this))
+
+    def tag_lower(self, tag_or_id: Union[str, int], below_this: Union[str, int, None] = None):
+        if below_this is not None:
+            self._canvas.tag_lower(self._map_tag(tag_or_id), self._map_tag(below_this))
+            return
+
+        # lower below the lowest other item of the group instead of the whole canvas
+        lowered_items = set(self._canvas.find_withtag(self._map_tag(tag_or_id)))
+        if len(lowered_items) > 0:
+            for item in self._canvas.find_withtag(self._group_tag):
+                if item not in lowered_items:
+                    self._canvas.tag_lower(self._map_tag(tag_or_id), item)
+                    break
+
+    def tag_bind(self, tag_or_id: Union[str, int], sequence: str = None, command: Callable = None, add: str = None) -> str:
+        return self._canvas.tag_bind(self._map_tag(tag_or_id), sequence, command, add)
+
+    def tag_unbind(self, tag_or_id: Union[str, int], sequence: str, funcid: str = None):
+        self._canvas.tag_unbind(self._map_tag(tag_or_id), sequence, funcid)
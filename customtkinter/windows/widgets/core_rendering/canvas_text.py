@@ -0,0 +1,179 @@
+from __future__ import annotations
+import tkinter
+from typing import Union, Tuple, Callable, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ..core_rendering import CTkCanvas
+
+
+class CanvasText:
+    """
+    Text item on a canvas, which is used instead of a tkinter.Label by widgets with single canvas rendering.
+
+    Item options are only passed to Tk if they changed, so a text update is a single itemconfigure call.
+    The size of single line text is taken from the cached measurement of CTkFont if possible, otherwise
+    from the bounding box of the item. layout() positions text and image like a tkinter.Label with compound,
+    place_beside() places the text beside an indicator (checkbox, radiobutton, switch) and grows the canvas to fit it.
+    """
+
+    def __init__(self, canvas: CTkCanvas, tag: str = "text_item", text_change_callback: Optional[Callable[[], None]] = None):
+        self._canvas = canvas
+        self._tag = tag
+        self._item: Union[int, None] = None
+        self._options: dict = {}
+        self._coords: Union[Tuple[float, float], None] = None
+        self._requested_canvas_size: Tuple[float, float] = (0, 0)  # canvas size requested by place_beside()
+
+        self._text_change_callback = text_change_callback  # called when text changed through textvariable
+        self._textvariable: Union[tkinter.Variable, None] = None
+        self._textvariable_callback_name: Union[str, None] = None
+
+    def configure(self, **kwargs):
+        """ create text item or pass changed options (text, font, fill, width, justify, anchor, state, ...) to the item """
+        if self._textvariable is not None and "text" in kwargs:
+            kwargs["text"] = self._textvariable.get()
+
+        if self._item is None:
+            self._options.update(kwargs)
+            x, y = (0, 0) if self._coords is None else self._coords
+            self._item = self._canvas.create_text(x, y, tags=self._tag, **self._options)
+        else:
+            changed_options = {key: value for key, value in kwargs.items() if key not in self._options or self._options[key] != value}
+            if len(changed_options) > 0:
+                self._options.update(changed_options)
+                self._canvas.itemconfigure(self._item, **changed_options)
+
+    def cget(self, option: str) -> any:
+        return self._options.get(option)
+
+    def exists(self) -> bool:
+        return self._item is not None
+
+    def place(self, x: float, y: float, anchor: str):
+        x, y = round(x), round(y)
+        if (x, y) != self._coords:
+            self._coords = (x, y)
+            if self._item is not None:
+                self._canvas.coords(self._item, x, y)
+        self.configure(anchor=anchor)
+
+    def delete(self):
+        if self._item is not None:
+            self._canvas.delete(self._item)
+            self._item = None
+            self._options = {}
+            self._coords = None
+
+    def destroy(self):
+        self.set_textvariable(None)
+
+    def set_textvariable(self, textvariable: Union[tkinter.Variable, None]):
+        if self._textvariable_callback_name is not None:
+            self._textvariable.trace_remove("write", self._textvariable_callback_name)
+            self._textvariable_callback_name = None
+
+        self._textvariable = textvariable if textvariable != "" else None
+        if self._textvariable is not None:
+            self._textvariable_callback_name = self._textvariable.trace_add("write", self._textvariable_callback)
+            if self._item is not None:
+                self.configure(text=self._textvariable.get())
+
+    def _textvariable_callback(self, var_name, index, mode):
+        if self._item is not None:
+            self.configure(text=self._textvariable.get())
+            if self._text_change_callback is not None:
+                self._text_change_callback()
+
+    def bind(self, sequence: str = None, command: Callable = None, add: str = None) -> str:
+        """ bind to all items with the tag of the text item, also to items created later """
+        return self._canvas.tag_bind(self._tag, sequence, command, add)
+
+    def unbind(self, sequence: str, funcid: str = None):
+        self._canvas.tag_unbind(self._tag, sequence, funcid)
+
+    def get_size(self, font: any = None, font_scaling: float = 1) -> Tuple[int, int]:
+        """ returns width and height of the text, uses cached measurement if font is a CTkFont and text is a single line """
+        text = str(self._options.get("text", ""))
+        if self._item is None or text == "":
+            return 0, 0
+
+        if hasattr(font, "measure_cached") and not self._options.get("width") and "\n" not in text:
+            return font.measure_cached(text, font_scaling), font.metrics_cached(font_scaling)["linespace"]
+
+        bbox = self._canvas.bbox(self._item)
+        if bbox is None:
+            return 0, 0
+        return bbox[2] - bbox[0], bbox[3] - bbox[1]
+
+    def place_beside(self, x: float, height: float, min_width: float, min_height: float, font: any = None, font_scaling: float = 1):
+        """ place text left aligned at x and vertically centered in height, like a tkinter.Label in the grid column
+            beside the indicator, the canvas grows to fit the text but is at least min_width x min_height """
+        text_width, text_height = self.get_size(font, font_scaling)
+        self.place(x, height / 2, "w")
+
+        canvas_size = (max(min_width, x + text_width), max(min_height, text_height))
+        if canvas_size != self._requested_canvas_size:
+            self._requested_canvas_size = canvas_size
+            self._canvas.configure(width=canvas_size[0], height=canvas_size[1])
+
+    def reset_canvas_size(self):
+        """ must be called if the canvas size was configured elsewhere, so place_beside() configures it again """
+        self._requested_canvas_size = (0, 0)
+
+    @staticmethod
+    def layout(text_size: Optional[Tuple[float, float]], image_size: Optional[Tuple[float, float]], compound: str, anchor: str,
+               width: float, height: float, padding_x: float, padding_y: float, spacing: float) -> Tuple[Tuple[float, float], tuple, tuple]:
+        """
+        returns content size and positions (x, y, anchor) of text and image, text_size or image_size is None
+        if the widget has no text or no image, compound 'center' places the text on top of the image
+        """
+        if image_size is None:
+            # text is placed at the anchor point, so changing the text does not move the item
+            x, y = width / 2, height / 2
+            if anchor != "center":
+                if "w" in anchor:
+                    x = padding_x
+                if "e" in anchor:
+                    x = width - padding_x
+                if "n" in anchor:
+                    y = padding_y
+                if "s" in anchor:
+                    y = height - padding_y
+            return text_size or (0, 0), (x, y, anchor), None
+
+        text_width, text_height = text_size or (0, 0)
+        image_width, image_height = image_size
+        if text_size is None:
+            spacing = 0
+
+        if compound in ("right", "left"):
+            content_width, content_height = text_width + spacing + image_width, max(text_height, image_height)
+        elif compound in ("top", "bottom"):
+            content_width, content_height = max(text_width, image_width), text_height + spacing + image_height
+        else:
+            content_width, content_height = max(text_width, image_width), max(text_height, image_height)
+
+        x, y = (width - content_width) / 2, (height - content_height) / 2
+        if anchor != "center":
+            if "w" in anchor:
+                x = padding_x
+            if "e" in anchor:
+                x = width - padding_x - content_width
+            if "n" in anchor:
+                y = padding_y
+            if "s" in anchor:
+                y = height - padding_y - content_height
+
+        center_x, center_y = x + content_width / 2, y + content_height / 2
+        if compound == "right":
+            text_position, image_position = (x, center_y, "w"), (x + text_width + spacing, center_y, "w")
+        elif compound == "left":
+            text_position, image_position = (x + image_width + spacing, center_y, "w"), (x, center_y, "w")
+        elif compound == "top":
+            text_position, image_position = (center_x, y + image_height + spacing, "n"), (center_x, y, "n")
+        elif compound == "bottom":
+            text_position, image_position = (center_x, y, "n"), (center_x, y + text_height + spacing, "n")
+        else:
+            text_position, image_position = (center_x, center_y, "center"), (center_x, center_y, "center")
+
+        return (content_width, content_height), text_position, image_position
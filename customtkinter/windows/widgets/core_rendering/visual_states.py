@@ -0,0 +1,89 @@
+from __future__ import annotations
+import tkinter
+from typing import Tuple, List, Dict, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ..core_rendering import CTkCanvas
+
+
+class VisualStates:
+    """
+    Precomputed appearance of a widget for the states 'normal' and 'hover' (or other state names).
+
+    Every state is compiled into one Tcl script, which configures the canvas items of a tag with a single
+    itemconfigure call (aa-circle font items without outline option) and the options of other tkinter widgets.
+    The scripts are stored in a Tcl array, Enter and Leave are bound as Tcl scripts on the widgets or canvas
+    tags, so hover transitions don't call into Python. apply() switches the state with one Tcl call.
+    """
+
+    _counter: int = 0  # used for unique Tcl variable names
+
+    def __init__(self, canvas: CTkCanvas):
+        self._canvas = canvas
+        VisualStates._counter += 1
+        self._variable = f"::ctk_visual_states_{VisualStates._counter}"
+        self._scripts: Dict[str, str] = {}
+
+        self._canvas.tk.call("set", f"{self._variable}(current)", "normal")
+
+    def set_state(self, state: str,
+                  item_options: List[Tuple[str, dict]] = (),
+                  widget_options: List[Tuple[tkinter.Misc, dict]] = ()):
+        """ compile state script, item_options are (tag, options) of the canvas, widget_options are (widget, options) """
+        commands = []
+        for tag, options in item_options:
+            commands.append(self._itemconfigure_command(f"{tag}&&!ctk_aa_circle_font_element", options))
+            options_except_outline = {key: value for key, value in options.items() if key != "outline"}
+            if len(options_except_outline) > 0:
+                commands.append(self._itemconfigure_command(f"{tag}&&ctk_aa_circle_font_element", options_except_outline))
+        for widget, options in widget_options:
+            commands.append(" ".join([self._quote(str(widget)), "configure"] + self._options_to_args(options)))
+
+        script = "\n".join(commands)
+        if self._scripts.get(state) != script:
+            self._scripts[state] = script
+            self._canvas.tk.call("set", f"{self._variable}({state})", script)
+
+    def bind(self, widget: tkinter.Misc, tag: Optional[str] = None,
+             enter_state: str = "hover", leave_state: str = "normal"):
+        """ bind Enter and Leave of a widget or of a canvas tag (if tag is given) to the states """
+        for sequence, state in (("<Enter>", enter_state), ("<Leave>", leave_state)):
+            script = f"+set {self._variable}(current) {state}; {self._eval_state_script(state)}"
+            if tag is None:
+                widget.tk.call("bind", str(widget), sequence, script)
+            else:
+                widget.tk.call(str(widget), "bind", tag, sequence, script)
+
+    def apply(self, state: Optional[str] = None):
+        """ apply given state without changing the current state, or the current state if state is None """
+        if state is None:
+            self._canvas.tk.eval(f"if {{[info exists {self._variable}(current)]}} "
+                                 f"{{{self._eval_state_script(f'[set {self._variable}(current)]')}}}")
+        else:
+            self._canvas.tk.eval(self._eval_state_script(state))
+
+    def get_current(self) -> str:
+        """ returns state set by the last Enter or Leave event """
+        return self._canvas.tk.call("set", f"{self._variable}(current)")
+
+    def destroy(self):
+        self._canvas.tk.call("unset", "-nocomplain", self._variable)
+
+    def _eval_state_script(self, state: str) -> str:
+        return f"if {{[info exists {self._variable}({state})]}} {{eval [set {self._variable}({state})]}}"
+
+    def _itemconfigure_command(self, tag_expression: str, options: dict) -> str:
+        return " ".join([self._quote(str(self._canvas)), "itemconfigure", self._quote(tag_expression)] + self._options_to_args(options))
+
+    def _options_to_args(self, options: dict) -> List[str]:
+        args = []
+        for key, value in options.items():
+            args.extend((f"-{key}", self._quote(str(value))))
+        return args
+
+    @staticmethod
+    def _quote(value: str) -> str:
+        """ quote value as single Tcl word, colors, tags and widget paths contain no braces """
+        if "{" in value or "}" in value or "\\" in value:
+            raise ValueError(f"value '{value}' can not be used in a visual state")
+        return "{" + value + "}"
@@ -1,2 +1,3 @@
 from .dropdown_menu import DropdownMenu
+from .shared_bindings import SharedBindings
 from .ctk_base_class import CTkBaseClass
@@ -1,7 +1,7 @@
 import sys
 import tkinter
 import tkinter.ttk as ttk
-from typing import Union, Callable, Tuple
+from typing import Union, Callable, Tuple, Optional
 
 try:
     from typing import TypedDict
@@ -16,10 +16,12 @@ from .... import windows  # import windows for isinstance checks
 from ..theme import ThemeManager
 from ..font import CTkFont
 from ..image import CTkImage
+from ..style import CTkStyle
 from ..appearance_mode import CTkAppearanceModeBaseClass
 from ..scaling import CTkScalingBaseClass
 
 from ..utility import pop_from_dict_by_set, check_kwargs_empty
+from .shared_bindings import SharedBindings
 
 
 class CTkBaseClass(tkinter.Frame, CTkAppearanceModeBaseClass, CTkScalingBaseClass):
@@ -31,22 +33,34 @@ class CTkBaseClass(tkinter.Frame, CTkAppearanceModeBaseClass, CTkScalingBaseClas
 
     _cursor_manipulation_enabled: bool = True
 
+    # attributes that can be set by a CTkStyle, defined by sub-classes which support the style argument:
+    _style_attributes: set = set()
+
     def __init__(self,
                  master: any,
                  width: int = 0,
                  height: int = 0,
 
                  bg_color: Union[str, Tuple[str, str]] = "transparent",
+                 style: Optional[CTkStyle] = None,
                  **kwargs):
 
         # call init methods of super classes
         tkinter.Frame.__init__(self, master=master, width=width, height=height, **pop_from_dict_by_set(kwargs, self._valid_tk_frame_attributes))
         CTkAppearanceModeBaseClass.__init__(self)
         CTkScalingBaseClass.__init__(self, scaling_type="widget")
+        ThemeManager._add_widget(self)
 
         # check if kwargs is empty, if not raise error for unsupported arguments
         check_kwargs_empty(kwargs, raise_error=True)
 
+        # shared style, values of the style are used for all attributes not given explicitly (overrides)
+        self._style: Union[CTkStyle, None] = style
+        self._style_overrides: set = set()
+        self._style_update_running: bool = False
+        if self._style is not None:
+            self._style._add_widget(self)
+
         # dimensions independent of scaling
         self._current_width = width  # _current_width and _current_height in pixel, represent current size of the widget
         self._current_height = height  # _current_width and _current_height are independent of the scale
@@ -70,7 +84,7 @@ class CTkBaseClass(tkinter.Frame, CTkAppearanceModeBaseClass, CTkScalingBaseClas
         super().configure(bg=self._apply_appearance_mode(self._bg_color))
 
         # add configure callback to tkinter.Frame
-        super().bind('<Configure>', self._update_dimensions_event)
+        SharedBindings.bind(self, "<Configure>", self._update_dimensions_event)
 
         # overwrite configure methods of master when master is tkinter widget, so that bg changes get applied on child CTk widget as well
         if isinstance(self.master, (tkinter.Tk, tkinter.Toplevel, tkinter.Frame, tkinter.LabelFrame, ttk.Frame, ttk.LabelFrame, ttk.Notebook)) and not isinstance(self.master, CTkBaseClass):
@@ -96,10 +110,14 @@ class CTkBaseClass(tkinter.Frame, CTkAppearanceModeBaseClass, CTkScalingBaseClas
     def destroy(self):
         """ Destroy this and all descendants widgets. """
 
+        if self._style is not None:
+            self._style._remove_widget(self)
+
         # call destroy methods of super classes
         tkinter.Frame.destroy(self)
         CTkAppearanceModeBaseClass.destroy(self)
         CTkScalingBaseClass.destroy(self)
+        ThemeManager._remove_widget(self)
 
     def _draw(self, no_color_updates: bool = False):
         """ can be overridden but super method must be called """
@@ -121,6 +139,9 @@ class CTkBaseClass(tkinter.Frame, CTkAppearanceModeBaseClass, CTkScalingBaseClas
         if "height" in kwargs:
             self._set_dimensions(height=kwargs.pop("height"))
 
+        if "style" in kwargs:
+            self._set_style(kwargs.pop("style"))
+
         if "bg_color" in kwargs:
             new_bg_color = self._check_color_type(kwargs.pop("bg_color"), transparency=True)
             if new_bg_color == "transparent":
@@ -142,6 +163,8 @@ class CTkBaseClass(tkinter.Frame, CTkAppearanceModeBaseClass, CTkScalingBaseClas
 
         if attribute_name == "bg_color":
             return self._bg_color
+        elif attribute_name == "style":
+            return self._style
         elif attribute_name == "width":
             return self._desired_width
         elif attribute_name == "height":
@@ -152,6 +175,58 @@ class CTkBaseClass(tkinter.Frame, CTkAppearanceModeBaseClass, CTkScalingBaseClas
         else:
             raise ValueError(f"'{attribute_name}' is not a supported argument. Look at the documentation for supported arguments.")
 
+    def _get_style_attribute(self, attribute_name: str, value: any, theme_widget_name: str, transparency: bool = False) -> any:
+        """
+        returns explicitly given value (checked if color or font) and marks it as override,
+        otherwise the value of the style (color checked for this widget class) or the default value of the theme
+        """
+        if value is not None:
+            self._style_overrides.add(attribute_name)
+            if attribute_name == "font":
+                return self._check_font_type(value)
+            elif "color" in attribute_name:
+                return self._check_color_type(value, transparency=transparency)
+            else:
+                return value
+
+        elif self._style is not None and attribute_name in self._style:
+            if "color" in attribute_name:
+                return self._check_color_type(self._style.cget(attribute_name), transparency=transparency)
+            return self._style.cget(attribute_name)
+        elif attribute_name == "font":
+            return CTkFont()
+        else:
+            return ThemeManager.get_theme_value(theme_widget_name, attribute_name)
+
+    def _update_style_overrides(self, kwargs: dict):
+        """ must be called at the beginning of configure by sub-classes which support styles, marks configured attributes as override """
+        if not self._style_update_running:
+            self._style_overrides.update(self._style_attributes.intersection(kwargs.keys()))
+
+    def _apply_style_changes(self, attribute_names: set):
+        """ called by CTkStyle when attributes of the style changed, configures all attributes which are not overridden """
+        if self._style is None:
+            return
+
+        style_values = {attribute_name: self._style.cget(attribute_name) for attribute_name in self._style_attributes.intersection(attribute_names)
+                        if attribute_name not in self._style_overrides and attribute_name in self._style}
+
+        if len(style_values) > 0:
+            self._style_update_running = True
+            try:
+                self.configure(**style_values)
+            finally:
+                self._style_update_running = False
+
+    def _set_style(self, style: Union[CTkStyle, None]):
+        if self._style is not None:
+            self._style._remove_widget(self)
+
+        self._style = style
+        if self._style is not None:
+            self._style._add_widget(self)
+            self._apply_style_changes(self._style_attributes)
+
     def _check_font_type(self, font: any):
         """ check font type when passed to widget """
         if isinstance(font, CTkFont):
@@ -222,6 +297,10 @@ class CTkBaseClass(tkinter.Frame, CTkAppearanceModeBaseClass, CTkScalingBaseClas
         self._draw()
         super().update_idletasks()
 
+    def _apply_theme_colors(self):
+        """ called by ThemeManager.apply_theme() after theme color attributes were replaced """
+        self._draw()
+
     def _set_scaling(self, new_widget_scaling, new_window_scaling):
         super()._set_scaling(new_widget_scaling, new_window_scaling)
 
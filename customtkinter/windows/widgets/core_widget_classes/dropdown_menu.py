@@ -25,6 +25,7 @@ class DropdownMenu(tkinter.Menu, CTkAppearanceModeBaseClass, CTkScalingBaseClass
         tkinter.Menu.__init__(self, *args, **kwargs)
         CTkAppearanceModeBaseClass.__init__(self)
         CTkScalingBaseClass.__init__(self, scaling_type="widget")
+        ThemeManager._add_widget(self)
 
         self._min_character_width = min_character_width
         self._fg_color = ThemeManager.theme["DropdownMenu"]["fg_color"] if fg_color is None else self._check_color_type(fg_color)
@@ -50,10 +51,14 @@ class DropdownMenu(tkinter.Menu, CTkAppearanceModeBaseClass, CTkScalingBaseClass
         # call destroy methods of super classes
         tkinter.Menu.destroy(self)
         CTkAppearanceModeBaseClass.destroy(self)
+        CTkScalingBaseClass.destroy(self)  # releases the scaled named fonts
+        ThemeManager._remove_widget(self)
 
     def _update_font(self):
-        """ pass font to tkinter widgets with applied font scaling """
-        super().configure(font=self._apply_font_scaling(self._font))
+        """ pass font to tkinter widgets with applied font scaling, not needed if the named font stays the same """
+        font = self._apply_font_scaling(self._font)
+        if str(super().cget("font")) != str(font):
+            super().configure(font=font)
 
     def _configure_menu_for_platforms(self):
         """ apply platform specific appearance attributes, configure all colors """
@@ -196,3 +201,7 @@ class DropdownMenu(tkinter.Menu, CTkAppearanceModeBaseClass, CTkScalingBaseClass
         """ colors won't update on appearance mode change when dropdown is open, because it's not necessary """
         super()._set_appearance_mode(mode_string)
         self._configure_menu_for_platforms()
+
+    def _apply_theme_colors(self):
+        """ called by ThemeManager.apply_theme() after theme color attributes were replaced """
+        self._configure_menu_for_platforms()
@@ -0,0 +1,96 @@
+import tkinter
+from typing import Callable, Dict, Set, Union
+
+
+class SharedBindings:
+    """
+    Event bindings shared by all CTk widgets. Binding a Python callback on a widget registers a new
+    Tcl command for every bind, so instead the widgets get the bindtag 'CTkSharedBindings' and their
+    callbacks are stored in a registry by widget path. There is only one Tcl command per Tcl interpreter
+    and event sequence, which looks up the callback of the widget. Callbacks are removed on <Destroy>.
+
+    The bindtag is inserted before the widget path, so the shared callbacks run before bindings made
+    with .bind(), like the internal bindings which were created first.
+    """
+
+    bindtag: str = "CTkSharedBindings"
+
+    _registries: Dict[object, Dict[str, Dict[str, Callable]]] = {}  # interpreter -> widget path -> sequence -> callback
+    _bound_sequences: Dict[object, Set[str]] = {}  # interpreter -> sequences bound on the bindtag (one Tcl command each)
+
+    @classmethod
+    def bind(cls, widget: tkinter.Misc, sequence: str, callback: Callable):
+        """ bind callback to sequence of the widget, replaces an earlier callback for the same sequence """
+        registry = cls._get_registry(widget)
+        callbacks = registry.get(str(widget))
+
+        if callbacks is None:
+            callbacks = registry[str(widget)] = {}
+            widget.bindtags((cls.bindtag,) + widget.bindtags())
+
+        callbacks[sequence] = callback
+        cls._bind_sequence(widget, sequence)
+
+    @classmethod
+    def unbind(cls, widget: tkinter.Misc, sequence: str):
+        callbacks = cls._get_registry(widget).get(str(widget))
+        if callbacks is not None:
+            callbacks.pop(sequence, None)
+
+    @classmethod
+    def count_tcl_commands(cls, widget: tkinter.Misc) -> Dict[str, int]:
+        """ returns dict with number of CTk widgets, Tcl commands owned by them and their internal tkinter widgets,
+            and the shared Tcl commands, for the whole widget tree of the given widget """
+        from .ctk_base_class import CTkBaseClass
+        from ... import CTk, CTkToplevel
+
+        ctk_widgets, owned_widgets = 0, {}
+        stack = [widget._root()]
+        while len(stack) > 0:
+            current_widget = stack.pop()
+            stack.extend(current_widget.winfo_children())
+
+            if isinstance(current_widget, (CTkBaseClass, CTk, CTkToplevel)):
+                ctk_widgets += 1
+                owned_widgets[str(current_widget)] = current_widget
+
+                # internal tkinter widgets are stored as attributes of the CTk widget
+                for value in vars(current_widget).values():
+                    if isinstance(value, tkinter.Misc) and value is not current_widget.master:
+                        owned_widgets[str(value)] = value
+
+        tcl_commands = sum(len(owned_widget._tclCommands or ()) for owned_widget in owned_widgets.values())
+        return {"widgets": ctk_widgets,
+                "tcl_commands": tcl_commands,
+                "shared_tcl_commands": len(cls._bound_sequences.get(widget.tk, ()))}
+
+    @classmethod
+    def _get_registry(cls, widget: tkinter.Misc) -> Dict[str, Dict[str, Callable]]:
+        registry = cls._registries.get(widget.tk)
+        if registry is None:
+            registry = cls._registries[widget.tk] = {}
+            cls._bound_sequences[widget.tk] = {"<Destroy>"}
+            widget.bind_class(cls.bindtag, "<Destroy>", lambda event: cls._destroy_event(registry, event))
+        return registry
+
+    @classmethod
+    def _bind_sequence(cls, widget: tkinter.Misc, sequence: str):
+        bound_sequences = cls._bound_sequences[widget.tk]
+        if sequence not in bound_sequences:
+            bound_sequences.add(sequence)
+            registry = cls._registries[widget.tk]
+            widget.bind_class(cls.bindtag, sequence, lambda event: cls._dispatch(registry, sequence, event))
+
+    @staticmethod
+    def _dispatch(registry: Dict[str, Dict[str, Callable]], sequence: str, event: tkinter.Event) -> Union[str, None]:
+        callbacks = registry.get(str(event.widget))
+        if callbacks is not None:
+            callback = callbacks.get(sequence)
+            if callback is not None:
+                return callback(event)
+
+    @staticmethod
+    def _destroy_event(registry: Dict[str, Dict[str, Callable]], event: tkinter.Event):
+        callbacks = registry.pop(str(event.widget), None)
+        if callbacks is not None and "<Destroy>" in callbacks:
+            callbacks["<Destroy>"](event)
@@ -3,21 +3,38 @@ import sys
 from typing import Union, Tuple, Callable, Optional
 
 from .core_rendering import CTkCanvas
-from .theme import ThemeManager
 from .core_rendering import DrawEngine
+from .core_rendering import CanvasText
+from .core_rendering import VisualStates
 from .core_widget_classes import CTkBaseClass
+from .core_widget_classes import SharedBindings
 from .font import CTkFont
 from .image import CTkImage
+from .color import ColorManager
+from .style import CTkStyle
 
 
 class CTkButton(CTkBaseClass):
     """
     Button with rounded corners, border, hover effect, image support, click command and textvariable.
     For detailed information check out the documentation.
+
+    With CTkButton.single_canvas_rendering = True, buttons created afterwards draw text and image as items
+    on their canvas instead of using tkinter.Label widgets laid out by grid.
+
+    With CTkButton.native_hover = True, buttons created afterwards switch between precomputed hover and normal
+    colors with Tcl Enter/Leave bindings, Python is only called for Enter/Leave if bound with .bind().
     """
 
     _image_label_spacing: int = 6
 
+    single_canvas_rendering: bool = False
+    native_hover: bool = False
+
+    # attributes that can be set by a CTkStyle:
+    _style_attributes: set = {"corner_radius", "border_width", "fg_color", "hover_color", "border_color",
+                              "text_color", "text_color_disabled", "font"}
+
     def __init__(self,
                  master: any,
                  width: int = 140,
@@ -46,23 +63,24 @@ class CTkButton(CTkBaseClass):
                  command: Union[Callable[[], None], None] = None,
                  compound: str = "left",
                  anchor: str = "center",
+                 style: Optional[CTkStyle] = None,
                  **kwargs):
 
-        # transfer basic functionality (bg_color, size, appearance_mode, scaling) to CTkBaseClass
-        super().__init__(master=master, bg_color=bg_color, width=width, height=height, **kwargs)
+        # transfer basic functionality (bg_color, size, appearance_mode, scaling, style) to CTkBaseClass
+        super().__init__(master=master, bg_color=bg_color, width=width, height=height, style=style, **kwargs)
 
         # shape
-        self._corner_radius: int = ThemeManager.theme["CTkButton"]["corner_radius"] if corner_radius is None else corner_radius
+        self._corner_radius: int = self._get_style_attribute("corner_radius", corner_radius, "CTkButton")
         self._corner_radius = min(self._corner_radius, round(self._current_height / 2))
-        self._border_width: int = ThemeManager.theme["CTkButton"]["border_width"] if border_width is None else border_width
+        self._border_width: int = self._get_style_attribute("border_width", border_width, "CTkButton")
         self._border_spacing: int = border_spacing
 
         # color
-        self._fg_color: Union[str, Tuple[str, str]] = ThemeManager.theme["CTkButton"]["fg_color"] if fg_color is None else self._check_color_type(fg_color, transparency=True)
-        self._hover_color: Union[str, Tuple[str, str]] = ThemeManager.theme["CTkButton"]["hover_color"] if hover_color is None else self._check_color_type(hover_color)
-        self._border_color: Union[str, Tuple[str, str]] = ThemeManager.theme["CTkButton"]["border_color"] if border_color is None else self._check_color_type(border_color)
-        self._text_color: Union[str, Tuple[str, str]] = ThemeManager.theme["CTkButton"]["text_color"] if text_color is None else self._check_color_type(text_color)
-        self._text_color_disabled: Union[str, Tuple[str, str]] = ThemeManager.theme["CTkButton"]["text_color_disabled"] if text_color_disabled is None else self._check_color_type(text_color_disabled)
+        self._fg_color: Union[str, Tuple[str, str]] = self._get_style_attribute("fg_color", fg_color, "CTkButton", transparency=True)
+        self._hover_color: Union[str, Tuple[str, str]] = self._get_style_attribute("hover_color", hover_color, "CTkButton")
+        self._border_color: Union[str, Tuple[str, str]] = self._get_style_attribute("border_color", border_color, "CTkButton")
+        self._text_color: Union[str, Tuple[str, str]] = self._get_style_attribute("text_color", text_color, "CTkButton")
+        self._text_color_disabled: Union[str, Tuple[str, str]] = self._get_style_attribute("text_color_disabled", text_color_disabled, "CTkButton")
 
         # rendering options
         self._background_corner_colors: Union[Tuple[Union[str, Tuple[str, str]]], None] = background_corner_colors  # rendering options for DrawEngine
@@ -73,13 +91,14 @@ class CTkButton(CTkBaseClass):
         self._text = text
         self._text_label: Union[tkinter.Label, None] = None
         self._textvariable: tkinter.Variable = textvariable
-        self._font: Union[tuple, CTkFont] = CTkFont() if font is None else self._check_font_type(font)
+        self._font: Union[tuple, CTkFont] = self._get_style_attribute("font", font, "CTkButton")
         if isinstance(self._font, CTkFont):
             self._font.add_size_configure_callback(self._update_font)
 
         # image
         self._image = self._check_image_type(image)
         self._image_label: Union[tkinter.Label, None] = None
+        self._photo_image = None  # scaled photo image currently displayed
         if isinstance(self._image, CTkImage):
             self._image.add_configure_callback(self._update_image)
 
@@ -91,20 +110,35 @@ class CTkButton(CTkBaseClass):
         self._anchor: str = anchor
         self._click_animation_running: bool = False
 
+        # single canvas rendering: text and image are canvas items, positioned by _position_canvas_content()
+        self._single_canvas_rendering: bool = self.single_canvas_rendering
+        self._canvas_text: Union[CanvasText, None] = None
+        self._image_item: Union[int, None] = None
+        self._canvas_requested_size: Tuple[float, float] = (0, 0)
+
         # canvas and draw engine
         self._canvas = CTkCanvas(master=self,
                                  highlightthickness=0,
                                  width=self._apply_widget_scaling(self._desired_width),
                                  height=self._apply_widget_scaling(self._desired_height))
-        self._canvas.grid(row=0, column=0, rowspan=5, columnspan=5, sticky="nsew")
+        if self._single_canvas_rendering:
+            self.grid_rowconfigure(0, weight=1)
+            self.grid_columnconfigure(0, weight=1)
+            self._canvas.grid(row=0, column=0, sticky="nsew")
+        else:
+            self._canvas.grid(row=0, column=0, rowspan=5, columnspan=5, sticky="nsew")
         self._draw_engine = DrawEngine(self._canvas)
+        if self._single_canvas_rendering:
+            self._canvas_text = CanvasText(self._canvas, text_change_callback=self._position_canvas_content)
+            self._canvas_text.set_textvariable(self._textvariable)
         self._draw_engine.set_round_to_even_numbers(self._round_width_to_even_numbers, self._round_height_to_even_numbers)  # rendering options
 
+        # native hover: hover colors are precomputed by _update_visual_states() and switched by Tcl bindings
+        self._visual_states: Union[VisualStates, None] = VisualStates(self._canvas) if self.native_hover else None
+
         # canvas event bindings
-        self._canvas.bind("<Enter>", self._on_enter)
-        self._canvas.bind("<Leave>", self._on_leave)
-        self._canvas.bind("<Button-1>", self._clicked)
-        self._canvas.bind("<Button-1>", self._clicked)
+        self._bind_hover(self._canvas)
+        SharedBindings.bind(self._canvas, "<Button-1>", self._clicked)
 
         # configure cursor and initial draw
         self._set_cursor()
@@ -117,11 +151,14 @@ class CTkButton(CTkBaseClass):
 
         if self._text_label is not None:
             self._text_label.configure(font=self._apply_font_scaling(self._font))
+        if self._canvas_text is not None and self._canvas_text.exists():
+            self._canvas_text.configure(font=self._apply_font_scaling(self._font))
 
         self._update_image()
 
         self._canvas.configure(width=self._apply_widget_scaling(self._desired_width),
                                height=self._apply_widget_scaling(self._desired_height))
+        self._canvas_requested_size = (0, 0)  # canvas can grow again in _position_canvas_content()
         self._draw(no_color_updates=True)
 
     def _set_appearance_mode(self, mode_string):
@@ -133,12 +170,17 @@ class CTkButton(CTkBaseClass):
 
         self._canvas.configure(width=self._apply_widget_scaling(self._desired_width),
                                height=self._apply_widget_scaling(self._desired_height))
+        self._canvas_requested_size = (0, 0)  # canvas can grow again in _position_canvas_content()
         self._draw()
 
     def _update_font(self):
         """ pass font to tkinter widgets with applied font scaling and update grid with workaround """
+        if self._canvas_text is not None and self._canvas_text.exists():
+            self._canvas_text.configure(font=self._apply_font_scaling(self._font))
+            self._position_canvas_content()
+
         if self._text_label is not None:
-            self._text_label.configure(font=self._apply_font_scaling(self._font))
+            self._configure_scaled_font(self._text_label, self._apply_font_scaling(self._font))
 
             # Workaround to force grid to be resized when text changes size.
             # Otherwise grid will lag and only resizes if other mouse action occurs.
@@ -146,13 +188,28 @@ class CTkButton(CTkBaseClass):
             self._canvas.grid(row=0, column=0, rowspan=5, columnspan=5, sticky="nsew")
 
     def _update_image(self):
+        if self._image_item is not None:
+            if isinstance(self._image, CTkImage):
+                self._photo_image = self._image.create_scaled_photo_image(self._get_widget_scaling(), self._get_appearance_mode())
+            else:
+                self._photo_image = self._image
+            self._canvas.itemconfigure(self._image_item, image=self._photo_image)
+            self._position_canvas_content()
+
         if self._image_label is not None:
-            self._image_label.configure(image=self._image.create_scaled_photo_image(self._get_widget_scaling(),
-                                                                                    self._get_appearance_mode()))
+            # keep reference to the photo image, because it can be removed from the CTkImage cache
+            self._photo_image = self._image.create_scaled_photo_image(self._get_widget_scaling(), self._get_appearance_mode())
+            self._image_label.configure(image=self._photo_image)
 
     def destroy(self):
         if isinstance(self._font, CTkFont):
             self._font.remove_size_configure_callback(self._update_font)
+        if isinstance(self._image, CTkImage):
+            self._image.remove_configure_callback(self._update_image)
+        if self._canvas_text is not None:
+            self._canvas_text.destroy()
+        if self._visual_states is not None:
+            self._visual_states.destroy()
         super().destroy()
 
     def _draw(self, no_color_updates=False):
@@ -192,6 +249,11 @@ class CTkButton(CTkBaseClass):
                                         outline=self._apply_appearance_mode(self._fg_color),
                                         fill=self._apply_appearance_mode(self._fg_color))
 
+        if self._single_canvas_rendering:
+            self._draw_canvas_content(no_color_updates, requires_recoloring)
+            self._update_visual_states()
+            return
+
         # create text label if text given
         if self._text is not None and self._text != "":
 
@@ -205,17 +267,15 @@ class CTkButton(CTkBaseClass):
                                                  textvariable=self._textvariable)
                 self._create_grid()
 
-                self._text_label.bind("<Enter>", self._on_enter)
-                self._text_label.bind("<Leave>", self._on_leave)
-                self._text_label.bind("<Button-1>", self._clicked)
-                self._text_label.bind("<Button-1>", self._clicked)
+                self._bind_hover(self._text_label)
+                SharedBindings.bind(self._text_label, "<Button-1>", self._clicked)
 
             if no_color_updates is False:
                 # set text_label fg color (text color)
                 self._text_label.configure(fg=self._apply_appearance_mode(self._text_color))
 
                 if self._state == tkinter.DISABLED:
-                    self._text_label.configure(fg=(self._apply_appearance_mode(self._text_color_disabled)))
+                    self._text_label.configure(fg=(self._apply_appearance_mode(self._get_text_color_disabled())))
                 else:
                     self._text_label.configure(fg=self._apply_appearance_mode(self._text_color))
 
@@ -239,10 +299,8 @@ class CTkButton(CTkBaseClass):
                 self._update_image()  # set image
                 self._create_grid()
 
-                self._image_label.bind("<Enter>", self._on_enter)
-                self._image_label.bind("<Leave>", self._on_leave)
-                self._image_label.bind("<Button-1>", self._clicked)
-                self._image_label.bind("<Button-1>", self._clicked)
+                self._bind_hover(self._image_label)
+                SharedBindings.bind(self._image_label, "<Button-1>", self._clicked)
 
             if no_color_updates is False:
                 # set image_label bg color (background color of label)
@@ -258,8 +316,73 @@ class CTkButton(CTkBaseClass):
                 self._image_label = None
                 self._create_grid()
 
+        self._update_visual_states()
+
+    def _draw_canvas_content(self, no_color_updates: bool, requires_recoloring: bool):
+        """ create, color and position text and image canvas items (single canvas rendering) """
+        created_items = False
+
+        if self._text is not None and self._text != "":
+            if not self._canvas_text.exists():
+                self._canvas_text.configure(text=self._text, justify="center", font=self._apply_font_scaling(self._font))
+                created_items = True
+
+            if no_color_updates is False or created_items:
+                if self._state == tkinter.DISABLED:
+                    self._canvas_text.configure(fill=self._apply_appearance_mode(self._get_text_color_disabled()))
+                else:
+                    self._canvas_text.configure(fill=self._apply_appearance_mode(self._text_color))
+        else:
+            self._canvas_text.delete()
+
+        if self._image is not None:
+            if self._image_item is None:
+                self._image_item = self._canvas.create_image(0, 0, tags="image_item")
+                created_items = True
+                self._update_image()  # set image
+        elif self._image_item is not None:
+            self._canvas.delete(self._image_item)
+            self._image_item = None
+
+        # draw engine can create new shapes on top of text and image
+        if created_items or requires_recoloring or self._background_corner_colors is not None:
+            self._canvas.tag_raise("text_item")
+            self._canvas.tag_raise("image_item")
+
+        self._position_canvas_content()
+
+    def _position_canvas_content(self):
+        """ place text and image items according to compound and anchor, replaces the grid of the label widgets """
+        text_size = self._canvas_text.get_size(self._font, self._get_widget_scaling()) if self._canvas_text.exists() else None
+        image_size = None
+        if self._image_item is not None and self._photo_image is not None:
+            image_size = (self._photo_image.width(), self._photo_image.height())
+
+        # same minimum padding as the outer rows and columns of the label grid
+        padding_x = self._apply_widget_scaling(max(self._corner_radius, self._border_width + 1, self._border_spacing))
+        padding_y = self._apply_widget_scaling(max(self._border_width + 1, self._border_spacing))
+        width, height = self._apply_widget_scaling(self._current_width), self._apply_widget_scaling(self._current_height)
+        content_size, text_position, image_position = CanvasText.layout(text_size, image_size, self._compound, self._anchor,
+                                                                        width, height, padding_x, padding_y,
+                                                                        self._apply_widget_scaling(self._image_label_spacing))
+
+        # grow canvas if content does not fit, like the grid of the label widgets
+        canvas_width = max(self._apply_widget_scaling(self._desired_width), content_size[0] + 2 * padding_x)
+        canvas_height = max(self._apply_widget_scaling(self._desired_height), content_size[1] + 2 * padding_y)
+        if (canvas_width, canvas_height) != self._canvas_requested_size:
+            self._canvas_requested_size = (canvas_width, canvas_height)
+            self._canvas.configure(width=canvas_width, height=canvas_height)
+
+        if text_size is not None:
+            self._canvas_text.place(*text_position)
+        if image_size is not None:
+            self._canvas.coords(self._image_item, round(image_position[0]), round(image_position[1]))
+            self._canvas.itemconfigure(self._image_item, anchor=image_position[2])
+
     def _create_grid(self):
         """ configure grid system (5x5) """
+        if self._single_canvas_rendering:
+            return  # canvas is the only child widget
 
         # Outer rows and columns have weight of 1000 to overpower the rows and columns of the label and image with weight 1.
         # Rows and columns of image and label need weight of 1 to collapse in case of missing space on the button,
@@ -325,6 +448,8 @@ class CTkButton(CTkBaseClass):
                 self._text_label.grid(row=1, column=2, sticky="s")
 
     def configure(self, require_redraw=False, **kwargs):
+        self._update_style_overrides(kwargs)
+
         if "corner_radius" in kwargs:
             self._corner_radius = kwargs.pop("corner_radius")
             self._create_grid()
@@ -366,7 +491,13 @@ class CTkButton(CTkBaseClass):
 
         if "text" in kwargs:
             self._text = kwargs.pop("text")
-            if self._text_label is None:
+            if self._single_canvas_rendering:
+                if not self._canvas_text.exists() or self._text is None or self._text == "":
+                    require_redraw = True  # text item will be created or deleted in .draw()
+                else:
+                    self._canvas_text.configure(text=self._text)
+                    self._position_canvas_content()
+            elif self._text_label is None:
                 require_redraw = True  # text_label will be created in .draw()
             else:
                 self._text_label.configure(text=self._text)
@@ -382,6 +513,9 @@ class CTkButton(CTkBaseClass):
 
         if "textvariable" in kwargs:
             self._textvariable = kwargs.pop("textvariable")
+            if self._canvas_text is not None:
+                self._canvas_text.set_textvariable(self._textvariable)
+                self._position_canvas_content()
             if self._text_label is not None:
                 self._text_label.configure(textvariable=self._textvariable)
 
@@ -400,6 +534,7 @@ class CTkButton(CTkBaseClass):
 
         if "hover" in kwargs:
             self._hover = kwargs.pop("hover")
+            self._update_visual_states()
 
         if "command" in kwargs:
             self._command = kwargs.pop("command")
@@ -470,12 +605,52 @@ class CTkButton(CTkBaseClass):
                 elif sys.platform.startswith("win") and self._command is not None:
                     self.configure(cursor="hand2")
 
+    def _get_hover_color(self) -> Union[str, Tuple[str, str]]:
+        """ hover_color 'auto' is derived from fg_color (cached by ColorManager) """
+        if self._hover_color == "auto":
+            return ColorManager.derive_hover_color(self._bg_color if self._fg_color == "transparent" else self._fg_color, widget=self)
+        return self._hover_color
+
+    def _get_text_color_disabled(self) -> Union[str, Tuple[str, str]]:
+        """ text_color_disabled 'auto' is derived from text_color faded into fg_color (cached by ColorManager) """
+        if self._text_color_disabled == "auto":
+            return ColorManager.derive_disabled_color(self._text_color, self._bg_color if self._fg_color == "transparent" else self._fg_color, widget=self)
+        return self._text_color_disabled
+
+    def _bind_hover(self, widget: tkinter.Misc):
+        if self._visual_states is not None:
+            self._visual_states.bind(widget)
+        else:
+            SharedBindings.bind(widget, "<Enter>", self._on_enter)
+            SharedBindings.bind(widget, "<Leave>", self._on_leave)
+
+    def _update_visual_states(self):
+        """ precompute colors of inner parts and labels for normal and hover state (native hover only) """
+        if self._visual_states is None:
+            return
+
+        if self._fg_color == "transparent":
+            normal_color = self._apply_appearance_mode(self._bg_color)
+        else:
+            normal_color = self._apply_appearance_mode(self._fg_color)
+
+        if self._hover is True and self._state == "normal" and self._hover_color is not None:
+            hover_color = self._apply_appearance_mode(self._get_hover_color())
+        else:
+            hover_color = normal_color
+
+        for state, color in (("normal", normal_color), ("hover", hover_color)):
+            self._visual_states.set_state(state,
+                                          item_options=[("inner_parts", {"fill": color, "outline": color})],
+                                          widget_options=[(label, {"bg": color}) for label in (self._text_label, self._image_label) if label is not None])
+        self._visual_states.apply()
+
     def _on_enter(self, event=None):
         if self._hover is True and self._state == "normal":
             if self._hover_color is None:
                 inner_parts_color = self._fg_color
             else:
-                inner_parts_color = self._hover_color
+                inner_parts_color = self._get_hover_color()
 
             # set color of inner button parts to hover color
             self._canvas.itemconfig("inner_parts",
@@ -518,10 +693,15 @@ class CTkButton(CTkBaseClass):
     def _clicked(self, event=None):
         if self._state != tkinter.DISABLED:
 
-            # click animation: change color with .on_leave() and back to normal after 100ms with click_animation()
-            self._on_leave()
-            self._click_animation_running = True
-            self.after(100, self._click_animation)
+            if self._visual_states is not None:
+                # click animation: apply normal state and back to the current state after 100ms
+                self._visual_states.apply("normal")
+                self.after(100, self._visual_states.apply)
+            else:
+                # click animation: change color with .on_leave() and back to normal after 100ms with click_animation()
+                self._on_leave()
+                self._click_animation_running = True
+                self.after(100, self._click_animation)
 
             if self._command is not None:
                 self._command()
@@ -534,21 +714,33 @@ class CTkButton(CTkBaseClass):
 
     def bind(self, sequence: str = None, command: Callable = None, add: str = None) -> str:
         """ called on the tkinter.Label and tkinter.Canvas """
+        if self._single_canvas_rendering:
+            return self._canvas.bind(sequence, command, add)
+
         canvas_bind_return = self._canvas.bind(sequence, command, add)
         label_bind_return = self._text_label.bind(sequence, command, add)
         return canvas_bind_return + " + " + label_bind_return
 
     def unbind(self, sequence: str, funcid: str = None):
         """ called on the tkinter.Label and tkinter.Canvas """
+        if self._single_canvas_rendering:
+            return self._canvas.unbind(sequence, funcid)
+
         canvas_bind_return, label_bind_return = funcid.split(" + ")
         self._canvas.unbind(sequence, canvas_bind_return)
         self._text_label.unbind(sequence, label_bind_return)
 
     def focus(self):
+        if self._single_canvas_rendering:
+            return self._canvas.focus()
         return self._text_label.focus()
 
     def focus_set(self):
+        if self._single_canvas_rendering:
+            return self._canvas.focus_set()
         return self._text_label.focus_set()
 
     def focus_force(self):
+        if self._single_canvas_rendering:
+            return self._canvas.focus_force()
         return self._text_label.focus_force()
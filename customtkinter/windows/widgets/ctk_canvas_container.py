@@ -0,0 +1,352 @@
+import sys
+import tkinter
+from typing import Union, Tuple, List, Dict, Optional, TYPE_CHECKING
+
+from .core_rendering import CTkCanvas
+from .theme import ThemeManager
+from .core_rendering import DrawEngine
+from .core_widget_classes import CTkBaseClass
+from .core_widget_classes import SharedBindings
+from .font import CTkFont
+
+if TYPE_CHECKING:
+    from .canvas_items import CTkCanvasItem
+
+
+class CTkCanvasContainer(CTkBaseClass):
+    """
+    Frame with rounded corners and border, which hosts lightweight widgets (CTkCanvasButton, CTkCanvasLabel,
+    CTkCanvasCheckBox, CTkCanvasSwitch, CTkCanvasProgressBar). The lightweight widgets have no Tk window,
+    they are drawn as groups of items on the single canvas of the container and are positioned with .place(x, y).
+    Hit-testing, hover, click and keyboard focus (Tab, Shift-Tab, space, Return) are dispatched by the container,
+    so a dashboard with thousands of lightweight widgets only needs one frame and one canvas.
+    For detailed information check out the documentation.
+    """
+
+    def __init__(self,
+                 master: any,
+                 width: int = 200,
+                 height: int = 200,
+                 corner_radius: Optional[Union[int, str]] = None,
+                 border_width: Optional[Union[int, str]] = None,
+
+                 bg_color: Union[str, Tuple[str, str]] = "transparent",
+                 fg_color: Optional[Union[str, Tuple[str, str]]] = None,
+                 border_color: Optional[Union[str, Tuple[str, str]]] = None,
+
+                 font: Optional[Union[tuple, CTkFont]] = None,
+                 **kwargs):
+
+        # transfer basic functionality (_bg_color, size, __appearance_mode, scaling) to CTkBaseClass
+        super().__init__(master=master, bg_color=bg_color, width=width, height=height, **kwargs)
+
+        # color
+        self._fg_color = ThemeManager.theme["CTkFrame"]["fg_color"] if fg_color is None else self._check_color_type(fg_color, transparency=True)
+        self._border_color = ThemeManager.theme["CTkFrame"]["border_color"] if border_color is None else self._check_color_type(border_color)
+
+        # shape
+        self._corner_radius = ThemeManager.theme["CTkFrame"]["corner_radius"] if corner_radius is None else corner_radius
+        self._border_width = ThemeManager.theme["CTkFrame"]["border_width"] if border_width is None else border_width
+
+        # default font of all lightweight widgets without own font
+        self._font = CTkFont() if font is None else self._check_font_type(font)
+        if isinstance(self._font, CTkFont):
+            self._font.add_size_configure_callback(self._update_font)
+
+        # lightweight widgets, ordered from bottom to top
+        self._items: List["CTkCanvasItem"] = []
+        self._items_by_tag: Dict[str, "CTkCanvasItem"] = {}
+        self._hover_item: Union["CTkCanvasItem", None] = None
+        self._focus_item: Union["CTkCanvasItem", None] = None
+
+        self._canvas = CTkCanvas(master=self,
+                                 highlightthickness=0,
+                                 takefocus=1,
+                                 width=self._apply_widget_scaling(self._current_width),
+                                 height=self._apply_widget_scaling(self._current_height))
+        self._canvas.place(x=0, y=0, relwidth=1, relheight=1)
+        self._draw_engine = DrawEngine(self._canvas)
+
+        self._create_bindings()
+        self._draw()
+
+    def _create_bindings(self):
+        """ set necessary bindings for hit-testing, hover, click and focus """
+        bindings = {"<Motion>": self._on_motion,
+                    "<Leave>": self._on_leave,
+                    "<Button-1>": self._on_click,
+                    "<Tab>": self._on_focus_next,
+                    "<<PrevWindow>>": self._on_focus_previous,
+                    "<space>": self._on_activate_key,
+                    "<Return>": self._on_activate_key,
+                    "<FocusIn>": self._on_focus_in,
+                    "<FocusOut>": self._on_focus_out}
+
+        for sequence, command in bindings.items():
+            SharedBindings.bind(self._canvas, sequence, command)
+
+    def winfo_children(self) -> List[any]:
+        """ winfo_children of CTkCanvasContainer without self.canvas widget """
+        child_widgets = super().winfo_children()
+        try:
+            child_widgets.remove(self._canvas)
+            return child_widgets
+        except ValueError:
+            return child_widgets
+
+    def winfo_items(self) -> List["CTkCanvasItem"]:
+        """ returns all lightweight widgets of the container """
+        return list(self._items)
+
+    def _set_scaling(self, *args, **kwargs):
+        super()._set_scaling(*args, **kwargs)
+
+        self._canvas.configure(width=self._apply_widget_scaling(self._desired_width),
+                               height=self._apply_widget_scaling(self._desired_height))
+        self._draw(no_color_updates=True)
+        for item in self._items:
+            item._set_scaling()
+        self._update_focus_ring()
+
+    def _set_dimensions(self, width=None, height=None):
+        super()._set_dimensions(width, height)
+
+        self._canvas.configure(width=self._apply_widget_scaling(self._desired_width),
+                               height=self._apply_widget_scaling(self._desired_height))
+        self._draw()
+
+    def _update_font(self):
+        for item in self._items:
+            item._update_font()
+        self._update_focus_ring()
+
+    def destroy(self):
+        for item in list(self._items):
+            item.destroy()
+        if isinstance(self._font, CTkFont):
+            self._font.remove_size_configure_callback(self._update_font)
+        super().destroy()
+
+    def _draw(self, no_color_updates=False):
+        super()._draw(no_color_updates)
+
+        if not self._canvas.winfo_exists():
+            return
+
+        requires_recoloring = self._draw_engine.draw_rounded_rect_with_border(self._apply_widget_scaling(self._current_width),
+                                                                              self._apply_widget_scaling(self._current_height),
+                                                                              self._apply_widget_scaling(self._corner_radius),
+                                                                              self._apply_widget_scaling(self._border_width))
+
+        if requires_recoloring:
+            # new shapes of the container are created on top of the lightweight widgets
+            self._canvas.tag_lower("inner_parts")
+            self._canvas.tag_lower("border_parts")
+
+        if no_color_updates is False or requires_recoloring:
+            self._canvas.itemconfig("inner_parts",
+                                    fill=self._apply_appearance_mode(self._get_item_bg_color()),
+                                    outline=self._apply_appearance_mode(self._get_item_bg_color()))
+            self._canvas.itemconfig("border_parts",
+                                    fill=self._apply_appearance_mode(self._border_color),
+                                    outline=self._apply_appearance_mode(self._border_color))
+            self._canvas.configure(bg=self._apply_appearance_mode(self._bg_color))
+
+        if no_color_updates is False:
+            for item in self._items:
+                item._draw()
+            self._update_focus_ring()
+
+    def _get_item_bg_color(self) -> Union[str, Tuple[str, str]]:
+        """ background color of the lightweight widgets """
+        return self._bg_color if self._fg_color == "transparent" else self._fg_color
+
+    def _add_item(self, item: "CTkCanvasItem"):
+        self._items.append(item)
+        self._items_by_tag[item._group.tag] = item
+
+    def _remove_item(self, item: "CTkCanvasItem"):
+        if item._group.tag in self._items_by_tag:
+            self._items.remove(item)
+            del self._items_by_tag[item._group.tag]
+        self._remove_item_state(item)
+
+    def _remove_item_state(self, item: "CTkCanvasItem"):
+        """ remove hover and focus from widget, which got hidden or destroyed """
+        if self._hover_item is item:
+            self._hover_item = None
+            if self._cursor_manipulation_enabled:
+                self._canvas.configure(cursor="")
+        if self._focus_item is item:
+            self._focus_item = None
+            self._update_focus_ring()
+
+    def _update_item_state(self, item: "CTkCanvasItem"):
+        """ update cursor and focus after state of widget changed """
+        if self._hover_item is item and self._cursor_manipulation_enabled:
+            self._canvas.configure(cursor=self._get_cursor(item))
+        if self._focus_item is item and item._state == tkinter.DISABLED:
+            self._focus_item = None
+            self._update_focus_ring()
+
+    def _find_item(self, x: float, y: float) -> Union["CTkCanvasItem", None]:
+        """ returns top most placed lightweight widget at canvas coordinates x, y """
+        if self._hover_item is not None and self._hover_item._contains(x, y):
+            return self._hover_item  # fast path for motion inside of the same widget
+
+        for item in reversed(self._items):
+            if item._contains(x, y):
+                return item
+        return None
+
+    def _set_hover_item(self, item: Union["CTkCanvasItem", None]):
+        if item is self._hover_item:
+            return
+
+        if self._hover_item is not None:
+            self._hover_item._on_leave()
+        self._hover_item = item
+
+        if item is not None:
+            item._on_enter()
+        if self._cursor_manipulation_enabled:
+            self._canvas.configure(cursor=self._get_cursor(item))
+
+    @staticmethod
+    def _get_cursor(item: Union["CTkCanvasItem", None]) -> str:
+        if item is None or not item._clickable or item._state == tkinter.DISABLED:
+            return ""
+        elif sys.platform == "darwin":
+            return "pointinghand"
+        else:
+            return "hand2"
+
+    def _on_motion(self, event):
+        self._set_hover_item(self._find_item(self._canvas.canvasx(event.x), self._canvas.canvasy(event.y)))
+
+    def _on_leave(self, event=None):
+        self._set_hover_item(None)
+
+    def _on_click(self, event):
+        item = self._find_item(self._canvas.canvasx(event.x), self._canvas.canvasy(event.y))
+        if item is not None and item._clickable and item._state != tkinter.DISABLED:
+            if item._takes_focus:
+                self._focus_item = item
+                self._canvas.focus_set()
+                self._update_focus_ring()
+            item._clicked()
+
+    def _get_focusable_items(self) -> List["CTkCanvasItem"]:
+        return [item for item in self._items if item._takes_focus and item._placed and item._state != tkinter.DISABLED]
+
+    def _move_focus(self, step: int) -> Union[str, None]:
+        """ move keyboard focus to next or previous lightweight widget, returns 'break' if focus stays in the container """
+        focusable_items = self._get_focusable_items()
+        if self._focus_item in focusable_items:
+            index = focusable_items.index(self._focus_item) + step
+        else:
+            index = 0 if step > 0 else len(focusable_items) - 1
+
+        if 0 <= index < len(focusable_items):
+            self._focus_item = focusable_items[index]
+            self._update_focus_ring()
+            return "break"
+        else:
+            # last widget reached, let tkinter move the focus to the next widget
+            self._focus_item = None
+            self._update_focus_ring()
+            return None
+
+    def _on_focus_next(self, event=None):
+        return self._move_focus(1)
+
+    def _on_focus_previous(self, event=None):
+        return self._move_focus(-1)
+
+    def _on_focus_in(self, event=None):
+        if self._focus_item is None:
+            focusable_items = self._get_focusable_items()
+            if len(focusable_items) > 0:
+                self._focus_item = focusable_items[0]
+        self._update_focus_ring()
+
+    def _on_focus_out(self, event=None):
+        self._update_focus_ring()
+
+    def _on_activate_key(self, event=None):
+        if self._focus_item is not None and self._focus_item._state != tkinter.DISABLED:
+            self._focus_item._clicked()
+            return "break"
+
+    def _set_focus_item(self, item: "CTkCanvasItem"):
+        self._focus_item = item
+        self._canvas.focus_set()
+        self._update_focus_ring()
+
+    def _update_focus_ring(self):
+        """ draw dashed rectangle around the lightweight widget with keyboard focus """
+        if self._focus_item is None or not self._focus_item._placed or str(self._canvas.tk.call("focus")) != str(self._canvas):
+            self._canvas.delete("focus_ring")
+            return
+
+        x, y, width, height = self._focus_item._get_scaled_bounds()
+        padding = self._apply_widget_scaling(2)
+        coords = (x - padding, y - padding, x + width + padding, y + height + padding)
+
+        if not self._canvas.find_withtag("focus_ring"):
+            self._canvas.create_rectangle(coords, tags="focus_ring", dash=(2, 2), width=1)
+        else:
+            self._canvas.coords("focus_ring", coords)
+        self._canvas.itemconfig("focus_ring", outline=self._apply_appearance_mode(ThemeManager.theme["CTkLabel"]["text_color"]))
+        self._canvas.tag_raise("focus_ring")
+
+    def configure(self, require_redraw=False, **kwargs):
+        if "fg_color" in kwargs:
+            self._fg_color = self._check_color_type(kwargs.pop("fg_color"), transparency=True)
+            require_redraw = True
+
+        if "border_color" in kwargs:
+            self._border_color = self._check_color_type(kwargs.pop("border_color"))
+            require_redraw = True
+
+        if "corner_radius" in kwargs:
+            self._corner_radius = kwargs.pop("corner_radius")
+            require_redraw = True
+
+        if "border_width" in kwargs:
+            self._border_width = kwargs.pop("border_width")
+            require_redraw = True
+
+        if "font" in kwargs:
+            if isinstance(self._font, CTkFont):
+                self._font.remove_size_configure_callback(self._update_font)
+            self._font = self._check_font_type(kwargs.pop("font"))
+            if isinstance(self._font, CTkFont):
+                self._font.add_size_configure_callback(self._update_font)
+            self._update_font()
+
+        super().configure(require_redraw=require_redraw, **kwargs)
+
+    def cget(self, attribute_name: str) -> any:
+        if attribute_name == "corner_radius":
+            return self._corner_radius
+        elif attribute_name == "border_width":
+            return self._border_width
+
+        elif attribute_name == "fg_color":
+            return self._fg_color
+        elif attribute_name == "border_color":
+            return self._border_color
+        elif attribute_name == "font":
+            return self._font
+
+        else:
+            return super().cget(attribute_name)
+
+    def bind(self, sequence=None, command=None, add=True):
+        """ called on the tkinter.Canvas, always added to the bindings of the container """
+        return self._canvas.bind(sequence, command, add=True)
+
+    def unbind(self, sequence, funcid=None):
+        """ called on the tkinter.Canvas, removes all user bindings of the sequence """
+        self._canvas.unbind(sequence, None)
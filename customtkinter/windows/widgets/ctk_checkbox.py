@@ -3,18 +3,31 @@ import sys
 from typing import Union, Tuple, Callable, Optional
 
 from .core_rendering import CTkCanvas
-from .theme import ThemeManager
 from .core_rendering import DrawEngine
+from .core_rendering import CanvasText
+from .core_rendering import VisualStates
 from .core_widget_classes import CTkBaseClass
+from .core_widget_classes import SharedBindings
 from .font import CTkFont
+from .style import CTkStyle
 
 
 class CTkCheckBox(CTkBaseClass):
     """
     Checkbox with rounded corners, border, variable support and hover effect.
     For detailed information check out the documentation.
+
+    With CTkCheckBox.single_canvas_rendering = True, the text is drawn as canvas item instead of a tkinter.Label.
+    With CTkCheckBox.native_hover = True, hover colors are precomputed and switched by Tcl Enter/Leave bindings.
     """
 
+    single_canvas_rendering: bool = False
+    native_hover: bool = False
+
+    # attributes that can be set by a CTkStyle:
+    _style_attributes: set = {"corner_radius", "border_width", "fg_color", "hover_color", "border_color",
+                              "checkmark_color", "text_color", "text_color_disabled", "font"}
+
     def __init__(self,
                  master: any,
                  width: int = 100,
@@ -41,33 +54,34 @@ class CTkCheckBox(CTkBaseClass):
                  onvalue: Union[int, str] = 1,
                  offvalue: Union[int, str] = 0,
                  variable: Union[tkinter.Variable, None] = None,
+                 style: Optional[CTkStyle] = None,
                  **kwargs):
 
-        # transfer basic functionality (_bg_color, size, __appearance_mode, scaling) to CTkBaseClass
-        super().__init__(master=master, bg_color=bg_color, width=width, height=height, **kwargs)
+        # transfer basic functionality (_bg_color, size, __appearance_mode, scaling, style) to CTkBaseClass
+        super().__init__(master=master, bg_color=bg_color, width=width, height=height, style=style, **kwargs)
 
         # dimensions
         self._checkbox_width = checkbox_width
         self._checkbox_height = checkbox_height
 
         # color
-        self._fg_color = ThemeManager.theme["CTkCheckbox"]["fg_color"] if fg_color is None else self._check_color_type(fg_color)
-        self._hover_color = ThemeManager.theme["CTkCheckbox"]["hover_color"] if hover_color is None else self._check_color_type(hover_color)
-        self._border_color = ThemeManager.theme["CTkCheckbox"]["border_color"] if border_color is None else self._check_color_type(border_color)
-        self._checkmark_color = ThemeManager.theme["CTkCheckbox"]["checkmark_color"] if checkmark_color is None else self._check_color_type(checkmark_color)
+        self._fg_color = self._get_style_attribute("fg_color", fg_color, "CTkCheckbox")
+        self._hover_color = self._get_style_attribute("hover_color", hover_color, "CTkCheckbox")
+        self._border_color = self._get_style_attribute("border_color", border_color, "CTkCheckbox")
+        self._checkmark_color = self._get_style_attribute("checkmark_color", checkmark_color, "CTkCheckbox")
 
         # shape
-        self._corner_radius = ThemeManager.theme["CTkCheckbox"]["corner_radius"] if corner_radius is None else corner_radius
-        self._border_width = ThemeManager.theme["CTkCheckbox"]["border_width"] if border_width is None else border_width
+        self._corner_radius = self._get_style_attribute("corner_radius", corner_radius, "CTkCheckbox")
+        self._border_width = self._get_style_attribute("border_width", border_width, "CTkCheckbox")
 
         # text
         self._text = text
         self._text_label: Union[tkinter.Label, None] = None
-        self._text_color = ThemeManager.theme["CTkCheckbox"]["text_color"] if text_color is None else self._check_color_type(text_color)
-        self._text_color_disabled = ThemeManager.theme["CTkCheckbox"]["text_color_disabled"] if text_color_disabled is None else self._check_color_type(text_color_disabled)
+        self._text_color = self._get_style_attribute("text_color", text_color, "CTkCheckbox")
+        self._text_color_disabled = self._get_style_attribute("text_color_disabled", text_color_disabled, "CTkCheckbox")
 
         # font
-        self._font = CTkFont() if font is None else self._check_font_type(font)
+        self._font = self._get_style_attribute("font", font, "CTkCheckbox")
         if isinstance(self._font, CTkFont):
             self._font.add_size_configure_callback(self._update_font)
 
@@ -103,24 +117,37 @@ class CTkCheckBox(CTkBaseClass):
         self._canvas.grid(row=0, column=0, sticky="e")
         self._draw_engine = DrawEngine(self._canvas)
 
-        self._canvas.bind("<Enter>", self._on_enter)
-        self._canvas.bind("<Leave>", self._on_leave)
-        self._canvas.bind("<Button-1>", self.toggle)
-
-        self._text_label = tkinter.Label(master=self,
-                                         bd=0,
-                                         padx=0,
-                                         pady=0,
-                                         text=self._text,
-                                         justify=tkinter.LEFT,
-                                         font=self._apply_font_scaling(self._font),
-                                         textvariable=self._textvariable)
-        self._text_label.grid(row=0, column=2, sticky="w")
-        self._text_label["anchor"] = "w"
-
-        self._text_label.bind("<Enter>", self._on_enter)
-        self._text_label.bind("<Leave>", self._on_leave)
-        self._text_label.bind("<Button-1>", self.toggle)
+        # native hover: hover colors are precomputed by _update_visual_states() and switched by Tcl bindings
+        self._visual_states: Union[VisualStates, None] = VisualStates(self._canvas) if self.native_hover else None
+
+        self._bind_hover(self._canvas)
+        SharedBindings.bind(self._canvas, "<Button-1>", self.toggle)
+
+        # single canvas rendering: text is a canvas item on the background canvas, placed by _position_canvas_text()
+        self._single_canvas_rendering: bool = self.single_canvas_rendering
+        self._canvas_text: Union[CanvasText, None] = None
+
+        if self._single_canvas_rendering:
+            self._canvas_text = CanvasText(self._bg_canvas, text_change_callback=self._position_canvas_text)
+            self._canvas_text.set_textvariable(self._textvariable)
+            self._canvas_text.configure(text=self._text, justify=tkinter.LEFT, font=self._apply_font_scaling(self._font))
+
+            self._bind_hover(self._bg_canvas, tag="text_item")
+            self._canvas_text.bind("<Button-1>", self.toggle)
+        else:
+            self._text_label = tkinter.Label(master=self,
+                                             bd=0,
+                                             padx=0,
+                                             pady=0,
+                                             text=self._text,
+                                             justify=tkinter.LEFT,
+                                             font=self._apply_font_scaling(self._font),
+                                             textvariable=self._textvariable)
+            self._text_label.grid(row=0, column=2, sticky="w")
+            self._text_label["anchor"] = "w"
+
+            self._bind_hover(self._text_label)
+            SharedBindings.bind(self._text_label, "<Button-1>", self.toggle)
 
         # register variable callback and set state according to variable
         if self._variable is not None and self._variable != "":
@@ -134,11 +161,16 @@ class CTkCheckBox(CTkBaseClass):
         super()._set_scaling(*args, **kwargs)
 
         self.grid_columnconfigure(1, weight=0, minsize=self._apply_widget_scaling(6))
-        self._text_label.configure(font=self._apply_font_scaling(self._font))
+        if self._canvas_text is not None:
+            self._canvas_text.configure(font=self._apply_font_scaling(self._font))
+        else:
+            self._text_label.configure(font=self._apply_font_scaling(self._font))
 
         self._canvas.delete("checkmark")
         self._bg_canvas.configure(width=self._apply_widget_scaling(self._desired_width),
                                   height=self._apply_widget_scaling(self._desired_height))
+        if self._canvas_text is not None:
+            self._canvas_text.reset_canvas_size()  # background canvas can grow again in _position_canvas_text()
         self._canvas.configure(width=self._apply_widget_scaling(self._checkbox_width),
                                height=self._apply_widget_scaling(self._checkbox_height))
         self._draw(no_color_updates=True)
@@ -148,11 +180,18 @@ class CTkCheckBox(CTkBaseClass):
 
         self._bg_canvas.configure(width=self._apply_widget_scaling(self._desired_width),
                                   height=self._apply_widget_scaling(self._desired_height))
+        if self._canvas_text is not None:
+            self._canvas_text.reset_canvas_size()  # background canvas can grow again in _position_canvas_text()
 
     def _update_font(self):
         """ pass font to tkinter widgets with applied font scaling and update grid with workaround """
+        if self._canvas_text is not None:
+            self._canvas_text.configure(font=self._apply_font_scaling(self._font))
+            self._position_canvas_text()
+            return
+
         if self._text_label is not None:
-            self._text_label.configure(font=self._apply_font_scaling(self._font))
+            self._configure_scaled_font(self._text_label, self._apply_font_scaling(self._font))
 
             # Workaround to force grid to be resized when text changes size.
             # Otherwise grid will lag and only resizes if other mouse action occurs.
@@ -166,6 +205,12 @@ class CTkCheckBox(CTkBaseClass):
         if isinstance(self._font, CTkFont):
             self._font.remove_size_configure_callback(self._update_font)
 
+        if self._canvas_text is not None:
+            self._canvas_text.destroy()
+
+        if self._visual_states is not None:
+            self._visual_states.destroy()
+
         super().destroy()
 
     def _draw(self, no_color_updates=False):
@@ -208,14 +253,34 @@ class CTkCheckBox(CTkBaseClass):
                                         outline=self._apply_appearance_mode(self._border_color),
                                         fill=self._apply_appearance_mode(self._border_color))
 
-            if self._state == tkinter.DISABLED:
-                self._text_label.configure(fg=(self._apply_appearance_mode(self._text_color_disabled)))
+            if self._canvas_text is not None:
+                if self._state == tkinter.DISABLED:
+                    self._canvas_text.configure(fill=self._apply_appearance_mode(self._text_color_disabled))
+                else:
+                    self._canvas_text.configure(fill=self._apply_appearance_mode(self._text_color))
             else:
-                self._text_label.configure(fg=self._apply_appearance_mode(self._text_color))
+                if self._state == tkinter.DISABLED:
+                    self._text_label.configure(fg=(self._apply_appearance_mode(self._text_color_disabled)))
+                else:
+                    self._text_label.configure(fg=self._apply_appearance_mode(self._text_color))
+
+                self._text_label.configure(bg=self._apply_appearance_mode(self._bg_color))
+
+            self._update_visual_states()
 
-            self._text_label.configure(bg=self._apply_appearance_mode(self._bg_color))
+        if self._canvas_text is not None:
+            self._position_canvas_text()
+
+    def _position_canvas_text(self):
+        """ place text item beside the checkbox like the text label in grid column 2, background canvas grows to fit the text """
+        self._canvas_text.place_beside(self._apply_widget_scaling(self._checkbox_width) + self._apply_widget_scaling(6),
+                                       self._apply_widget_scaling(self._current_height),
+                                       self._apply_widget_scaling(self._desired_width), self._apply_widget_scaling(self._desired_height),
+                                       self._font, self._get_widget_scaling())
 
     def configure(self, require_redraw=False, **kwargs):
+        self._update_style_overrides(kwargs)
+
         if "corner_radius" in kwargs:
             self._corner_radius = kwargs.pop("corner_radius")
             require_redraw = True
@@ -236,7 +301,11 @@ class CTkCheckBox(CTkBaseClass):
 
         if "text" in kwargs:
             self._text = kwargs.pop("text")
-            self._text_label.configure(text=self._text)
+            if self._canvas_text is not None:
+                self._canvas_text.configure(text=self._text)
+                self._position_canvas_text()
+            else:
+                self._text_label.configure(text=self._text)
 
         if "font" in kwargs:
             if isinstance(self._font, CTkFont):
@@ -260,23 +329,36 @@ class CTkCheckBox(CTkBaseClass):
             self._hover_color = self._check_color_type(kwargs.pop("hover_color"))
             require_redraw = True
 
+        if "checkmark_color" in kwargs:
+            self._checkmark_color = self._check_color_type(kwargs.pop("checkmark_color"))
+            require_redraw = True
+
         if "text_color" in kwargs:
             self._text_color = self._check_color_type(kwargs.pop("text_color"))
             require_redraw = True
 
+        if "text_color_disabled" in kwargs:
+            self._text_color_disabled = self._check_color_type(kwargs.pop("text_color_disabled"))
+            require_redraw = True
+
         if "border_color" in kwargs:
             self._border_color = self._check_color_type(kwargs.pop("border_color"))
             require_redraw = True
 
         if "hover" in kwargs:
             self._hover = kwargs.pop("hover")
+            self._update_visual_states()
 
         if "command" in kwargs:
             self._command = kwargs.pop("command")
 
         if "textvariable" in kwargs:
             self._textvariable = kwargs.pop("textvariable")
-            self._text_label.configure(textvariable=self._textvariable)
+            if self._canvas_text is not None:
+                self._canvas_text.set_textvariable(self._textvariable)
+                self._position_canvas_text()
+            else:
+                self._text_label.configure(textvariable=self._textvariable)
 
         if "variable" in kwargs:
             if self._variable is not None and self._variable != "":
@@ -355,6 +437,38 @@ class CTkCheckBox(CTkBaseClass):
                     if self._text_label is not None:
                         self._text_label.configure(cursor="hand2")
 
+    def _bind_hover(self, widget: tkinter.Misc, tag: str = None):
+        if self._visual_states is not None:
+            self._visual_states.bind(widget, tag=tag)
+        elif tag is not None:
+            widget.tag_bind(tag, "<Enter>", self._on_enter)
+            widget.tag_bind(tag, "<Leave>", self._on_leave)
+        else:
+            SharedBindings.bind(widget, "<Enter>", self._on_enter)
+            SharedBindings.bind(widget, "<Leave>", self._on_leave)
+
+    def _update_visual_states(self):
+        """ precompute colors of inner and border parts for normal and hover state (native hover only) """
+        if self._visual_states is None:
+            return
+
+        if self._check_state is True:
+            inner_color, border_color = self._fg_color, self._fg_color
+        else:
+            inner_color, border_color = self._bg_color, self._border_color
+
+        if self._hover is True and self._state == tkinter.NORMAL:
+            hover_inner_color = self._hover_color
+            hover_border_color = self._hover_color if self._check_state is True else border_color
+        else:
+            hover_inner_color, hover_border_color = inner_color, border_color
+
+        for state, (inner, border) in (("normal", (inner_color, border_color)), ("hover", (hover_inner_color, hover_border_color))):
+            inner, border = self._apply_appearance_mode(inner), self._apply_appearance_mode(border)
+            self._visual_states.set_state(state, item_options=[("inner_parts", {"fill": inner, "outline": inner}),
+                                                               ("border_parts", {"fill": border, "outline": border})])
+        self._visual_states.apply()
+
     def _on_enter(self, event=0):
         if self._hover is True and self._state == tkinter.NORMAL:
             if self._check_state is True:
@@ -439,10 +553,16 @@ class CTkCheckBox(CTkBaseClass):
         return self._canvas.unbind(sequence, funcid)
 
     def focus(self):
+        if self._canvas_text is not None:
+            return self._canvas.focus()
         return self._text_label.focus()
 
     def focus_set(self):
+        if self._canvas_text is not None:
+            return self._canvas.focus_set()
         return self._text_label.focus_set()
 
     def focus_force(self):
+        if self._canvas_text is not None:
+            return self._canvas.focus_force()
         return self._text_label.focus_force()
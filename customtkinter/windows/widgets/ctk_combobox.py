@@ -151,7 +151,7 @@ class CTkComboBox(CTkBaseClass):
 
     def _update_font(self):
         """ pass font to tkinter widgets with applied font scaling and update grid with workaround """
-        self._entry.configure(font=self._apply_font_scaling(self._font))
+        self._configure_scaled_font(self._entry, self._apply_font_scaling(self._font))
 
         # Workaround to force grid to be resized when text changes size.
         # Otherwise grid will lag and only resizes if other mouse action occurs.
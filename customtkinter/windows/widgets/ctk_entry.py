@@ -2,10 +2,11 @@ import tkinter
 from typing import Union, Tuple, Optional
 
 from .core_rendering import CTkCanvas
-from .theme import ThemeManager
 from .core_rendering import DrawEngine
 from .core_widget_classes import CTkBaseClass
+from .core_widget_classes import SharedBindings
 from .font import CTkFont
+from .style import CTkStyle
 from .utility import pop_from_dict_by_set, check_kwargs_empty
 
 
@@ -22,6 +23,10 @@ class CTkEntry(CTkBaseClass):
                                   "insertontime", "insertwidth", "justify", "selectborderwidth",
                                   "show", "takefocus", "validate", "validatecommand", "xscrollcommand"}
 
+    # attributes that can be set by a CTkStyle:
+    _style_attributes: set = {"corner_radius", "border_width", "fg_color", "border_color", "text_color",
+                              "placeholder_text_color", "font"}
+
     def __init__(self,
                  master: any,
                  width: int = 140,
@@ -39,24 +44,25 @@ class CTkEntry(CTkBaseClass):
                  placeholder_text: Union[str, None] = None,
                  font: Optional[Union[tuple, CTkFont]] = None,
                  state: str = tkinter.NORMAL,
+                 style: Optional[CTkStyle] = None,
                  **kwargs):
 
-        # transfer basic functionality (bg_color, size, appearance_mode, scaling) to CTkBaseClass
-        super().__init__(master=master, bg_color=bg_color, width=width, height=height)
+        # transfer basic functionality (bg_color, size, appearance_mode, scaling, style) to CTkBaseClass
+        super().__init__(master=master, bg_color=bg_color, width=width, height=height, style=style)
 
         # configure grid system (1x1)
         self.grid_rowconfigure(0, weight=1)
         self.grid_columnconfigure(0, weight=1)
 
         # color
-        self._fg_color = ThemeManager.theme["CTkEntry"]["fg_color"] if fg_color is None else self._check_color_type(fg_color, transparency=True)
-        self._text_color = ThemeManager.theme["CTkEntry"]["text_color"] if text_color is None else self._check_color_type(text_color)
-        self._placeholder_text_color = ThemeManager.theme["CTkEntry"]["placeholder_text_color"] if placeholder_text_color is None else self._check_color_type(placeholder_text_color)
-        self._border_color = ThemeManager.theme["CTkEntry"]["border_color"] if border_color is None else self._check_color_type(border_color)
+        self._fg_color = self._get_style_attribute("fg_color", fg_color, "CTkEntry", transparency=True)
+        self._text_color = self._get_style_attribute("text_color", text_color, "CTkEntry")
+        self._placeholder_text_color = self._get_style_attribute("placeholder_text_color", placeholder_text_color, "CTkEntry")
+        self._border_color = self._get_style_attribute("border_color", border_color, "CTkEntry")
 
         # shape
-        self._corner_radius = ThemeManager.theme["CTkEntry"]["corner_radius"] if corner_radius is None else corner_radius
-        self._border_width = ThemeManager.theme["CTkEntry"]["border_width"] if border_width is None else border_width
+        self._corner_radius = self._get_style_attribute("corner_radius", corner_radius, "CTkEntry")
+        self._border_width = self._get_style_attribute("border_width", border_width, "CTkEntry")
 
         # text and state
         self._is_focused: bool = True
@@ -68,7 +74,7 @@ class CTkEntry(CTkBaseClass):
         self._textvariable_callback_name: str = ""
 
         # font
-        self._font = CTkFont() if font is None else self._check_font_type(font)
+        self._font = self._get_style_attribute("font", font, "CTkEntry")
         if isinstance(self._font, CTkFont):
             self._font.add_size_configure_callback(self._update_font)
 
@@ -94,8 +100,8 @@ class CTkEntry(CTkBaseClass):
 
         check_kwargs_empty(kwargs, raise_error=True)
 
-        self._entry.bind('<FocusOut>', self._entry_focus_out)
-        self._entry.bind('<FocusIn>', self._entry_focus_in)
+        SharedBindings.bind(self._entry, "<FocusOut>", self._entry_focus_out)
+        SharedBindings.bind(self._entry, "<FocusIn>", self._entry_focus_in)
 
         self._activate_placeholder()
         self._draw()
@@ -133,7 +139,7 @@ class CTkEntry(CTkBaseClass):
 
     def _update_font(self):
         """ pass font to tkinter widgets with applied font scaling and update grid with workaround """
-        self._entry.configure(font=self._apply_font_scaling(self._font))
+        self._configure_scaled_font(self._entry, self._apply_font_scaling(self._font))
 
         # Workaround to force grid to be resized when text changes size.
         # Otherwise grid will lag and only resizes if other mouse action occurs.
@@ -186,6 +192,8 @@ class CTkEntry(CTkBaseClass):
                                    insertbackground=self._apply_appearance_mode(self._text_color))
 
     def configure(self, require_redraw=False, **kwargs):
+        self._update_style_overrides(kwargs)
+
         if "state" in kwargs:
             self._state = kwargs.pop("state")
             self._entry.configure(state=self._state)
@@ -4,6 +4,7 @@ from .core_rendering import CTkCanvas
 from .theme import ThemeManager
 from .core_rendering import DrawEngine
 from .core_widget_classes import CTkBaseClass
+from .style import CTkStyle
 
 
 class CTkFrame(CTkBaseClass):
@@ -14,6 +15,9 @@ class CTkFrame(CTkBaseClass):
     For detailed information check out the documentation.
     """
 
+    # attributes that can be set by a CTkStyle:
+    _style_attributes: set = {"corner_radius", "border_width", "fg_color", "border_color"}
+
     def __init__(self,
                  master: any,
                  width: int = 200,
@@ -27,16 +31,19 @@ class CTkFrame(CTkBaseClass):
                  background_corner_colors: Union[Tuple[Union[str, Tuple[str, str]]], None] = None,
 
                  overwrite_preferred_drawing_method: Union[str, None] = None,
+                 style: Optional[CTkStyle] = None,
                  **kwargs):
 
-        # transfer basic functionality (_bg_color, size, __appearance_mode, scaling) to CTkBaseClass
-        super().__init__(master=master, bg_color=bg_color, width=width, height=height, **kwargs)
+        # transfer basic functionality (_bg_color, size, __appearance_mode, scaling, style) to CTkBaseClass
+        super().__init__(master=master, bg_color=bg_color, width=width, height=height, style=style, **kwargs)
 
         # color
-        self._border_color = ThemeManager.theme["CTkFrame"]["border_color"] if border_color is None else self._check_color_type(border_color)
+        self._border_color = self._get_style_attribute("border_color", border_color, "CTkFrame")
 
         # determine fg_color of frame
-        if fg_color is None:
+        if fg_color is None and self._style is not None and "fg_color" in self._style:
+            self._fg_color = self._get_style_attribute("fg_color", fg_color, "CTkFrame")
+        elif fg_color is None:
             if isinstance(self.master, CTkFrame):
                 if self.master._fg_color == ThemeManager.theme["CTkFrame"]["fg_color"]:
                     self._fg_color = ThemeManager.theme["CTkFrame"]["top_fg_color"]
@@ -45,13 +52,13 @@ class CTkFrame(CTkBaseClass):
             else:
                 self._fg_color = ThemeManager.theme["CTkFrame"]["fg_color"]
         else:
-            self._fg_color = self._check_color_type(fg_color, transparency=True)
+            self._fg_color = self._get_style_attribute("fg_color", fg_color, "CTkFrame", transparency=True)
 
         self._background_corner_colors = background_corner_colors  # rendering options for DrawEngine
 
         # shape
-        self._corner_radius = ThemeManager.theme["CTkFrame"]["corner_radius"] if corner_radius is None else corner_radius
-        self._border_width = ThemeManager.theme["CTkFrame"]["border_width"] if border_width is None else border_width
+        self._corner_radius = self._get_style_attribute("corner_radius", corner_radius, "CTkFrame")
+        self._border_width = self._get_style_attribute("border_width", border_width, "CTkFrame")
 
         self._canvas = CTkCanvas(master=self,
                                  highlightthickness=0,
@@ -132,6 +139,8 @@ class CTkFrame(CTkBaseClass):
         # self._canvas.tag_lower("border_parts")
 
     def configure(self, require_redraw=False, **kwargs):
+        self._update_style_overrides(kwargs)
+
         if "fg_color" in kwargs:
             self._fg_color = self._check_color_type(kwargs.pop("fg_color"), transparency=True)
             require_redraw = True
@@ -0,0 +1,286 @@
+import tkinter
+from collections import OrderedDict
+from typing import Union, Tuple, Optional, List, Dict, Any
+try:
+    import numpy as np
+except ImportError:
+    pass
+
+from .core_rendering import CTkCanvas
+from .core_widget_classes import CTkBaseClass
+from .color import ColorManager
+
+
+class CTkHeatmap(CTkBaseClass):
+    """
+    Displays a 2-D NumPy array as image scaled to the widget size (nearest or bilinear interpolation).
+    Values are mapped to colors between vmin and vmax with a cached 256 entry colormap lookup table.
+    colormap can be a name of CTkHeatmap.colormaps, a list of colors or a tuple (light_colormap, dark_colormap).
+    update_region() only renders the part of the widget covered by the changed values.
+    NaN values are displayed with the color of vmin and are ignored for the default vmin and vmax.
+    A copy of the data is kept, so configuring vmin or vmax maps the displayed values again.
+    Requires NumPy. For detailed information check out the documentation.
+    """
+
+    colormaps: Dict[str, List[str]] = {
+        "viridis": ["#440154", "#482878", "#3E4989", "#31688E", "#26828E", "#1F9E89", "#35B779", "#6DCD59", "#B4DE2C", "#FDE725"],
+        "magma": ["#000004", "#180F3D", "#440F76", "#721F81", "#9E2F7F", "#CD4071", "#F1605D", "#FD9668", "#FEC98D", "#FCFDBF"],
+        "inferno": ["#000004", "#1B0C41", "#4A0C6B", "#781C6D", "#A52C60", "#CF4446", "#ED6925", "#FB9B06", "#F7D13D", "#FCFFA4"],
+        "coolwarm": ["#3B4CC0", "#6F92F3", "#AAC7FD", "#DDDDDD", "#F7B89C", "#E7745B", "#B40426"],
+        "gray": ["#000000", "#FFFFFF"],
+        "gray_reversed": ["#FFFFFF", "#000000"],
+    }
+    _lut_cache: Dict[tuple, "np.ndarray"] = {}  # tuple of colormap colors -> lookup table (256 x 3, uint8)
+    _sample_cache: OrderedDict = OrderedDict()  # LRU cache, (source length, output length, interpolation) -> sample positions
+    _sample_cache_max_size: int = 64  # maximum number of cached sample positions of all heatmaps
+
+    def __init__(self,
+                 master: any,
+                 width: int = 200,
+                 height: int = 200,
+
+                 bg_color: Union[str, Tuple[str, str]] = "transparent",
+
+                 data: Any = None,
+                 colormap: Union[str, List[str], Tuple[Union[str, List[str]], Union[str, List[str]]]] = "viridis",
+                 vmin: Optional[float] = None,
+                 vmax: Optional[float] = None,
+                 interpolation: str = "nearest",
+                 **kwargs):
+
+        try:
+            _ = np
+        except NameError:
+            raise ImportError("CTkHeatmap: numpy couldn't be imported")
+
+        # transfer basic functionality (_bg_color, size, __appearance_mode, scaling) to CTkBaseClass
+        super().__init__(master=master, bg_color=bg_color, width=width, height=height, **kwargs)
+
+        self._colormap = colormap
+        self._vmin = vmin
+        self._vmax = vmax
+        self._interpolation = self._check_interpolation(interpolation)
+
+        self._data: Union["np.ndarray", None] = None  # copy of the displayed values
+        self._indices: Union["np.ndarray", None] = None  # data normalized to colormap indices (uint8)
+        self._current_vmin: float = 0  # vmin and vmax used for _indices
+        self._current_vmax: float = 1
+        self._rendered_lut: Union["np.ndarray", None] = None
+        self._rendered_size: Tuple[int, int] = (0, 0)
+
+        self.grid_rowconfigure(0, weight=1)
+        self.grid_columnconfigure(0, weight=1)
+
+        self._canvas = CTkCanvas(master=self,
+                                 highlightthickness=0,
+                                 width=self._apply_widget_scaling(self._desired_width),
+                                 height=self._apply_widget_scaling(self._desired_height))
+        self._canvas.grid(row=0, column=0, sticky="nswe")
+        self._photo_image = tkinter.PhotoImage(master=self, width=1, height=1)
+        self._canvas.create_image(0, 0, image=self._photo_image, anchor="nw", tags="heatmap_image")
+
+        if data is not None:
+            self.set_data(data)
+        else:
+            self._draw()
+
+    @staticmethod
+    def _check_interpolation(interpolation: str) -> str:
+        if interpolation not in ("nearest", "bilinear"):
+            raise ValueError(f"CTkHeatmap: interpolation must be 'nearest' or 'bilinear', not '{interpolation}'")
+        return interpolation
+
+    def _set_scaling(self, *args, **kwargs):
+        super()._set_scaling(*args, **kwargs)
+
+        self._canvas.configure(width=self._apply_widget_scaling(self._desired_width),
+                               height=self._apply_widget_scaling(self._desired_height))
+        self._draw(no_color_updates=True)
+
+    def _set_dimensions(self, width=None, height=None):
+        super()._set_dimensions(width, height)
+
+        self._canvas.configure(width=self._apply_widget_scaling(self._desired_width),
+                               height=self._apply_widget_scaling(self._desired_height))
+        self._draw()
+
+    def _draw(self, no_color_updates=False):
+        super()._draw(no_color_updates)
+
+        if no_color_updates is False:
+            self._canvas.configure(bg=self._apply_appearance_mode(self._bg_color))
+
+        output_size = (round(self._apply_widget_scaling(self._current_width)), round(self._apply_widget_scaling(self._current_height)))
+        if self._indices is None:
+            return
+
+        # render complete image only if size or colormap (appearance mode) changed
+        if output_size != self._rendered_size or self._get_lut() is not self._rendered_lut:
+            self._photo_image.configure(width=output_size[0], height=output_size[1])
+            self._rendered_size = output_size
+            self._render_rect(0, 0, output_size[0], output_size[1])
+
+    def configure(self, require_redraw=False, **kwargs):
+        if "colormap" in kwargs:
+            self._colormap = kwargs.pop("colormap")
+            require_redraw = True
+
+        if "interpolation" in kwargs:
+            self._interpolation = self._check_interpolation(kwargs.pop("interpolation"))
+            self._rendered_size = (0, 0)
+            require_redraw = True
+
+        if "vmin" in kwargs or "vmax" in kwargs:
+            self._vmin = kwargs.pop("vmin", self._vmin)
+            self._vmax = kwargs.pop("vmax", self._vmax)
+            if self._data is not None and "data" not in kwargs:
+                self._set_value_range(self._data, self._vmin, self._vmax)
+                self._indices = self._normalize(self._data)
+                self._render_rect(0, 0, *self._rendered_size)
+
+        if "data" in kwargs:
+            self.set_data(kwargs.pop("data"))
+
+        super().configure(require_redraw=require_redraw, **kwargs)
+
+    def cget(self, attribute_name: str) -> any:
+        if attribute_name == "colormap":
+            return self._colormap
+        elif attribute_name == "vmin":
+            return self._vmin
+        elif attribute_name == "vmax":
+            return self._vmax
+        elif attribute_name == "interpolation":
+            return self._interpolation
+        elif attribute_name == "data_shape":
+            return None if self._indices is None else self._indices.shape
+
+        else:
+            return super().cget(attribute_name)
+
+    def set_data(self, data: "np.ndarray", vmin: Optional[float] = None, vmax: Optional[float] = None):
+        """ display new 2-D array, vmin and vmax default to the configured values or the range of data """
+        data = np.asarray(data)
+        if data.ndim != 2 or data.size == 0:
+            raise ValueError(f"CTkHeatmap: data must be a non empty 2-D array, not shape {data.shape}")
+
+        self._set_value_range(data, self._vmin if vmin is None else vmin, self._vmax if vmax is None else vmax)
+
+        shape_changed = self._indices is None or self._indices.shape != data.shape
+        self._data = data.copy()  # values of update_region() are written into the copy, not into the array of the caller
+        self._indices = self._normalize(data)
+
+        if shape_changed:
+            self._rendered_size = (0, 0)
+            self._draw(no_color_updates=True)
+        else:
+            self._render_rect(0, 0, *self._rendered_size)
+
+    def update_region(self, row: int, column: int, values: "np.ndarray"):
+        """ replace values starting at row and column, only the covered part of the image gets rendered again """
+        if self._indices is None:
+            raise ValueError("CTkHeatmap: update_region() needs data, use set_data() first")
+
+        values = np.asarray(values)
+        if values.ndim != 2 or row < 0 or column < 0 or row + values.shape[0] > self._indices.shape[0] or column + values.shape[1] > self._indices.shape[1]:
+            raise ValueError(f"CTkHeatmap: region of shape {values.shape} at ({row}, {column}) is outside of data with shape {self._indices.shape}")
+
+        if not np.can_cast(values.dtype, self._data.dtype):
+            self._data = self._data.astype(np.result_type(self._data, values))  # for example float values in int data
+        self._data[row:row + values.shape[0], column:column + values.shape[1]] = values
+        self._indices[row:row + values.shape[0], column:column + values.shape[1]] = self._normalize(values)
+
+        # bilinear output pixels also depend on the neighbouring values
+        margin = 1 if self._interpolation == "bilinear" else 0
+        rows, columns = self._indices.shape
+        output_width, output_height = self._rendered_size
+        x_1 = max(0, -(-(column - margin) * output_width // columns))
+        y_1 = max(0, -(-(row - margin) * output_height // rows))
+        x_2 = min(output_width, -(-(column + values.shape[1] + margin) * output_width // columns))
+        y_2 = min(output_height, -(-(row + values.shape[0] + margin) * output_height // rows))
+        self._render_rect(x_1, y_1, x_2, y_2)
+
+    def _set_value_range(self, data: "np.ndarray", vmin: Optional[float], vmax: Optional[float]):
+        """ set vmin and vmax used by _normalize(), None defaults to the range of the finite values of data """
+        if vmin is None or vmax is None:
+            finite_data = data[np.isfinite(data)] if data.dtype.kind == "f" else data
+            if finite_data.size == 0:
+                finite_data = np.array([0, 1])  # only NaN or infinite values
+            vmin = float(finite_data.min()) if vmin is None else vmin
+            vmax = float(finite_data.max()) if vmax is None else vmax
+        self._current_vmin, self._current_vmax = vmin, vmax
+
+    def _normalize(self, values: "np.ndarray") -> "np.ndarray":
+        """ map values between vmin and vmax to colormap indices 0-255, NaN values are mapped to index 0 like vmin """
+        if values.dtype == np.uint8 and self._current_vmin == 0 and self._current_vmax == 255:
+            return values.copy()
+
+        value_range = self._current_vmax - self._current_vmin
+        factor = 255 / value_range if value_range != 0 else 0
+        indices = (values - self._current_vmin) * factor
+        indices[np.isnan(indices)] = 0  # NaN can not be converted to uint8
+        return np.clip(indices, 0, 255, out=indices).astype(np.uint8)
+
+    def _get_lut(self) -> "np.ndarray":
+        colormap = self._colormap
+        if isinstance(colormap, tuple) and len(colormap) == 2:
+            colormap = colormap[0] if self._get_appearance_mode() == "light" else colormap[1]
+        if isinstance(colormap, str):
+            if colormap not in self.colormaps:
+                raise ValueError(f"CTkHeatmap: colormap '{colormap}' does not exist, possible values: {list(self.colormaps.keys())}")
+            colormap = self.colormaps[colormap]
+
+        colormap = tuple(colormap)
+        lut = CTkHeatmap._lut_cache.get(colormap)
+        if lut is None:
+            if len(colormap) < 2:
+                raise ValueError(f"CTkHeatmap: colormap must have at least two colors, not {colormap}")
+            rgb_values = [ColorManager.to_rgb(color, self) for color in colormap]
+            colors = np.array([((rgb >> 16) & 0xFF, (rgb >> 8) & 0xFF, rgb & 0xFF) for rgb in rgb_values], dtype=np.float64)
+            stop_positions, lut_positions = np.linspace(0, 1, len(colormap)), np.linspace(0, 1, 256)
+            lut = np.stack([np.interp(lut_positions, stop_positions, colors[:, channel]) for channel in range(3)], axis=1)
+            lut = np.round(lut).astype(np.uint8)
+            CTkHeatmap._lut_cache[colormap] = lut
+        return lut
+
+    def _get_samples(self, source_length: int, output_length: int) -> tuple:
+        """ returns source indices (nearest) or lower indices, upper indices and weights (bilinear) for every output pixel """
+        cache_key = (source_length, output_length, self._interpolation)
+        samples = CTkHeatmap._sample_cache.get(cache_key)
+        if samples is not None:
+            CTkHeatmap._sample_cache.move_to_end(cache_key)
+        else:
+            if self._interpolation == "nearest":
+                samples = (np.arange(output_length) * source_length // output_length,)
+            else:
+                positions = np.clip((np.arange(output_length) + 0.5) * source_length / output_length - 0.5, 0, source_length - 1)
+                lower = np.floor(positions).astype(np.intp)
+                samples = (lower, np.minimum(lower + 1, source_length - 1), (positions - lower).astype(np.float32))
+            CTkHeatmap._sample_cache[cache_key] = samples
+            if len(CTkHeatmap._sample_cache) > self._sample_cache_max_size:
+                CTkHeatmap._sample_cache.popitem(last=False)  # remove least recently used samples
+        return samples
+
+    def _render_rect(self, x_1: int, y_1: int, x_2: int, y_2: int):
+        """ render output pixels of rectangle (x_1, y_1) to (x_2, y_2) and write them into the photo image in place """
+        if x_2 <= x_1 or y_2 <= y_1:
+            return
+
+        lut = self._get_lut()
+        rows, columns = self._indices.shape
+        y_samples = [samples[y_1:y_2] for samples in self._get_samples(rows, self._rendered_size[1])]
+        x_samples = [samples[x_1:x_2] for samples in self._get_samples(columns, self._rendered_size[0])]
+
+        if self._interpolation == "nearest":
+            indices = self._indices[np.ix_(y_samples[0], x_samples[0])]
+        else:
+            (top, bottom, y_weights), (left, right, x_weights) = y_samples, x_samples
+            y_weights, x_weights = y_weights[:, None], x_weights[None, :]
+            upper = self._indices[np.ix_(top, left)] * (1 - x_weights) + self._indices[np.ix_(top, right)] * x_weights
+            lower = self._indices[np.ix_(bottom, left)] * (1 - x_weights) + self._indices[np.ix_(bottom, right)] * x_weights
+            indices = np.round(upper * (1 - y_weights) + lower * y_weights).astype(np.uint8)
+
+        # binary PPM data is read by Tk without conversion
+        ppm_data = b"P6 %d %d 255\n" % (x_2 - x_1, y_2 - y_1) + lut[indices].tobytes()
+        self._photo_image.tk.call(self._photo_image.name, "put", ppm_data, "-to", x_1, y_1)
+        self._rendered_lut = lut
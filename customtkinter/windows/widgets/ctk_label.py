@@ -2,24 +2,39 @@ import tkinter
 from typing import Union, Tuple, Callable, Optional
 
 from .core_rendering import CTkCanvas
-from .theme import ThemeManager
 from .core_rendering import DrawEngine
+from .core_rendering import CanvasText
 from .core_widget_classes import CTkBaseClass
-from .font import CTkFont
+from .font import CTkFont, FontManager
 from .image import CTkImage
+from .color import ColorManager
+from .style import CTkStyle
 from .utility import pop_from_dict_by_set, check_kwargs_empty
 
 
 class CTkLabel(CTkBaseClass):
     """
     Label with rounded corners. Default is fg_color=None (transparent fg_color).
+    With ellipsis=True, the label keeps its width (given by width or the geometry manager)
+    and single line text that does not fit is truncated with '…'.
+    With CTkLabel.single_canvas_rendering = True, labels created afterwards draw text and image as items
+    on the canvas instead of using a tkinter.Label, so every label is a single canvas.
     For detailed information check out the documentation.
     """
 
+    single_canvas_rendering: bool = False
+
     # attributes that are passed to and managed by the tkinter entry only:
     _valid_tk_label_attributes = {"cursor", "justify", "padx", "pady",
                                   "textvariable", "state", "takefocus", "underline"}
 
+    # default values of the tkinter.Label attributes with single canvas rendering:
+    _tk_label_attribute_defaults = {"cursor": "", "justify": "center", "padx": 0, "pady": 0,
+                                    "textvariable": "", "state": "normal", "takefocus": "0", "underline": -1}
+
+    # attributes that can be set by a CTkStyle:
+    _style_attributes: set = {"corner_radius", "fg_color", "text_color", "font"}
+
     def __init__(self,
                  master: any,
                  width: int = 0,
@@ -36,37 +51,44 @@ class CTkLabel(CTkBaseClass):
                  compound: str = "center",
                  anchor: str = "center",  # label anchor: center, n, e, s, w
                  wraplength: int = 0,
+                 ellipsis: bool = False,
+                 style: Optional[CTkStyle] = None,
                  **kwargs):
 
-        # transfer basic functionality (_bg_color, size, __appearance_mode, scaling) to CTkBaseClass
-        super().__init__(master=master, bg_color=bg_color, width=width, height=height)
+        # transfer basic functionality (_bg_color, size, __appearance_mode, scaling, style) to CTkBaseClass
+        super().__init__(master=master, bg_color=bg_color, width=width, height=height, style=style)
 
         # color
-        self._fg_color = ThemeManager.theme["CTkLabel"]["fg_color"] if fg_color is None else self._check_color_type(fg_color, transparency=True)
-        self._text_color = ThemeManager.theme["CTkLabel"]["text_color"] if text_color is None else self._check_color_type(text_color)
+        self._fg_color = self._get_style_attribute("fg_color", fg_color, "CTkLabel", transparency=True)
+        self._text_color = self._get_style_attribute("text_color", text_color, "CTkLabel")
 
         # shape
-        self._corner_radius = ThemeManager.theme["CTkLabel"]["corner_radius"] if corner_radius is None else corner_radius
+        self._corner_radius = self._get_style_attribute("corner_radius", corner_radius, "CTkLabel")
 
         # text
         self._anchor = anchor
         self._text = text
         self._wraplength = wraplength
+        self._ellipsis = ellipsis
+        self._displayed_text = text
 
         # image
         self._image = self._check_image_type(image)
         self._compound = compound
+        self._photo_image = None  # scaled photo image currently displayed
         if isinstance(self._image, CTkImage):
             self._image.add_configure_callback(self._update_image)
 
         # font
-        self._font = CTkFont() if font is None else self._check_font_type(font)
+        self._font = self._get_style_attribute("font", font, "CTkLabel")
         if isinstance(self._font, CTkFont):
             self._font.add_size_configure_callback(self._update_font)
 
         # configure grid system (1x1)
         self.grid_rowconfigure(0, weight=1)
         self.grid_columnconfigure(0, weight=1)
+        if self._ellipsis:
+            self.grid_propagate(False)  # label width is given by width or geometry manager, not by text
 
         self._canvas = CTkCanvas(master=self,
                                  highlightthickness=0,
@@ -75,17 +97,31 @@ class CTkLabel(CTkBaseClass):
         self._canvas.grid(row=0, column=0, sticky="nswe")
         self._draw_engine = DrawEngine(self._canvas)
 
-        self._label = tkinter.Label(master=self,
-                                    highlightthickness=0,
-                                    padx=0,
-                                    pady=0,
-                                    borderwidth=0,
-                                    anchor=self._anchor,
-                                    compound=self._compound,
-                                    wraplength=self._apply_widget_scaling(self._wraplength),
-                                    text=self._text,
-                                    font=self._apply_font_scaling(self._font))
-        self._label.configure(**pop_from_dict_by_set(kwargs, self._valid_tk_label_attributes))
+        # single canvas rendering: text and image are canvas items, positioned by _position_canvas_content()
+        self._single_canvas_rendering: bool = self.single_canvas_rendering
+        self._label: Union[tkinter.Label, None] = None
+        self._canvas_text: Union[CanvasText, None] = None
+        self._image_item: Union[int, None] = None
+        self._label_attributes: dict = {}  # tkinter.Label attributes which are applied to the canvas items
+        self._canvas_requested_size: Tuple[float, float] = (0, 0)
+
+        if self._single_canvas_rendering:
+            self._canvas_text = CanvasText(self._canvas, text_change_callback=self._position_canvas_content)
+            self._canvas_text.configure(text=self._text, justify=tkinter.CENTER, font=self._apply_font_scaling(self._font),
+                                        width=self._apply_widget_scaling(self._wraplength))
+            self._configure_label_attributes(pop_from_dict_by_set(kwargs, self._valid_tk_label_attributes))
+        else:
+            self._label = tkinter.Label(master=self,
+                                        highlightthickness=0,
+                                        padx=0,
+                                        pady=0,
+                                        borderwidth=0,
+                                        anchor=self._anchor,
+                                        compound=self._compound,
+                                        wraplength=self._apply_widget_scaling(self._wraplength),
+                                        text=self._text,
+                                        font=self._apply_font_scaling(self._font))
+            self._label.configure(**pop_from_dict_by_set(kwargs, self._valid_tk_label_attributes))
 
         check_kwargs_empty(kwargs, raise_error=True)
 
@@ -97,8 +133,12 @@ class CTkLabel(CTkBaseClass):
         super()._set_scaling(*args, **kwargs)
 
         self._canvas.configure(width=self._apply_widget_scaling(self._desired_width), height=self._apply_widget_scaling(self._desired_height))
-        self._label.configure(font=self._apply_font_scaling(self._font))
-        self._label.configure(wraplength=self._apply_widget_scaling(self._wraplength))
+        self._canvas_requested_size = (0, 0)  # canvas can grow again in _position_canvas_content()
+        if self._canvas_text is not None:
+            self._canvas_text.configure(font=self._apply_font_scaling(self._font), width=self._apply_widget_scaling(self._wraplength))
+        else:
+            self._label.configure(font=self._apply_font_scaling(self._font))
+            self._label.configure(wraplength=self._apply_widget_scaling(self._wraplength))
 
         self._create_grid()
         self._update_image()
@@ -113,12 +153,21 @@ class CTkLabel(CTkBaseClass):
 
         self._canvas.configure(width=self._apply_widget_scaling(self._desired_width),
                                height=self._apply_widget_scaling(self._desired_height))
+        self._canvas_requested_size = (0, 0)  # canvas can grow again in _position_canvas_content()
         self._create_grid()
         self._draw()
 
     def _update_font(self):
         """ pass font to tkinter widgets with applied font scaling and update grid with workaround """
-        self._label.configure(font=self._apply_font_scaling(self._font))
+        if self._canvas_text is not None:
+            self._canvas_text.configure(font=self._apply_font_scaling(self._font))
+            self._update_displayed_text()
+            self._position_canvas_content()
+            return
+
+        self._configure_scaled_font(self._label, self._apply_font_scaling(self._font))
+
+        self._update_displayed_text()
 
         # Workaround to force grid to be resized when text changes size.
         # Otherwise grid will lag and only resizes if other mouse action occurs.
@@ -126,32 +175,101 @@ class CTkLabel(CTkBaseClass):
         self._canvas.grid(row=0, column=0, sticky="nswe")
 
     def _update_image(self):
+        if self._single_canvas_rendering:
+            if isinstance(self._image, CTkImage):
+                self._photo_image = self._image.create_scaled_photo_image(self._get_widget_scaling(), self._get_appearance_mode())
+            else:
+                self._photo_image = self._image
+            self._update_image_item()
+            return
+
         if isinstance(self._image, CTkImage):
-            self._label.configure(image=self._image.create_scaled_photo_image(self._get_widget_scaling(),
-                                                                              self._get_appearance_mode()))
+            # keep reference to the photo image, because it can be removed from the CTkImage cache
+            self._photo_image = self._image.create_scaled_photo_image(self._get_widget_scaling(), self._get_appearance_mode())
+            self._label.configure(image=self._photo_image)
         elif self._image is not None:
             self._label.configure(image=self._image)
 
     def destroy(self):
         if isinstance(self._font, CTkFont):
             self._font.remove_size_configure_callback(self._update_font)
+        if isinstance(self._image, CTkImage):
+            self._image.remove_configure_callback(self._update_image)
+        if self._canvas_text is not None:
+            self._canvas_text.destroy()
         super().destroy()
 
     def _create_grid(self):
         """ configure grid system (1x1) """
+        if self._single_canvas_rendering:
+            self._position_canvas_content()  # canvas is the only child widget
+            return
 
         text_label_grid_sticky = self._anchor if self._anchor != "center" else ""
         self._label.grid(row=0, column=0, sticky=text_label_grid_sticky,
                          padx=self._apply_widget_scaling(min(self._corner_radius, round(self._current_height / 2))))
 
+    def _measure_text(self, text: str) -> int:
+        if isinstance(self._font, CTkFont):
+            return self._font.measure_cached(text, self._get_widget_scaling())
+        else:
+            return FontManager.measure_cached(self, self._scale_font_tuple(self._font), text)
+
+    def _update_displayed_text(self):
+        """ truncate text with ellipsis if it does not fit into the available width, uses cached text measurement """
+        if not self._ellipsis or self._wraplength != 0 or "\n" in self._text:
+            displayed_text = self._text
+        else:
+            available_width = (self._apply_widget_scaling(self._current_width)
+                               - 2 * self._apply_widget_scaling(min(self._corner_radius, round(self._current_height / 2))))
+
+            if self._measure_text(self._text) <= available_width:
+                displayed_text = self._text
+            else:
+                # binary search for the longest prefix that fits together with the ellipsis
+                lower, upper = 0, len(self._text)
+                while lower < upper:
+                    middle = (lower + upper + 1) // 2
+                    if self._measure_text(self._text[:middle] + "…") <= available_width:
+                        lower = middle
+                    else:
+                        upper = middle - 1
+                displayed_text = self._text[:lower] + "…" if lower > 0 else ""
+
+        if displayed_text != self._displayed_text:
+            self._displayed_text = displayed_text
+            if self._canvas_text is not None:
+                self._canvas_text.configure(text=self._displayed_text)
+                self._position_canvas_content()
+            else:
+                self._label.configure(text=self._displayed_text)
+
     def _draw(self, no_color_updates=False):
         super()._draw(no_color_updates)
 
+        if self._ellipsis:
+            self._update_displayed_text()
+
         requires_recoloring = self._draw_engine.draw_rounded_rect_with_border(self._apply_widget_scaling(self._current_width),
                                                                               self._apply_widget_scaling(self._current_height),
                                                                               self._apply_widget_scaling(self._corner_radius),
                                                                               0)
 
+        if self._single_canvas_rendering:
+            if no_color_updates is False or requires_recoloring:
+                self._canvas.itemconfig("inner_parts",
+                                        fill=self._apply_appearance_mode(self._get_background_color()),
+                                        outline=self._apply_appearance_mode(self._get_background_color()))
+                self._canvas_text.configure(fill=self._apply_appearance_mode(self._get_text_color()))
+                self._canvas.configure(bg=self._apply_appearance_mode(self._bg_color))
+
+            # draw engine can create new shapes on top of text and image
+            if requires_recoloring:
+                self._canvas.tag_raise("text_item")
+                self._canvas.tag_raise("image_item")
+            self._position_canvas_content()
+            return
+
         if no_color_updates is False or requires_recoloring:
             if self._apply_appearance_mode(self._fg_color) == "transparent":
                 self._canvas.itemconfig("inner_parts",
@@ -170,7 +288,78 @@ class CTkLabel(CTkBaseClass):
 
             self._canvas.configure(bg=self._apply_appearance_mode(self._bg_color))
 
+    def _get_background_color(self) -> Union[str, Tuple[str, str]]:
+        return self._bg_color if self._apply_appearance_mode(self._fg_color) == "transparent" else self._fg_color
+
+    def _get_text_color(self) -> Union[str, Tuple[str, str]]:
+        """ text color of the canvas text item, faded like the tkinter.Label disabled foreground if state is disabled """
+        if self._label_attributes.get("state") == tkinter.DISABLED:
+            return ColorManager.derive_disabled_color(self._text_color, self._get_background_color(), widget=self)
+        return self._text_color
+
+    def _update_image_item(self):
+        """ create, update or delete image canvas item (single canvas rendering) """
+        if self._photo_image is None:
+            if self._image_item is not None:
+                self._canvas.delete(self._image_item)
+                self._image_item = None
+        else:
+            if self._image_item is None:
+                self._image_item = self._canvas.create_image(0, 0, tags="image_item")
+            self._canvas.itemconfigure(self._image_item, image=self._photo_image)
+        self._position_canvas_content()
+
+    def _position_canvas_content(self):
+        """ place text and image items according to compound and anchor, replaces the grid of the tkinter.Label """
+        text_size = self._canvas_text.get_size(self._font, self._get_widget_scaling())
+        image_size = None
+        if self._image_item is not None:
+            image_size = (self._photo_image.width(), self._photo_image.height())
+
+        # same padding as the grid of the tkinter.Label, padx and pady of the tkinter.Label are not scaled
+        padding_x = (self._apply_widget_scaling(min(self._corner_radius, round(self._current_height / 2)))
+                     + self._label_attributes.get("padx", 0))
+        padding_y = self._label_attributes.get("pady", 0)
+        width, height = self._apply_widget_scaling(self._current_width), self._apply_widget_scaling(self._current_height)
+        content_size, text_position, image_position = CanvasText.layout(text_size if image_size is None or text_size != (0, 0) else None,
+                                                                        image_size, self._compound, self._anchor,
+                                                                        width, height, padding_x, padding_y, 0)
+
+        # grow canvas if content does not fit, like the grid with the tkinter.Label, except for ellipsis
+        if not self._ellipsis:
+            canvas_width = max(self._apply_widget_scaling(self._desired_width), content_size[0] + 2 * padding_x)
+            canvas_height = max(self._apply_widget_scaling(self._desired_height), content_size[1] + 2 * padding_y)
+            if (canvas_width, canvas_height) != self._canvas_requested_size:
+                self._canvas_requested_size = (canvas_width, canvas_height)
+                self._canvas.configure(width=canvas_width, height=canvas_height)
+
+        self._canvas_text.place(*text_position)
+        if image_size is not None:
+            self._canvas.coords(self._image_item, round(image_position[0]), round(image_position[1]))
+            self._canvas.itemconfigure(self._image_item, anchor=image_position[2])
+
+    def _configure_label_attributes(self, attributes: dict):
+        """ apply tkinter.Label attributes to the canvas items (single canvas rendering) """
+        self._label_attributes.update(attributes)
+
+        if "textvariable" in attributes:
+            self._canvas_text.set_textvariable(attributes["textvariable"])
+        if "justify" in attributes:
+            self._canvas_text.configure(justify=attributes["justify"])
+        if "underline" in attributes:
+            self._canvas_text.configure(underline=attributes["underline"])
+        if "cursor" in attributes:
+            self._canvas.configure(cursor=attributes["cursor"])
+        if "takefocus" in attributes:
+            self._canvas.configure(takefocus=attributes["takefocus"])
+        if "state" in attributes:
+            self._canvas_text.configure(fill=self._apply_appearance_mode(self._get_text_color()))
+        if len(attributes) > 0:
+            self._position_canvas_content()
+
     def configure(self, require_redraw=False, **kwargs):
+        self._update_style_overrides(kwargs)
+
         if "corner_radius" in kwargs:
             self._corner_radius = kwargs.pop("corner_radius")
             self._create_grid()
@@ -186,7 +375,7 @@ class CTkLabel(CTkBaseClass):
 
         if "text" in kwargs:
             self._text = kwargs.pop("text")
-            self._label.configure(text=self._text)
+            self._update_displayed_text()
 
         if "font" in kwargs:
             if isinstance(self._font, CTkFont):
@@ -206,18 +395,35 @@ class CTkLabel(CTkBaseClass):
 
         if "compound" in kwargs:
             self._compound = kwargs.pop("compound")
-            self._label.configure(compound=self._compound)
+            if self._single_canvas_rendering:
+                self._position_canvas_content()
+            else:
+                self._label.configure(compound=self._compound)
 
         if "anchor" in kwargs:
             self._anchor = kwargs.pop("anchor")
-            self._label.configure(anchor=self._anchor)
+            if self._label is not None:
+                self._label.configure(anchor=self._anchor)
             self._create_grid()
 
         if "wraplength" in kwargs:
             self._wraplength = kwargs.pop("wraplength")
-            self._label.configure(wraplength=self._apply_widget_scaling(self._wraplength))
+            if self._canvas_text is not None:
+                self._canvas_text.configure(width=self._apply_widget_scaling(self._wraplength))
+                self._position_canvas_content()
+            else:
+                self._label.configure(wraplength=self._apply_widget_scaling(self._wraplength))
+            self._update_displayed_text()
 
-        self._label.configure(**pop_from_dict_by_set(kwargs, self._valid_tk_label_attributes))  # configure tkinter.Label
+        if "ellipsis" in kwargs:
+            self._ellipsis = kwargs.pop("ellipsis")
+            self.grid_propagate(not self._ellipsis)
+            self._update_displayed_text()
+
+        if self._single_canvas_rendering:
+            self._configure_label_attributes(pop_from_dict_by_set(kwargs, self._valid_tk_label_attributes))
+        else:
+            self._label.configure(**pop_from_dict_by_set(kwargs, self._valid_tk_label_attributes))  # configure tkinter.Label
         super().configure(require_redraw=require_redraw, **kwargs)  # configure CTkBaseClass
 
     def cget(self, attribute_name: str) -> any:
@@ -241,29 +447,45 @@ class CTkLabel(CTkBaseClass):
             return self._anchor
         elif attribute_name == "wraplength":
             return self._wraplength
+        elif attribute_name == "ellipsis":
+            return self._ellipsis
 
         elif attribute_name in self._valid_tk_label_attributes:
+            if self._single_canvas_rendering:
+                return self._label_attributes.get(attribute_name, self._tk_label_attribute_defaults[attribute_name])
             return self._label.cget(attribute_name)  # cget of tkinter.Label
         else:
             return super().cget(attribute_name)  # cget of CTkBaseClass
 
     def bind(self, sequence: str = None, command: Callable = None, add: str = None) -> str:
         """ called on the tkinter.Label and tkinter.Canvas """
+        if self._single_canvas_rendering:
+            return self._canvas.bind(sequence, command, add)
+
         canvas_bind_return = self._canvas.bind(sequence, command, add)
         label_bind_return = self._label.bind(sequence, command, add)
         return canvas_bind_return + " + " + label_bind_return
 
     def unbind(self, sequence: str, funcid: str = None):
         """ called on the tkinter.Label and tkinter.Canvas """
+        if self._single_canvas_rendering:
+            return self._canvas.unbind(sequence, funcid)
+
         canvas_bind_return, label_bind_return = funcid.split(" + ")
         self._canvas.unbind(sequence, canvas_bind_return)
         self._label.unbind(sequence, label_bind_return)
 
     def focus(self):
+        if self._single_canvas_rendering:
+            return self._canvas.focus()
         return self._label.focus()
 
     def focus_set(self):
+        if self._single_canvas_rendering:
+            return self._canvas.focus_set()
         return self._label.focus_set()
 
     def focus_force(self):
+        if self._single_canvas_rendering:
+            return self._canvas.focus_force()
         return self._label.focus_force()
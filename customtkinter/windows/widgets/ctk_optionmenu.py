@@ -6,6 +6,7 @@ from .core_rendering import CTkCanvas
 from .theme import ThemeManager
 from .core_rendering import DrawEngine
 from .core_widget_classes import CTkBaseClass
+from .core_widget_classes import SharedBindings
 from .core_widget_classes import DropdownMenu
 from .font import CTkFont
 
@@ -119,15 +120,13 @@ class CTkOptionMenu(CTkBaseClass):
                 self.configure(cursor="hand2")
 
         # event bindings
-        self._canvas.bind("<Enter>", self._on_enter)
-        self._canvas.bind("<Leave>", self._on_leave)
-        self._canvas.bind("<Button-1>", self._clicked)
-        self._canvas.bind("<Button-1>", self._clicked)
+        SharedBindings.bind(self._canvas, "<Enter>", self._on_enter)
+        SharedBindings.bind(self._canvas, "<Leave>", self._on_leave)
+        SharedBindings.bind(self._canvas, "<Button-1>", self._clicked)
 
-        self._text_label.bind("<Enter>", self._on_enter)
-        self._text_label.bind("<Leave>", self._on_leave)
-        self._text_label.bind("<Button-1>", self._clicked)
-        self._text_label.bind("<Button-1>", self._clicked)
+        SharedBindings.bind(self._text_label, "<Enter>", self._on_enter)
+        SharedBindings.bind(self._text_label, "<Leave>", self._on_leave)
+        SharedBindings.bind(self._text_label, "<Button-1>", self._clicked)
 
         self._draw()  # initial draw
 
@@ -163,7 +162,7 @@ class CTkOptionMenu(CTkBaseClass):
 
     def _update_font(self):
         """ pass font to tkinter widgets with applied font scaling and update grid with workaround """
-        self._text_label.configure(font=self._apply_font_scaling(self._font))
+        self._configure_scaled_font(self._text_label, self._apply_font_scaling(self._font))
 
         # Workaround to force grid to be resized when text changes size.
         # Otherwise grid will lag and only resizes if other mouse action occurs.
@@ -5,7 +5,9 @@ from typing import Union, Tuple, Callable, Optional
 from .core_rendering import CTkCanvas
 from .theme import ThemeManager
 from .core_rendering import DrawEngine
+from .core_rendering import CanvasText
 from .core_widget_classes import CTkBaseClass
+from .core_widget_classes import SharedBindings
 from .font import CTkFont
 
 
@@ -13,8 +15,12 @@ class CTkRadioButton(CTkBaseClass):
     """
     Radiobutton with rounded corners, border, label, variable support, command.
     For detailed information check out the documentation.
+
+    With CTkRadioButton.single_canvas_rendering = True, the text is drawn as canvas item instead of a tkinter.Label.
     """
 
+    single_canvas_rendering: bool = False
+
     def __init__(self,
                  master: any,
                  width: int = 100,
@@ -99,24 +105,37 @@ class CTkRadioButton(CTkBaseClass):
         self._canvas.grid(row=0, column=0)
         self._draw_engine = DrawEngine(self._canvas)
 
-        self._canvas.bind("<Enter>", self._on_enter)
-        self._canvas.bind("<Leave>", self._on_leave)
-        self._canvas.bind("<Button-1>", self.invoke)
-
-        self._text_label = tkinter.Label(master=self,
-                                         bd=0,
-                                         padx=0,
-                                         pady=0,
-                                         text=self._text,
-                                         justify=tkinter.LEFT,
-                                         font=self._apply_font_scaling(self._font),
-                                         textvariable=self._textvariable)
-        self._text_label.grid(row=0, column=2, sticky="w")
-        self._text_label["anchor"] = "w"
-
-        self._text_label.bind("<Enter>", self._on_enter)
-        self._text_label.bind("<Leave>", self._on_leave)
-        self._text_label.bind("<Button-1>", self.invoke)
+        SharedBindings.bind(self._canvas, "<Enter>", self._on_enter)
+        SharedBindings.bind(self._canvas, "<Leave>", self._on_leave)
+        SharedBindings.bind(self._canvas, "<Button-1>", self.invoke)
+
+        # single canvas rendering: text is a canvas item on the background canvas, placed by _position_canvas_text()
+        self._single_canvas_rendering: bool = self.single_canvas_rendering
+        self._canvas_text: Union[CanvasText, None] = None
+
+        if self._single_canvas_rendering:
+            self._canvas_text = CanvasText(self._bg_canvas, text_change_callback=self._position_canvas_text)
+            self._canvas_text.set_textvariable(self._textvariable)
+            self._canvas_text.configure(text=self._text, justify=tkinter.LEFT, font=self._apply_font_scaling(self._font))
+
+            self._canvas_text.bind("<Enter>", self._on_enter)
+            self._canvas_text.bind("<Leave>", self._on_leave)
+            self._canvas_text.bind("<Button-1>", self.invoke)
+        else:
+            self._text_label = tkinter.Label(master=self,
+                                             bd=0,
+                                             padx=0,
+                                             pady=0,
+                                             text=self._text,
+                                             justify=tkinter.LEFT,
+                                             font=self._apply_font_scaling(self._font),
+                                             textvariable=self._textvariable)
+            self._text_label.grid(row=0, column=2, sticky="w")
+            self._text_label["anchor"] = "w"
+
+            SharedBindings.bind(self._text_label, "<Enter>", self._on_enter)
+            SharedBindings.bind(self._text_label, "<Leave>", self._on_leave)
+            SharedBindings.bind(self._text_label, "<Button-1>", self.invoke)
 
         if self._variable is not None:
             self._variable_callback_name = self._variable.trace_add("write", self._variable_callback)
@@ -129,10 +148,15 @@ class CTkRadioButton(CTkBaseClass):
         super()._set_scaling(*args, **kwargs)
 
         self.grid_columnconfigure(1, weight=0, minsize=self._apply_widget_scaling(6))
-        self._text_label.configure(font=self._apply_font_scaling(self._font))
+        if self._canvas_text is not None:
+            self._canvas_text.configure(font=self._apply_font_scaling(self._font))
+        else:
+            self._text_label.configure(font=self._apply_font_scaling(self._font))
 
         self._bg_canvas.configure(width=self._apply_widget_scaling(self._desired_width),
                                   height=self._apply_widget_scaling(self._desired_height))
+        if self._canvas_text is not None:
+            self._canvas_text.reset_canvas_size()  # background canvas can grow again in _position_canvas_text()
         self._canvas.configure(width=self._apply_widget_scaling(self._radiobutton_width),
                                height=self._apply_widget_scaling(self._radiobutton_height))
         self._draw(no_color_updates=True)
@@ -142,10 +166,17 @@ class CTkRadioButton(CTkBaseClass):
 
         self._bg_canvas.configure(width=self._apply_widget_scaling(self._desired_width),
                                   height=self._apply_widget_scaling(self._desired_height))
+        if self._canvas_text is not None:
+            self._canvas_text.reset_canvas_size()  # background canvas can grow again in _position_canvas_text()
 
     def _update_font(self):
         """ pass font to tkinter widgets with applied font scaling and update grid with workaround """
-        self._text_label.configure(font=self._apply_font_scaling(self._font))
+        if self._canvas_text is not None:
+            self._canvas_text.configure(font=self._apply_font_scaling(self._font))
+            self._position_canvas_text()
+            return
+
+        self._configure_scaled_font(self._text_label, self._apply_font_scaling(self._font))
 
         # Workaround to force grid to be resized when text changes size.
         # Otherwise grid will lag and only resizes if other mouse action occurs.
@@ -159,6 +190,9 @@ class CTkRadioButton(CTkBaseClass):
         if isinstance(self._font, CTkFont):
             self._font.remove_size_configure_callback(self._update_font)
 
+        if self._canvas_text is not None:
+            self._canvas_text.destroy()
+
         super().destroy()
 
     def _draw(self, no_color_updates=False):
@@ -192,12 +226,28 @@ class CTkRadioButton(CTkBaseClass):
                                     outline=self._apply_appearance_mode(self._bg_color),
                                     fill=self._apply_appearance_mode(self._bg_color))
 
-            if self._state == tkinter.DISABLED:
-                self._text_label.configure(fg=self._apply_appearance_mode(self._text_color_disabled))
+            if self._canvas_text is not None:
+                if self._state == tkinter.DISABLED:
+                    self._canvas_text.configure(fill=self._apply_appearance_mode(self._text_color_disabled))
+                else:
+                    self._canvas_text.configure(fill=self._apply_appearance_mode(self._text_color))
             else:
-                self._text_label.configure(fg=self._apply_appearance_mode(self._text_color))
+                if self._state == tkinter.DISABLED:
+                    self._text_label.configure(fg=self._apply_appearance_mode(self._text_color_disabled))
+                else:
+                    self._text_label.configure(fg=self._apply_appearance_mode(self._text_color))
+
+                self._text_label.configure(bg=self._apply_appearance_mode(self._bg_color))
 
-            self._text_label.configure(bg=self._apply_appearance_mode(self._bg_color))
+        if self._canvas_text is not None:
+            self._position_canvas_text()
+
+    def _position_canvas_text(self):
+        """ place text item beside the radiobutton like the text label in grid column 2, background canvas grows to fit the text """
+        self._canvas_text.place_beside(self._apply_widget_scaling(self._radiobutton_width) + self._apply_widget_scaling(6),
+                                       self._apply_widget_scaling(self._current_height),
+                                       self._apply_widget_scaling(self._desired_width), self._apply_widget_scaling(self._desired_height),
+                                       self._font, self._get_widget_scaling())
 
     def configure(self, require_redraw=False, **kwargs):
         if "corner_radius" in kwargs:
@@ -224,7 +274,11 @@ class CTkRadioButton(CTkBaseClass):
 
         if "text" in kwargs:
             self._text = kwargs.pop("text")
-            self._text_label.configure(text=self._text)
+            if self._canvas_text is not None:
+                self._canvas_text.configure(text=self._text)
+                self._position_canvas_text()
+            else:
+                self._text_label.configure(text=self._text)
 
         if "font" in kwargs:
             if isinstance(self._font, CTkFont):
@@ -268,7 +322,11 @@ class CTkRadioButton(CTkBaseClass):
 
         if "textvariable" in kwargs:
             self._textvariable = kwargs.pop("textvariable")
-            self._text_label.configure(textvariable=self._textvariable)
+            if self._canvas_text is not None:
+                self._canvas_text.set_textvariable(self._textvariable)
+                self._position_canvas_text()
+            else:
+                self._text_label.configure(textvariable=self._textvariable)
 
         if "variable" in kwargs:
             if self._variable is not None:
@@ -407,10 +465,16 @@ class CTkRadioButton(CTkBaseClass):
         return self._canvas.unbind(sequence, funcid)
 
     def focus(self):
+        if self._canvas_text is not None:
+            return self._canvas.focus()
         return self._text_label.focus()
 
     def focus_set(self):
+        if self._canvas_text is not None:
+            return self._canvas.focus_set()
         return self._text_label.focus_set()
 
     def focus_force(self):
+        if self._canvas_text is not None:
+            return self._canvas.focus_force()
         return self._text_label.focus_force()
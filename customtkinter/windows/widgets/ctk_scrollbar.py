@@ -4,7 +4,9 @@ from typing import Union, Tuple, Callable, Optional
 from .core_rendering import CTkCanvas
 from .theme import ThemeManager
 from .core_rendering import DrawEngine
+from .core_rendering import VisualStates
 from .core_widget_classes import CTkBaseClass
+from .core_widget_classes import SharedBindings
 
 
 class CTkScrollbar(CTkBaseClass):
@@ -12,8 +14,12 @@ class CTkScrollbar(CTkBaseClass):
     Scrollbar with rounded corners, configurable spacing.
     Connect to scrollable widget by passing .set() method and set command attribute.
     For detailed information check out the documentation.
+
+    With CTkScrollbar.native_hover = True, hover colors are precomputed and switched by Tcl Enter/Leave bindings.
     """
 
+    native_hover: bool = False
+
     def __init__(self,
                  master: any,
                  width: Optional[Union[int, str]] = None,
@@ -71,11 +77,17 @@ class CTkScrollbar(CTkBaseClass):
         self._canvas.place(x=0, y=0, relwidth=1, relheight=1)
         self._draw_engine = DrawEngine(self._canvas)
 
-        self._canvas.bind("<Enter>", self._on_enter)
-        self._canvas.bind("<Leave>", self._on_leave)
+        # native hover: hover colors are precomputed by _update_visual_states() and switched by Tcl bindings
+        self._visual_states: Union[VisualStates, None] = VisualStates(self._canvas) if self.native_hover else None
+
+        if self._visual_states is not None:
+            self._visual_states.bind(self._canvas)
+        else:
+            SharedBindings.bind(self._canvas, "<Enter>", self._on_enter)
+            SharedBindings.bind(self._canvas, "<Leave>", self._on_leave)
         self._canvas.tag_bind("border_parts", "<Button-1>", self._clicked)
-        self._canvas.bind("<B1-Motion>", self._clicked)
-        self._canvas.bind("<MouseWheel>", self._mouse_scroll_event)
+        SharedBindings.bind(self._canvas, "<B1-Motion>", self._clicked)
+        SharedBindings.bind(self._canvas, "<MouseWheel>", self._mouse_scroll_event)
 
         self._draw()
 
@@ -150,8 +162,16 @@ class CTkScrollbar(CTkBaseClass):
                                         fill=self._apply_appearance_mode(self._fg_color),
                                         outline=self._apply_appearance_mode(self._fg_color))
 
+            self._update_visual_states()
+
         self._canvas.update_idletasks()
 
+    def destroy(self):
+        if self._visual_states is not None:
+            self._visual_states.destroy()
+
+        super().destroy()
+
     def configure(self, require_redraw=False, **kwargs):
         if "fg_color" in kwargs:
             self._fg_color = self._check_color_type(kwargs.pop("fg_color"), transparency=True)
@@ -167,6 +187,7 @@ class CTkScrollbar(CTkBaseClass):
 
         if "hover" in kwargs:
             self._hover = kwargs.pop("hover")
+            self._update_visual_states()
 
         if "command" in kwargs:
             self._command = kwargs.pop("command")
@@ -206,6 +227,21 @@ class CTkScrollbar(CTkBaseClass):
         else:
             return super().cget(attribute_name)
 
+    def _update_visual_states(self):
+        """ precompute color of scrollbar parts for normal and hover state (native hover only) """
+        if self._visual_states is None:
+            return
+
+        button_color = self._apply_appearance_mode(self._button_color)
+        if self._hover is True:
+            button_hover_color = self._apply_appearance_mode(self._button_hover_color)
+        else:
+            button_hover_color = button_color
+
+        self._visual_states.set_state("normal", item_options=[("scrollbar_parts", {"fill": button_color, "outline": button_color})])
+        self._visual_states.set_state("hover", item_options=[("scrollbar_parts", {"fill": button_hover_color, "outline": button_hover_color})])
+        self._visual_states.apply()
+
     def _on_enter(self, event=0):
         if self._hover is True:
             self._hover_state = True
@@ -5,15 +5,21 @@ from typing import Union, Tuple, Callable, Optional
 from .core_rendering import CTkCanvas
 from .theme import ThemeManager
 from .core_rendering import DrawEngine
+from .core_rendering import VisualStates
 from .core_widget_classes import CTkBaseClass
+from .core_widget_classes import SharedBindings
 
 
 class CTkSlider(CTkBaseClass):
     """
     Slider with rounded corners, border, number of steps, variable support, vertical orientation.
     For detailed information check out the documentation.
+
+    With CTkSlider.native_hover = True, hover colors are precomputed and switched by Tcl Enter/Leave bindings.
     """
 
+    native_hover: bool = False
+
     def __init__(self,
                  master: any,
                  width: Optional[int] = None,
@@ -96,10 +102,16 @@ class CTkSlider(CTkBaseClass):
         self._canvas.grid(column=0, row=0, rowspan=1, columnspan=1, sticky="nswe")
         self._draw_engine = DrawEngine(self._canvas)
 
-        self._canvas.bind("<Enter>", self._on_enter)
-        self._canvas.bind("<Leave>", self._on_leave)
-        self._canvas.bind("<Button-1>", self._clicked)
-        self._canvas.bind("<B1-Motion>", self._clicked)
+        # native hover: hover colors are precomputed by _update_visual_states() and switched by Tcl bindings
+        self._visual_states: Union[VisualStates, None] = VisualStates(self._canvas) if self.native_hover else None
+
+        if self._visual_states is not None:
+            self._visual_states.bind(self._canvas)
+        else:
+            SharedBindings.bind(self._canvas, "<Enter>", self._on_enter)
+            SharedBindings.bind(self._canvas, "<Leave>", self._on_leave)
+        SharedBindings.bind(self._canvas, "<Button-1>", self._clicked)
+        SharedBindings.bind(self._canvas, "<B1-Motion>", self._clicked)
 
         self._set_cursor()
         self._draw()  # initial draw
@@ -129,6 +141,9 @@ class CTkSlider(CTkBaseClass):
         if self._variable is not None:
             self._variable.trace_remove("write", self._variable_callback_name)
 
+        if self._visual_states is not None:
+            self._visual_states.destroy()
+
         super().destroy()
 
     def _set_cursor(self):
@@ -191,6 +206,8 @@ class CTkSlider(CTkBaseClass):
                                         fill=self._apply_appearance_mode(self._button_color),
                                         outline=self._apply_appearance_mode(self._button_color))
 
+            self._update_visual_states()
+
     def configure(self, require_redraw=False, **kwargs):
         if "state" in kwargs:
             self._state = kwargs.pop("state")
@@ -232,6 +249,7 @@ class CTkSlider(CTkBaseClass):
 
         if "hover" in kwargs:
             self._hover = kwargs.pop("hover")
+            self._update_visual_states()
 
         if "command" in kwargs:
             self._command = kwargs.pop("command")
@@ -316,6 +334,21 @@ class CTkSlider(CTkBaseClass):
             if self._command is not None:
                 self._command(self._output_value)
 
+    def _update_visual_states(self):
+        """ precompute color of slider parts for normal and hover state (native hover only) """
+        if self._visual_states is None:
+            return
+
+        button_color = self._apply_appearance_mode(self._button_color)
+        if self._hover is True and self._state == "normal":
+            button_hover_color = self._apply_appearance_mode(self._button_hover_color)
+        else:
+            button_hover_color = button_color
+
+        self._visual_states.set_state("normal", item_options=[("slider_parts", {"fill": button_color, "outline": button_color})])
+        self._visual_states.set_state("hover", item_options=[("slider_parts", {"fill": button_hover_color, "outline": button_hover_color})])
+        self._visual_states.apply()
+
     def _on_enter(self, event=0):
         if self._hover is True and self._state == "normal":
             self._hover_state = True
@@ -5,7 +5,10 @@ from typing import Union, Tuple, Callable, Optional
 from .core_rendering import CTkCanvas
 from .theme import ThemeManager
 from .core_rendering import DrawEngine
+from .core_rendering import CanvasText
+from .core_rendering import VisualStates
 from .core_widget_classes import CTkBaseClass
+from .core_widget_classes import SharedBindings
 from .font import CTkFont
 
 
@@ -13,8 +16,14 @@ class CTkSwitch(CTkBaseClass):
     """
     Switch with rounded corners, border, label, command, variable support.
     For detailed information check out the documentation.
+
+    With CTkSwitch.single_canvas_rendering = True, the text is drawn as canvas item instead of a tkinter.Label.
+    With CTkSwitch.native_hover = True, hover colors are precomputed and switched by Tcl Enter/Leave bindings.
     """
 
+    single_canvas_rendering: bool = False
+    native_hover: bool = False
+
     def __init__(self,
                  master: any,
                  width: int = 100,
@@ -106,24 +115,37 @@ class CTkSwitch(CTkBaseClass):
         self._canvas.grid(row=0, column=0, sticky="")
         self._draw_engine = DrawEngine(self._canvas)
 
-        self._canvas.bind("<Enter>", self._on_enter)
-        self._canvas.bind("<Leave>", self._on_leave)
-        self._canvas.bind("<Button-1>", self.toggle)
-
-        self._text_label = tkinter.Label(master=self,
-                                         bd=0,
-                                         padx=0,
-                                         pady=0,
-                                         text=self._text,
-                                         justify=tkinter.LEFT,
-                                         font=self._apply_font_scaling(self._font),
-                                         textvariable=self._textvariable)
-        self._text_label.grid(row=0, column=2, sticky="w")
-        self._text_label["anchor"] = "w"
-
-        self._text_label.bind("<Enter>", self._on_enter)
-        self._text_label.bind("<Leave>", self._on_leave)
-        self._text_label.bind("<Button-1>", self.toggle)
+        # native hover: hover colors are precomputed by _update_visual_states() and switched by Tcl bindings
+        self._visual_states: Union[VisualStates, None] = VisualStates(self._canvas) if self.native_hover else None
+
+        self._bind_hover(self._canvas)
+        SharedBindings.bind(self._canvas, "<Button-1>", self.toggle)
+
+        # single canvas rendering: text is a canvas item on the background canvas, placed by _position_canvas_text()
+        self._single_canvas_rendering: bool = self.single_canvas_rendering
+        self._canvas_text: Union[CanvasText, None] = None
+
+        if self._single_canvas_rendering:
+            self._canvas_text = CanvasText(self._bg_canvas, text_change_callback=self._position_canvas_text)
+            self._canvas_text.set_textvariable(self._textvariable)
+            self._canvas_text.configure(text=self._text, justify=tkinter.LEFT, font=self._apply_font_scaling(self._font))
+
+            self._bind_hover(self._bg_canvas, tag="text_item")
+            self._canvas_text.bind("<Button-1>", self.toggle)
+        else:
+            self._text_label = tkinter.Label(master=self,
+                                             bd=0,
+                                             padx=0,
+                                             pady=0,
+                                             text=self._text,
+                                             justify=tkinter.LEFT,
+                                             font=self._apply_font_scaling(self._font),
+                                             textvariable=self._textvariable)
+            self._text_label.grid(row=0, column=2, sticky="w")
+            self._text_label["anchor"] = "w"
+
+            self._bind_hover(self._text_label)
+            SharedBindings.bind(self._text_label, "<Button-1>", self.toggle)
 
         if self._variable is not None and self._variable != "":
             self._variable_callback_name = self._variable.trace_add("write", self._variable_callback)
@@ -136,10 +158,15 @@ class CTkSwitch(CTkBaseClass):
         super()._set_scaling(*args, **kwargs)
 
         self.grid_columnconfigure(1, weight=0, minsize=self._apply_widget_scaling(6))
-        self._text_label.configure(font=self._apply_font_scaling(self._font))
+        if self._canvas_text is not None:
+            self._canvas_text.configure(font=self._apply_font_scaling(self._font))
+        else:
+            self._text_label.configure(font=self._apply_font_scaling(self._font))
 
         self._bg_canvas.configure(width=self._apply_widget_scaling(self._desired_width),
                                   height=self._apply_widget_scaling(self._desired_height))
+        if self._canvas_text is not None:
+            self._canvas_text.reset_canvas_size()  # background canvas can grow again in _position_canvas_text()
         self._canvas.configure(width=self._apply_widget_scaling(self._switch_width),
                                height=self._apply_widget_scaling(self._switch_height))
         self._draw(no_color_updates=True)
@@ -149,10 +176,17 @@ class CTkSwitch(CTkBaseClass):
 
         self._bg_canvas.configure(width=self._apply_widget_scaling(self._desired_width),
                                   height=self._apply_widget_scaling(self._desired_height))
+        if self._canvas_text is not None:
+            self._canvas_text.reset_canvas_size()  # background canvas can grow again in _position_canvas_text()
 
     def _update_font(self):
         """ pass font to tkinter widgets with applied font scaling and update grid with workaround """
-        self._text_label.configure(font=self._apply_font_scaling(self._font))
+        if self._canvas_text is not None:
+            self._canvas_text.configure(font=self._apply_font_scaling(self._font))
+            self._position_canvas_text()
+            return
+
+        self._configure_scaled_font(self._text_label, self._apply_font_scaling(self._font))
 
         # Workaround to force grid to be resized when text changes size.
         # Otherwise grid will lag and only resizes if other mouse action occurs.
@@ -167,6 +201,12 @@ class CTkSwitch(CTkBaseClass):
         if isinstance(self._font, CTkFont):
             self._font.remove_size_configure_callback(self._update_font)
 
+        if self._canvas_text is not None:
+            self._canvas_text.destroy()
+
+        if self._visual_states is not None:
+            self._visual_states.destroy()
+
         super().destroy()
 
     def _set_cursor(self):
@@ -235,12 +275,30 @@ class CTkSwitch(CTkBaseClass):
             self._canvas.itemconfig("slider_parts", fill=self._apply_appearance_mode(self._button_color),
                                     outline=self._apply_appearance_mode(self._button_color))
 
-            if self._state == tkinter.DISABLED:
-                self._text_label.configure(fg=(self._apply_appearance_mode(self._text_color_disabled)))
+            if self._canvas_text is not None:
+                if self._state == tkinter.DISABLED:
+                    self._canvas_text.configure(fill=self._apply_appearance_mode(self._text_color_disabled))
+                else:
+                    self._canvas_text.configure(fill=self._apply_appearance_mode(self._text_color))
             else:
-                self._text_label.configure(fg=self._apply_appearance_mode(self._text_color))
+                if self._state == tkinter.DISABLED:
+                    self._text_label.configure(fg=(self._apply_appearance_mode(self._text_color_disabled)))
+                else:
+                    self._text_label.configure(fg=self._apply_appearance_mode(self._text_color))
 
-            self._text_label.configure(bg=self._apply_appearance_mode(self._bg_color))
+                self._text_label.configure(bg=self._apply_appearance_mode(self._bg_color))
+
+            self._update_visual_states()
+
+        if self._canvas_text is not None:
+            self._position_canvas_text()
+
+    def _position_canvas_text(self):
+        """ place text item beside the switch like the text label in grid column 2, background canvas grows to fit the text """
+        self._canvas_text.place_beside(self._apply_widget_scaling(self._switch_width) + self._apply_widget_scaling(6),
+                                       self._apply_widget_scaling(self._current_height),
+                                       self._apply_widget_scaling(self._desired_width), self._apply_widget_scaling(self._desired_height),
+                                       self._font, self._get_widget_scaling())
 
     def configure(self, require_redraw=False, **kwargs):
         if "corner_radius" in kwargs:
@@ -267,7 +325,11 @@ class CTkSwitch(CTkBaseClass):
 
         if "text" in kwargs:
             self._text = kwargs.pop("text")
-            self._text_label.configure(text=self._text)
+            if self._canvas_text is not None:
+                self._canvas_text.configure(text=self._text)
+                self._position_canvas_text()
+            else:
+                self._text_label.configure(text=self._text)
 
         if "font" in kwargs:
             if isinstance(self._font, CTkFont):
@@ -305,13 +367,18 @@ class CTkSwitch(CTkBaseClass):
 
         if "hover" in kwargs:
             self._hover = kwargs.pop("hover")
+            self._update_visual_states()
 
         if "command" in kwargs:
             self._command = kwargs.pop("command")
 
         if "textvariable" in kwargs:
             self._textvariable = kwargs.pop("textvariable")
-            self._text_label.configure(textvariable=self._textvariable)
+            if self._canvas_text is not None:
+                self._canvas_text.set_textvariable(self._textvariable)
+                self._position_canvas_text()
+            else:
+                self._text_label.configure(textvariable=self._textvariable)
 
         if "variable" in kwargs:
             if self._variable is not None and self._variable != "":
@@ -417,6 +484,31 @@ class CTkSwitch(CTkBaseClass):
     def get(self) -> Union[int, str]:
         return self._onvalue if self._check_state is True else self._offvalue
 
+    def _bind_hover(self, widget: tkinter.Misc, tag: str = None):
+        if self._visual_states is not None:
+            self._visual_states.bind(widget, tag=tag)
+        elif tag is not None:
+            widget.tag_bind(tag, "<Enter>", self._on_enter)
+            widget.tag_bind(tag, "<Leave>", self._on_leave)
+        else:
+            SharedBindings.bind(widget, "<Enter>", self._on_enter)
+            SharedBindings.bind(widget, "<Leave>", self._on_leave)
+
+    def _update_visual_states(self):
+        """ precompute color of slider parts for normal and hover state (native hover only) """
+        if self._visual_states is None:
+            return
+
+        button_color = self._apply_appearance_mode(self._button_color)
+        if self._hover is True and self._state == "normal":
+            button_hover_color = self._apply_appearance_mode(self._button_hover_color)
+        else:
+            button_hover_color = button_color
+
+        self._visual_states.set_state("normal", item_options=[("slider_parts", {"fill": button_color, "outline": button_color})])
+        self._visual_states.set_state("hover", item_options=[("slider_parts", {"fill": button_hover_color, "outline": button_hover_color})])
+        self._visual_states.apply()
+
     def _on_enter(self, event=0):
         if self._hover is True and self._state == "normal":
             self._hover_state = True
@@ -446,10 +538,16 @@ class CTkSwitch(CTkBaseClass):
         return self._canvas.unbind(sequence, funcid)
 
     def focus(self):
+        if self._canvas_text is not None:
+            return self._canvas.focus()
         return self._text_label.focus()
 
     def focus_set(self):
+        if self._canvas_text is not None:
+            return self._canvas.focus_set()
         return self._text_label.focus_set()
 
     def focus_force(self):
+        if self._canvas_text is not None:
+            return self._canvas.focus_force()
         return self._text_label.focus_force()
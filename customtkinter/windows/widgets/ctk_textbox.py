@@ -1,28 +1,48 @@
+import re
 import tkinter
-from typing import Union, Tuple, Optional
+import threading
+from typing import Union, Tuple, Optional, List, Callable
 
 from .core_rendering import CTkCanvas
 from .ctk_scrollbar import CTkScrollbar
 from .theme import ThemeManager
 from .core_rendering import DrawEngine
-from .core_widget_classes import CTkBaseClass
+from .core_widget_classes import CTkBaseClass, SharedBindings
 from .font import CTkFont
+from .textbox import MappedDocument, CTkLexer, CTkHighlighter, CTkTextSearch
 from .utility import pop_from_dict_by_set, check_kwargs_empty
 
 
 class CTkTextbox(CTkBaseClass):
     """
     Textbox with x and y scrollbars, rounded corners, and all text features of tkinter.Text widget.
-    Scrollbars only appear when they are needed. Text is wrapped on line end by default,
+    Scrollbars only appear when they are needed, which is checked on the scroll commands of the
+    tkinter.Text widget and on <Configure> events. Text is wrapped on line end by default,
     set wrap='none' to disable automatic line wrapping.
     For detailed information check out the documentation.
 
     Detailed methods and parameters of the underlaying tkinter.Text widget can be found here:
     https://anzeljg.github.io/rin2/book2/2405/docs/tkinter/text.html
     (most of them are implemented here too)
+
+    Text can be streamed with .append_stream(), which buffers the text and inserts it once per frame,
+    with stream_max_lines the oldest lines are deleted if the textbox exceeds the maximum line count.
+
+    Large files can be shown read-only with .open_document(), the file is memory-mapped and only the visible
+    lines plus a margin are inserted into the tkinter.Text, the y scrollbar represents the whole document.
+
+    With a CTkLexer passed as lexer, the text gets highlighted incrementally, the tag colors are taken
+    from the theme or from highlight_colors (dict of token type and color).
+
+    .find_all() searches and tags all matches in a background thread, the visible matches are tagged first,
+    .find_next() and .find_previous() select the matches.
     """
 
-    _scrollbar_update_time = 200  # interval in ms, to check if scrollbars are needed
+    _stream_flush_interval: int = 16  # interval in ms, in which streamed text is inserted
+
+    _document_margin_lines: int = 200  # lines above and below the visible lines, which are kept in the tkinter.Text
+    _document_window_lines: int = 600  # maximum number of document lines in the tkinter.Text
+    _document_index_check_interval: int = 100  # interval in ms, to update the scrollbar while the document is indexed
 
     # attributes that are passed to and managed by the tkinter textbox only:
     _valid_tk_text_attributes = {"autoseparators", "cursor", "exportselection",
@@ -48,6 +68,9 @@ class CTkTextbox(CTkBaseClass):
 
                  font: Optional[Union[tuple, CTkFont]] = None,
                  activate_scrollbars: bool = True,
+                 stream_max_lines: Optional[int] = None,
+                 lexer: Optional[CTkLexer] = None,
+                 highlight_colors: Optional[dict] = None,
                  **kwargs):
 
         # transfer basic functionality (_bg_color, size, __appearance_mode, scaling) to CTkBaseClass
@@ -104,8 +127,8 @@ class CTkTextbox(CTkBaseClass):
                                          button_color=self._scrollbar_button_color,
                                          button_hover_color=self._scrollbar_button_hover_color,
                                          orientation="vertical",
-                                         command=self._textbox.yview)
-        self._textbox.configure(yscrollcommand=self._y_scrollbar.set)
+                                         command=self._y_scrollbar_command)
+        self._textbox.configure(yscrollcommand=self._y_scrollbar_set)
 
         self._x_scrollbar = CTkScrollbar(self,
                                          height=8,
@@ -116,11 +139,37 @@ class CTkTextbox(CTkBaseClass):
                                          button_hover_color=self._scrollbar_button_hover_color,
                                          orientation="horizontal",
                                          command=self._textbox.xview)
-        self._textbox.configure(xscrollcommand=self._x_scrollbar.set)
+        self._textbox.configure(xscrollcommand=self._x_scrollbar_set)
 
         self._create_grid_for_text_and_scrollbars(re_grid_textbox=True, re_grid_x_scrollbar=True, re_grid_y_scrollbar=True)
 
-        self.after(50, self._check_if_scrollbars_needed)
+        SharedBindings.bind(self._textbox, "<Configure>", self._check_if_scrollbars_needed)
+
+        # streaming
+        self._stream_max_lines = stream_max_lines
+        self._stream_buffer: List[Tuple[str, Union[str, Tuple[str, ...]]]] = []
+        self._stream_flush_after_id = None
+
+        # virtual document mode
+        self._document: Optional[MappedDocument] = None
+        self._document_first_line: int = 1  # document line of the first line in the tkinter.Text
+        self._document_last_line: int = 0  # document line of the last line in the tkinter.Text
+        self._document_text_state = None  # state of the tkinter.Text before the document was opened
+        self._document_index_after_id = None
+        self._document_recenter_after_id = None
+        self._document_find_after_id = None
+        self._document_find_id: int = 0  # incremented for every find, results of older finds are ignored
+
+        # highlighting
+        self._lexer = lexer
+        self._highlight_colors = highlight_colors
+        self._highlighter: Optional[CTkHighlighter] = None
+        if self._lexer is not None:
+            self._highlighter = CTkHighlighter(self, self._lexer, self._highlight_colors)
+
+        # find-all search
+        self._search: Optional[CTkTextSearch] = None
+
         self._draw()
 
     def _create_grid_for_text_and_scrollbars(self, re_grid_textbox=False, re_grid_x_scrollbar=False, re_grid_y_scrollbar=False):
@@ -152,30 +201,37 @@ class CTkTextbox(CTkBaseClass):
             else:
                 self._y_scrollbar.grid_forget()
 
-    def _check_if_scrollbars_needed(self, event=None, continue_loop: bool = True):
-        """ Method hides or places the scrollbars if they are needed on key release event of tkinter.text widget """
-
-        if self._scrollbars_activated:
-            if self._textbox.xview() != (0.0, 1.0) and not self._x_scrollbar.winfo_ismapped():  # x scrollbar needed
-                self._hide_x_scrollbar = False
-                self._create_grid_for_text_and_scrollbars(re_grid_x_scrollbar=True)
-            elif self._textbox.xview() == (0.0, 1.0) and self._x_scrollbar.winfo_ismapped():  # x scrollbar not needed
-                self._hide_x_scrollbar = True
-                self._create_grid_for_text_and_scrollbars(re_grid_x_scrollbar=True)
-
-            if self._textbox.yview() != (0.0, 1.0) and not self._y_scrollbar.winfo_ismapped():  # y scrollbar needed
-                self._hide_y_scrollbar = False
-                self._create_grid_for_text_and_scrollbars(re_grid_y_scrollbar=True)
-            elif self._textbox.yview() == (0.0, 1.0) and self._y_scrollbar.winfo_ismapped():  # y scrollbar not needed
-                self._hide_y_scrollbar = True
-                self._create_grid_for_text_and_scrollbars(re_grid_y_scrollbar=True)
-        else:
-            self._hide_x_scrollbar = False
-            self._hide_x_scrollbar = False
-            self._create_grid_for_text_and_scrollbars(re_grid_y_scrollbar=True)
+    def _x_scrollbar_set(self, first: str, last: str):
+        """ xscrollcommand of tkinter.Text, passes the view to the scrollbar and shows or hides it """
+        self._x_scrollbar.set(first, last)
+        self._update_scrollbar_visibility(x_needed=(float(first), float(last)) != (0.0, 1.0))
+
+    def _y_scrollbar_set(self, first: str, last: str):
+        """ yscrollcommand of tkinter.Text, passes the view to the scrollbar and shows or hides it """
+        if self._document is not None:
+            first, last = self._get_document_view(float(first), float(last))
+        if self._highlighter is not None:
+            self._highlighter.view_changed()
+        self._y_scrollbar.set(first, last)
+        self._update_scrollbar_visibility(y_needed=(float(first), float(last)) != (0.0, 1.0))
+
+    def _check_if_scrollbars_needed(self, event=None):
+        """ Method hides or places the scrollbars if they are needed on <Configure> event of tkinter.Text widget """
+        self._update_scrollbar_visibility(x_needed=self._textbox.xview() != (0.0, 1.0),
+                                          y_needed=self._textbox.yview() != (0.0, 1.0))
+
+    def _update_scrollbar_visibility(self, x_needed: Optional[bool] = None, y_needed: Optional[bool] = None):
+        """ grid or forget scrollbars only if their visibility changes, None means unchanged """
+        if not self._scrollbars_activated:
+            return
 
-        if self._textbox.winfo_exists() and continue_loop is True:
-            self.after(self._scrollbar_update_time, lambda: self._check_if_scrollbars_needed(continue_loop=True))
+        if x_needed is not None and x_needed == self._hide_x_scrollbar:
+            self._hide_x_scrollbar = not x_needed
+            self._create_grid_for_text_and_scrollbars(re_grid_x_scrollbar=True)
+
+        if y_needed is not None and y_needed == self._hide_y_scrollbar:
+            self._hide_y_scrollbar = not y_needed
+            self._create_grid_for_text_and_scrollbars(re_grid_y_scrollbar=True)
 
     def _set_scaling(self, *args, **kwargs):
         super()._set_scaling(*args, **kwargs)
@@ -195,7 +251,7 @@ class CTkTextbox(CTkBaseClass):
 
     def _update_font(self):
         """ pass font to tkinter widgets with applied font scaling and update grid with workaround """
-        self._textbox.configure(font=self._apply_font_scaling(self._font))
+        self._configure_scaled_font(self._textbox, self._apply_font_scaling(self._font))
 
         # Workaround to force grid to be resized when text changes size.
         # Otherwise grid will lag and only resizes if other mouse action occurs.
@@ -203,6 +259,17 @@ class CTkTextbox(CTkBaseClass):
         self._canvas.grid(row=0, column=0, rowspan=2, columnspan=2, sticky="nsew")
 
     def destroy(self):
+        self.close_document()
+        self.clear_search()
+
+        if self._highlighter is not None:
+            self._highlighter.destroy()
+            self._highlighter = None
+
+        if self._stream_flush_after_id is not None:
+            self.after_cancel(self._stream_flush_after_id)
+            self._stream_flush_after_id = None
+
         if isinstance(self._font, CTkFont):
             self._font.remove_size_configure_callback(self._update_font)
 
@@ -248,6 +315,11 @@ class CTkTextbox(CTkBaseClass):
                                     outline=self._apply_appearance_mode(self._border_color))
             self._canvas.configure(bg=self._apply_appearance_mode(self._bg_color))
 
+            if self._highlighter is not None:
+                self._highlighter.update_colors()
+            if self._search is not None:
+                self._search.update_colors()
+
         self._canvas.tag_lower("inner_parts")
         self._canvas.tag_lower("border_parts")
 
@@ -303,6 +375,26 @@ class CTkTextbox(CTkBaseClass):
 
             self._update_font()
 
+        if "stream_max_lines" in kwargs:
+            self._stream_max_lines = kwargs.pop("stream_max_lines")
+            state = self._textbox.cget("state")
+            self._textbox.configure(state=tkinter.NORMAL)
+            self._trim_stream_lines()
+            self._textbox.configure(state=state)
+
+        if "lexer" in kwargs:
+            self._lexer = kwargs.pop("lexer")
+            if self._highlighter is not None:
+                self._highlighter.destroy()
+                self._highlighter = None
+            if self._lexer is not None:
+                self._highlighter = CTkHighlighter(self, self._lexer, self._highlight_colors)
+
+        if "highlight_colors" in kwargs:
+            self._highlight_colors = kwargs.pop("highlight_colors")
+            if self._highlighter is not None:
+                self._highlighter.set_highlight_colors(self._highlight_colors)
+
         self._textbox.configure(**pop_from_dict_by_set(kwargs, self._valid_tk_text_attributes))
         super().configure(require_redraw=require_redraw, **kwargs)
 
@@ -323,6 +415,12 @@ class CTkTextbox(CTkBaseClass):
 
         elif attribute_name == "font":
             return self._font
+        elif attribute_name == "stream_max_lines":
+            return self._stream_max_lines
+        elif attribute_name == "lexer":
+            return self._lexer
+        elif attribute_name == "highlight_colors":
+            return self._highlight_colors
 
         else:
             return super().cget(attribute_name)
@@ -350,9 +448,252 @@ class CTkTextbox(CTkBaseClass):
         return self._textbox.focus_force()
 
     def insert(self, index, text, tags=None):
-        self._check_if_scrollbars_needed()
         return self._textbox.insert(index, text, tags)
 
+    def append_stream(self, text: str, tags: Union[str, Tuple[str, ...], None] = None):
+        """ buffer text to be appended at the end, the buffer is inserted once per frame with a single insert call,
+            tags (for example log levels) are applied in the same call """
+        if self._document is not None:
+            raise ValueError("append_stream() can not be used while a document is opened with open_document()")
+
+        if tags is None:
+            tags = ()
+        elif isinstance(tags, str):
+            tags = (tags,)
+        else:
+            tags = tuple(tags)
+
+        # consecutive text with the same tags is joined
+        if len(self._stream_buffer) > 0 and self._stream_buffer[-1][1] == tags:
+            self._stream_buffer[-1] = (self._stream_buffer[-1][0] + text, tags)
+        else:
+            self._stream_buffer.append((text, tags))
+
+        if self._stream_flush_after_id is None:
+            self._stream_flush_after_id = self.after(self._stream_flush_interval, self.flush_stream)
+
+    def flush_stream(self):
+        """ insert buffered text of .append_stream() immediately, ignored while a document is opened """
+        if self._stream_flush_after_id is not None:
+            self.after_cancel(self._stream_flush_after_id)
+            self._stream_flush_after_id = None
+
+        if len(self._stream_buffer) == 0 or self._document is not None:
+            self._stream_buffer = []
+            return
+
+        insert_args = []
+        for text, tags in self._stream_buffer:
+            insert_args.extend((text, tags))
+        self._stream_buffer = []
+
+        # only scroll to the end if the end was visible before
+        autoscroll = self._textbox.yview()[1] >= 1.0
+
+        # streamed text is also inserted into a disabled (read-only) textbox
+        state = self._textbox.cget("state")
+        if state == tkinter.DISABLED:
+            self._textbox.configure(state=tkinter.NORMAL)
+        self._textbox.insert("end", *insert_args)
+        self._trim_stream_lines()
+        if state == tkinter.DISABLED:
+            self._textbox.configure(state=tkinter.DISABLED)
+
+        if autoscroll:
+            self._textbox.yview_moveto(1.0)
+
+    def open_document(self, path, encoding: str = "utf-8") -> MappedDocument:
+        """ show file read-only in virtual mode, the file is memory-mapped and indexed in a background thread,
+            only the lines around the view are kept in the tkinter.Text, returns the MappedDocument """
+        self.close_document()
+        self._stream_buffer = []
+
+        self._document = MappedDocument(path, encoding)
+        self._document_text_state = self._textbox.cget("state")
+        self._document_first_line, self._document_last_line = 1, 0
+        self._textbox.configure(state=tkinter.NORMAL)
+        self._textbox.delete("1.0", "end")
+        self._textbox.configure(state=tkinter.DISABLED)
+
+        self._check_document_index()
+        return self._document
+
+    def close_document(self):
+        """ leave virtual mode and clear the textbox """
+        if self._document is None:
+            return
+
+        for after_id in (self._document_index_after_id, self._document_recenter_after_id, self._document_find_after_id):
+            if after_id is not None:
+                self.after_cancel(after_id)
+        self._document_index_after_id, self._document_recenter_after_id, self._document_find_after_id = None, None, None
+        self._document_find_id += 1
+
+        self._document.close()
+        self._document = None
+
+        self._textbox.configure(state=tkinter.NORMAL)
+        self._textbox.delete("1.0", "end")
+        self._textbox.configure(state=self._document_text_state)
+
+    def get_document(self) -> Optional[MappedDocument]:
+        """ returns MappedDocument opened with .open_document() or None """
+        return self._document
+
+    def goto_line(self, line: int):
+        """ scroll line to the top of the view, in virtual mode line is the line of the document """
+        if self._document is not None:
+            self._show_document_line(line)
+        else:
+            self._textbox.yview(f"{line}.0")
+
+    def find_in_document(self, pattern: str, start_line: int = 1, start_column: int = 0,
+                         regex: bool = False, nocase: bool = False, select: bool = True,
+                         callback: Union[Callable[[Optional[Tuple[int, int, int]]], None], None] = None):
+        """ search pattern in the document of .open_document() in a background thread without loading it,
+            callback(match) is called on the main loop with (line, column, length) of the first match after
+            start_line.start_column or None, with select=True the match gets shown and selected as soon as its
+            line is indexed, a new search replaces a running search """
+        if self._document is None:
+            raise ValueError("find_in_document() requires a document opened with open_document()")
+        if regex:
+            re.compile(pattern)  # raise invalid patterns on the calling thread
+
+        self._document_find_id += 1
+        if self._document_find_after_id is not None:
+            self.after_cancel(self._document_find_after_id)
+            self._document_find_after_id = None
+
+        document, result = self._document, []
+        threading.Thread(target=lambda: result.append(document.find(pattern, start_line, start_column, regex=regex, nocase=nocase)),
+                         name="CTkTextbox_find", daemon=True).start()
+        self._check_document_find(self._document_find_id, result, select, callback)
+
+    def _check_document_find(self, find_id: int, result: list, select: bool, callback: Union[Callable, None]):
+        """ runs on main loop until the find thread has a result and the line of the match is indexed """
+        self._document_find_after_id = None
+        if find_id != self._document_find_id or self._document is None:
+            return
+
+        if len(result) == 0 or (select and result[0] is not None and result[0][0] > self._document.line_count):
+            self._document_find_after_id = self.after(self._document_index_check_interval,
+                                                      lambda: self._check_document_find(find_id, result, select, callback))
+            return
+
+        match = result[0]
+        if match is not None and select:
+            line, column, length = match
+            self._show_document_line(line - 3)
+            text_line = line - self._document_first_line + 1
+            self._textbox.tag_remove("sel", "1.0", "end")
+            self._textbox.tag_add("sel", f"{text_line}.{column}", f"{text_line}.{column} + {length} chars")
+
+        if callback is not None:
+            callback(match)
+
+    def _show_document_line(self, top_line: int):
+        """ load the lines around top_line into the tkinter.Text, if they are not loaded, and scroll top_line to the top """
+        top_line = max(1, min(top_line, self._document.line_count))
+        first_line = max(1, top_line - self._document_margin_lines)
+        last_line = min(self._document.line_count, first_line + self._document_window_lines - 1)
+
+        if (first_line, last_line) != (self._document_first_line, self._document_last_line):
+            self._textbox.configure(state=tkinter.NORMAL)
+            self._textbox.delete("1.0", "end")
+            self._textbox.insert("1.0", self._document.get_lines(first_line, last_line))
+            self._textbox.configure(state=tkinter.DISABLED)
+            self._document_first_line, self._document_last_line = first_line, last_line
+
+        self._textbox.yview(f"{top_line - first_line + 1}.0")
+
+    def _get_document_top_line(self) -> int:
+        return self._document_first_line + int(self._textbox.index("@0,0").split(".")[0]) - 1
+
+    def _get_document_view(self, first: float, last: float) -> Tuple[float, float]:
+        """ convert view of the tkinter.Text to the view of the whole document, recenter loaded lines near their end """
+        loaded_lines = self._document_last_line - self._document_first_line + 1
+        line_count = max(1, self._document.line_count)
+
+        near_start = first * loaded_lines < self._document_margin_lines / 2 and self._document_first_line > 1
+        near_end = (1 - last) * loaded_lines < self._document_margin_lines / 2 and self._document_last_line < self._document.line_count
+        if (near_start or near_end) and self._document_recenter_after_id is None:
+            self._document_recenter_after_id = self.after_idle(self._recenter_document)
+
+        return ((self._document_first_line - 1 + first * loaded_lines) / line_count,
+                min(1.0, (self._document_first_line - 1 + last * loaded_lines) / line_count))
+
+    def _recenter_document(self):
+        self._document_recenter_after_id = None
+        if self._document is not None:
+            self._show_document_line(self._get_document_top_line())
+
+    def _check_document_index(self):
+        """ load lines, which got indexed, if the tkinter.Text is not filled, and update the scrollbar """
+        self._document_index_after_id = None
+        if self._document is None:
+            return
+
+        if (self._document_last_line - self._document_first_line + 1 < self._document_window_lines
+                and self._document_last_line < self._document.line_count):
+            self._show_document_line(self._get_document_top_line())
+        self._y_scrollbar_set(*self._textbox.yview())
+
+        if not self._document.index_complete:
+            self._document_index_after_id = self.after(self._document_index_check_interval, self._check_document_index)
+
+    def _document_yview(self, *args):
+        """ scrollbar command in virtual mode, args are 'moveto fraction' or 'scroll number units|pages' """
+        if args[0] == "moveto":
+            self._show_document_line(int(float(args[1]) * self._document.line_count) + 1)
+        elif args[0] == "scroll":
+            number = int(args[1])
+            if args[2] == "pages":
+                visible_lines = int(self._textbox.index(f"@0,{self._textbox.winfo_height()}").split(".")[0]) - int(self._textbox.index("@0,0").split(".")[0])
+                number *= max(1, visible_lines)
+            self._show_document_line(self._get_document_top_line() + number)
+
+    def _y_scrollbar_command(self, *args):
+        if self._document is not None:
+            self._document_yview(*args)
+        else:
+            self._textbox.yview(*args)
+
+    def find_all(self, pattern: str, regex: bool = False, whole_word: bool = False, nocase: bool = False,
+                 callback: Union[Callable[[int, bool], None], None] = None) -> CTkTextSearch:
+        """ search all matches of pattern in a background thread and tag them, visible matches first, replaces
+            the previous search, callback(count, complete) is called when the number of found matches changes """
+        if self._document is not None:
+            raise ValueError("find_all() is not supported in virtual document mode, use find_in_document()")
+
+        self.clear_search()
+        self._search = CTkTextSearch(self, pattern, regex=regex, whole_word=whole_word, nocase=nocase, callback=callback)
+        return self._search
+
+    def find_next(self) -> Optional[str]:
+        """ select match of find_all() after the insert cursor, returns its index or None """
+        return None if self._search is None else self._search.next()
+
+    def find_previous(self) -> Optional[str]:
+        """ select match of find_all() before the insert cursor, returns its index or None """
+        return None if self._search is None else self._search.previous()
+
+    def clear_search(self):
+        """ stop search of find_all() and remove the match tags """
+        if self._search is not None:
+            self._search.cancel()
+            self._search = None
+
+    def _trim_stream_lines(self):
+        """ delete the oldest lines in one call if the textbox has more than stream_max_lines lines """
+        if self._stream_max_lines is None or self._document is not None:
+            return
+
+        # empty line after a trailing newline is not counted
+        last_index = "end-2c" if self._textbox.get("end-2c") == "\n" else "end-1c"
+        line_count = int(self._textbox.index(last_index).split(".")[0])
+        if line_count > self._stream_max_lines:
+            self._textbox.delete("1.0", f"{line_count - self._stream_max_lines + 1}.0")
+
     def get(self, index1, index2=None):
         return self._textbox.get(index1, index2)
 
@@ -372,7 +713,6 @@ class CTkTextbox(CTkBaseClass):
         return self._textbox.edit_modified(arg)
 
     def edit_redo(self):
-        self._check_if_scrollbars_needed()
         return self._textbox.edit_redo()
 
     def edit_reset(self):
@@ -382,7 +722,6 @@ class CTkTextbox(CTkBaseClass):
         return self._textbox.edit_separator()
 
     def edit_undo(self):
-        self._check_if_scrollbars_needed()
         return self._textbox.edit_undo()
 
     def image_create(self, index, **kwargs):
@@ -493,10 +832,18 @@ class CTkTextbox(CTkBaseClass):
         return self._textbox.xview_scroll(n, what)
 
     def yview(self, *args):
+        if self._document is not None:
+            if len(args) == 0:
+                return self._y_scrollbar.get()
+            return self._document_yview(*args)
         return self._textbox.yview(*args)
 
     def yview_moveto(self, fraction):
+        if self._document is not None:
+            return self._document_yview("moveto", fraction)
         return self._textbox.yview_moveto(fraction)
 
     def yview_scroll(self, n, what):
+        if self._document is not None:
+            return self._document_yview("scroll", n, what)
         return self._textbox.yview_scroll(n, what)
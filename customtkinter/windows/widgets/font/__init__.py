@@ -1,5 +1,6 @@
 import os
 import sys
+import time
 
 from .ctk_font import CTkFont
 from .font_manager import FontManager
@@ -7,12 +8,17 @@ from .font_manager import FontManager
 # import DrawEngine to set preferred_drawing_method if loading shapes font fails
 from ..core_rendering import DrawEngine
 
+font_setup_start_time = time.perf_counter()
 FontManager.init_font_manager()
 
-# load Roboto fonts (used on Windows/Linux)
+# load Roboto fonts (used on Windows/Linux), on Windows medium weight is only loaded when a bold Roboto font is used,
+# on Linux all fonts must be installed before Tk is initialized
 customtkinter_directory = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 FontManager.load_font(os.path.join(customtkinter_directory, "assets", "fonts", "Roboto", "Roboto-Regular.ttf"))
-FontManager.load_font(os.path.join(customtkinter_directory, "assets", "fonts", "Roboto", "Roboto-Medium.ttf"))
+if sys.platform.startswith("win"):
+    FontManager.register_optional_font(os.path.join(customtkinter_directory, "assets", "fonts", "Roboto", "Roboto-Medium.ttf"), "Roboto", "bold")
+else:
+    FontManager.load_font(os.path.join(customtkinter_directory, "assets", "fonts", "Roboto", "Roboto-Medium.ttf"))
 
 # load font necessary for rendering the widgets (used on Windows/Linux)
 if FontManager.load_font(os.path.join(customtkinter_directory, "assets", "fonts", "CustomTkinter_shapes_font.otf")) is False:
@@ -22,3 +28,9 @@ if FontManager.load_font(os.path.join(customtkinter_directory, "assets", "fonts"
                          "Preferred drawing method 'font_shapes' can not be used because the font file could not be loaded.\n" +
                          "Using 'circle_shapes' instead. The rendering quality will be bad!\n")
         DrawEngine.preferred_drawing_method = "circle_shapes"
+
+# fontconfig does not scan a private font directory, so add it to the fonts of this process before Tk is initialized
+if sys.platform.startswith("linux") and "CUSTOMTKINTER_FONT_PATH" in os.environ:
+    FontManager.linux_register_font_directory()
+
+FontManager.setup_time = time.perf_counter() - font_setup_start_time
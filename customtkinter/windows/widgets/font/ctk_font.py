@@ -1,14 +1,19 @@
+from tkinter import TclError
 from tkinter.font import Font
 import copy
-from typing import List, Callable, Tuple, Optional, Literal
+from collections import OrderedDict
+from typing import List, Callable, Tuple, Optional, Literal, Dict, Iterable
 
 from ..theme import ThemeManager
+from .font_manager import FontManager
 
 
 class CTkFont(Font):
     """
     Font object with size in pixel, independent of scaling.
     To get scaled tuple representation use create_scaled_tuple() method.
+    To get a named tkinter font with scaled size, which follows all changes of the font, use create_scaled_font() method.
+    To measure text use measure_cached(), measure_many() and metrics_cached(), results are cached until the font gets configured.
 
     family	The font family name as a string.
     size	The font height as an integer in pixel.
@@ -20,6 +25,8 @@ class CTkFont(Font):
     Tkinter Font: https://anzeljg.github.io/rin2/book2/2405/docs/tkinter/fonts.html
     """
 
+    _measure_cache_max_size: int = 4096  # maximum number of cached text widths per font
+
     def __init__(self,
                  family: Optional[str] = None,
                  size: Optional[int] = None,
@@ -29,9 +36,17 @@ class CTkFont(Font):
                  overstrike: bool = False):
 
         self._size_configure_callback_list: List[Callable] = []
+        self._scaled_fonts: Dict[float, Font] = {}  # named fonts with scaled size, key: font_scaling
+        self._measure_cache: OrderedDict = OrderedDict()  # LRU cache of text widths, key: (font_scaling, text)
+        self._metrics_cache: Dict[float, dict] = {}  # key: font_scaling
 
         self._size = ThemeManager.theme["CTkFont"]["size"] if size is None else size
 
+        # load optional font files (like Roboto medium for bold Roboto on Windows) on first use
+        if len(FontManager._optional_fonts) > 0:
+            FontManager.load_optional_font(ThemeManager.theme["CTkFont"]["family"] if family is None else family,
+                                           ThemeManager.theme["CTkFont"]["weight"] if weight is None else weight)
+
         super().__init__(family=ThemeManager.theme["CTkFont"]["family"] if family is None else family,
                          size=-abs(self._size),
                          weight=ThemeManager.theme["CTkFont"]["weight"] if weight is None else weight,
@@ -55,6 +70,67 @@ class CTkFont(Font):
         """ return scaled tuple representation of font in the form (family: str, size: int, style: str)"""
         return self._family, round(-abs(self._size) * font_scaling), self._tuple_style_string
 
+    def create_scaled_font(self, font_scaling: float) -> str:
+        """ return name of named tkinter font with scaled size, which gets reconfigured together with this font """
+        return self._get_scaled_font(font_scaling).name
+
+    def _get_scaled_font(self, font_scaling: float) -> Font:
+        if font_scaling == 1:
+            return self
+
+        if font_scaling not in self._scaled_fonts:
+            self._scaled_fonts[font_scaling] = Font(root=self._tk, **self._create_scaled_options(font_scaling))
+        return self._scaled_fonts[font_scaling]
+
+    def _create_scaled_options(self, font_scaling: float) -> dict:
+        options = Font.configure(self)
+        options["size"] = round(-abs(self._size) * font_scaling)
+        return options
+
+    def measure_cached(self, text: str, font_scaling: float = 1) -> int:
+        """ returns width of text in pixel for font scaled with font_scaling, cached until the font gets configured """
+        cache_key = (font_scaling, text)
+        width = self._measure_cache.get(cache_key)
+
+        if width is None:
+            width = self._get_scaled_font(font_scaling).measure(text)
+            self._add_to_measure_cache(cache_key, width)
+        else:
+            self._measure_cache.move_to_end(cache_key)
+        return width
+
+    def measure_many(self, texts: Iterable[str], font_scaling: float = 1) -> List[int]:
+        """ returns widths of all texts in pixel, all texts which are not cached are measured in a single Tcl call """
+        texts = list(texts)
+        widths = {text: self._measure_cache.get((font_scaling, text)) for text in texts}
+        missing_texts = [text for text, width in widths.items() if width is None]
+
+        if len(missing_texts) > 0:
+            scaled_font = self._get_scaled_font(font_scaling)
+            try:
+                # lmap in an anonymous function, so the loop variable is local and no global Tcl variable is left
+                missing_widths = self._tk.splitlist(self._tk.call("apply", (("font_name", "texts"), "lmap text $texts {font measure $font_name $text}"),
+                                                                  scaled_font.name, tuple(missing_texts)))
+            except TclError:
+                missing_widths = [scaled_font.measure(text) for text in missing_texts]  # Tcl < 8.6 has no lmap
+
+            for text, width in zip(missing_texts, missing_widths):
+                widths[text] = self._tk.getint(width)
+                self._add_to_measure_cache((font_scaling, text), widths[text])
+
+        return [widths[text] for text in texts]
+
+    def metrics_cached(self, font_scaling: float = 1) -> dict:
+        """ returns metrics (ascent, descent, linespace, fixed) for font scaled with font_scaling, cached until the font gets configured """
+        if font_scaling not in self._metrics_cache:
+            self._metrics_cache[font_scaling] = self._get_scaled_font(font_scaling).metrics()
+        return self._metrics_cache[font_scaling]
+
+    def _add_to_measure_cache(self, cache_key: Tuple[float, str], width: int):
+        self._measure_cache[cache_key] = width
+        if len(self._measure_cache) > self._measure_cache_max_size:
+            self._measure_cache.popitem(last=False)  # remove least recently used width
+
     def config(self, *args, **kwargs):
         raise AttributeError("'config' is not implemented for CTk widgets. For consistency, always use 'configure' instead.")
 
@@ -63,6 +139,9 @@ class CTkFont(Font):
             self._size = kwargs.pop("size")
             super().configure(size=-abs(self._size))
 
+        if len(FontManager._optional_fonts) > 0 and ("family" in kwargs or "weight" in kwargs):
+            FontManager.load_optional_font(kwargs.get("family", self._family), kwargs.get("weight", super().cget("weight")))
+
         if "family" in kwargs:
             super().configure(family=kwargs.pop("family"))
             self._family = super().cget("family")
@@ -72,6 +151,14 @@ class CTkFont(Font):
         # update style string for create_scaled_tuple() method
         self._tuple_style_string = f"{super().cget('weight')} {super().cget('slant')} {'underline' if super().cget('underline') else ''} {'overstrike' if super().cget('overstrike') else ''}"
 
+        # cached measurements are invalid now
+        self._measure_cache.clear()
+        self._metrics_cache.clear()
+
+        # one reconfigure per named scaled font, widgets using the named fonts update automatically
+        for font_scaling, scaled_font in self._scaled_fonts.items():
+            scaled_font.configure(**self._create_scaled_options(font_scaling))
+
         # call all functions registered with add_size_configure_callback()
         for callback in self._size_configure_callback_list:
             callback()
@@ -1,12 +1,43 @@
 import sys
 import os
 import shutil
-from typing import Union
+import hashlib
+from tkinter.font import Font
+from collections import OrderedDict
+from typing import Union, Dict, Tuple, List
 
 
 class FontManager:
+    """
+    Loads font files and manages shared named fonts.
 
-    linux_font_path = "~/.fonts/"
+    On Linux fonts are installed into linux_font_path (default ~/.fonts/, can be changed with the
+    CUSTOMTKINTER_FONT_PATH environment variable for private font directories). Files are only
+    copied if no identical file exists there, so fontconfig does not need to rescan on every start.
+    All fonts are installed on import of customtkinter, before a Tk window exists, because Tk only sees
+    fonts which fontconfig knew when Tk was initialized. fontconfig does not scan a private directory
+    from CUSTOMTKINTER_FONT_PATH, it gets added to the fonts of the process with linux_register_font_directory(),
+    which needs libfontconfig. Without libfontconfig the directory needs a <dir> entry in the fontconfig
+    configuration (like ~/.config/fontconfig/fonts.conf).
+
+    On Windows fonts are added to the process and usable immediately, so optional fonts can be registered
+    with register_optional_font() and are only loaded when the font is first used. Deferred loading is
+    not used on Linux, because a font installed after Tk was initialized is not found by fontconfig.
+    """
+
+    linux_font_path = os.environ.get("CUSTOMTKINTER_FONT_PATH", "~/.fonts/")
+    setup_time: Union[float, None] = None  # seconds needed for font setup on import of customtkinter
+
+    # optional fonts, loaded on first use (Windows only), key: (family, weight) in lowercase, value: list of font paths
+    _optional_fonts: Dict[Tuple[str, str], List[str]] = {}
+
+    # pool of named tkinter fonts for tuple fonts, shared by all widgets, key: (tcl interpreter, font tuple)
+    _named_fonts: Dict[tuple, Font] = {}
+    _named_font_reference_counts: Dict[tuple, int] = {}
+
+    # LRU cache of text widths for tuple fonts, key: (tcl interpreter, scaled font tuple, text)
+    _measure_cache: OrderedDict = OrderedDict()
+    _measure_cache_max_size: int = 4096
 
     @classmethod
     def init_font_manager(cls):
@@ -14,7 +45,7 @@ class FontManager:
         if sys.platform.startswith("linux"):
             try:
                 if not os.path.isdir(os.path.expanduser(cls.linux_font_path)):
-                    os.mkdir(os.path.expanduser(cls.linux_font_path))
+                    os.makedirs(os.path.expanduser(cls.linux_font_path))
                 return True
             except Exception as err:
                 sys.stderr.write("FontManager error: " + str(err) + "\n")
@@ -46,6 +77,46 @@ class FontManager:
         num_fonts_added = add_font_resource_ex(byref(path_buffer), flags, 0)
         return bool(min(num_fonts_added, 1))
 
+    @classmethod
+    def acquire_named_font(cls, widget, font_tuple: Tuple) -> str:
+        """ returns name of shared named font for font tuple (family, size, style), must be released with release_named_font() """
+        key = (widget.tk, font_tuple)
+        if key not in cls._named_fonts:
+            if len(cls._optional_fonts) > 0:
+                cls.load_optional_font(font_tuple[0], "bold" if len(font_tuple) == 3 and "bold" in font_tuple[2] else "normal")
+            cls._named_fonts[key] = Font(root=widget, font=font_tuple)
+            cls._named_font_reference_counts[key] = 0
+
+        cls._named_font_reference_counts[key] += 1
+        return cls._named_fonts[key].name
+
+    @classmethod
+    def release_named_font(cls, widget, font_tuple: Tuple):
+        """ named font gets deleted when it is not used anymore """
+        key = (widget.tk, font_tuple)
+        if key in cls._named_font_reference_counts:
+            cls._named_font_reference_counts[key] -= 1
+            if cls._named_font_reference_counts[key] <= 0:
+                del cls._named_font_reference_counts[key]
+                del cls._named_fonts[key]  # tkinter deletes the named font when the Font object is deleted
+
+    @classmethod
+    def measure_cached(cls, widget, font_tuple: Tuple, text: str) -> int:
+        """ returns width of text in pixel for scaled font tuple, measured with the shared named font if it exists,
+            results are cached, because tuple fonts do not change """
+        cache_key = (widget.tk, font_tuple, text)
+        width = cls._measure_cache.get(cache_key)
+
+        if width is None:
+            named_font = cls._named_fonts.get((widget.tk, font_tuple))
+            width = widget.tk.getint(widget.tk.call("font", "measure", font_tuple if named_font is None else named_font.name, text))
+            cls._measure_cache[cache_key] = width
+            if len(cls._measure_cache) > cls._measure_cache_max_size:
+                cls._measure_cache.popitem(last=False)  # remove least recently used width
+        else:
+            cls._measure_cache.move_to_end(cache_key)
+        return width
+
     @classmethod
     def load_font(cls, font_path: str) -> bool:
         # Windows
@@ -54,13 +125,73 @@ class FontManager:
 
         # Linux
         elif sys.platform.startswith("linux"):
-            try:
-                shutil.copy(font_path, os.path.expanduser(cls.linux_font_path))
-                return True
-            except Exception as err:
-                sys.stderr.write("FontManager error: " + str(err) + "\n")
-                return False
+            return cls.linux_install_font(font_path)
 
         # macOS and others
         else:
             return False
+
+    @classmethod
+    def linux_install_font(cls, font_path: str) -> bool:
+        """ copy font file into linux_font_path, skipped if an identical file is already installed """
+        installed_font_path = os.path.join(os.path.expanduser(cls.linux_font_path), os.path.basename(font_path))
+
+        try:
+            if os.path.isfile(installed_font_path) and cls._font_files_identical(font_path, installed_font_path):
+                return True
+
+            # copy to temporary file first, so that fontconfig never reads an incomplete font file
+            temporary_font_path = f"{installed_font_path}.{os.getpid()}.tmp"
+            shutil.copyfile(font_path, temporary_font_path)
+            os.replace(temporary_font_path, installed_font_path)
+            return True
+        except Exception as err:
+            sys.stderr.write("FontManager error: " + str(err) + "\n")
+            return False
+
+    @staticmethod
+    def _font_files_identical(font_path_1: str, font_path_2: str) -> bool:
+        """ compare size first and content hash only if sizes are equal """
+        if os.path.getsize(font_path_1) != os.path.getsize(font_path_2):
+            return False
+
+        hashes = []
+        for font_path in (font_path_1, font_path_2):
+            with open(font_path, "rb") as f:
+                hashes.append(hashlib.sha256(f.read()).digest())
+        return hashes[0] == hashes[1]
+
+    @classmethod
+    def register_optional_font(cls, font_path: str, family: str, weight: str = "normal"):
+        """ font file gets loaded when a font with family and weight is used for the first time, only supported on Windows """
+        if not sys.platform.startswith("win"):
+            raise ValueError("FontManager: optional fonts are only supported on Windows, use load_font() instead")
+        cls._optional_fonts.setdefault((family.lower(), weight.lower()), []).append(font_path)
+
+    @classmethod
+    def load_optional_font(cls, family: str, weight: str = "normal") -> bool:
+        """ load registered optional font files for family and weight, returns False if loading failed """
+        font_paths = cls._optional_fonts.pop((str(family).lower(), str(weight).lower()), [])
+        return all([cls.load_font(font_path) for font_path in font_paths])
+
+    @classmethod
+    def linux_register_font_directory(cls) -> bool:
+        """ add linux_font_path to the fonts of this process with fontconfig, needed if it is a private directory
+            which fontconfig does not scan, must be called after the fonts are installed and before Tk is initialized """
+        import ctypes
+        import ctypes.util
+
+        library_name = ctypes.util.find_library("fontconfig")
+        if library_name is None:
+            sys.stderr.write(f"FontManager warning: libfontconfig not found, font directory '{cls.linux_font_path}' " +
+                             "needs a <dir> entry in the fontconfig configuration\n")
+            return False
+
+        try:
+            fontconfig = ctypes.CDLL(library_name)
+            fontconfig.FcConfigAppFontAddDir.argtypes = [ctypes.c_void_p, ctypes.c_char_p]
+            fontconfig.FcConfigAppFontAddDir.restype = ctypes.c_int
+            return bool(fontconfig.FcConfigAppFontAddDir(None, os.fsencode(os.path.expanduser(cls.linux_font_path))))
+        except Exception as err:
+            sys.stderr.write("FontManager error: " + str(err) + "\n")
+            return False
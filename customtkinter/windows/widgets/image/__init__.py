@@ -1 +1,4 @@
 from .ctk_image import CTkImage
+from .ctk_animated_image import CTkAnimatedImage
+from .ctk_frame_buffer import CTkFrameBuffer
+from .image_cache import ImageCache
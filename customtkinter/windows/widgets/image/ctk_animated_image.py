@@ -0,0 +1,222 @@
+import time
+import tkinter
+import weakref
+from typing import Tuple, List, Union, Any
+try:
+    from PIL import Image, ImageTk
+except ImportError:
+    pass
+
+from .ctk_image import CTkImage
+from .image_cache import ImageCache
+
+
+class CTkAnimatedImage(CTkImage):
+    """
+    CTkImage for animated multi frame images (GIF, APNG, WebP), can be used in every widget that supports CTkImage:
+
+    light_image: PIL.Image.Image with one or more frames for light mode
+    dark_image: PIL.Image.Image with one or more frames for dark mode
+    size: tuple (<width>, <height>) with display size for both images
+    playing: start animation immediately
+
+    CTkAnimatedImage.from_file() creates an animated image from file paths.
+
+    All frames are decoded and scaled once per size and stored as one entry in the ImageCache, so they
+    count against the ImageCache memory budget. While an animation is playing and displayed, it keeps
+    a reference to the frames of the current size, so an eviction from the ImageCache does not make
+    every frame tick decode the frames again. All animated images are advanced by one shared timer,
+    which only runs when the next frame of an animation is due. Animations that are not shown in a
+    viewable widget (unmapped, withdrawn window, hidden tab) are paused.
+    """
+
+    default_frame_duration: int = 100  # ms, used if frame has no duration info
+    min_frame_duration: int = 20  # ms, very short frame durations are clamped like in web browsers
+    paused_check_interval: int = 250  # ms, interval to check if a paused animation became visible
+
+    _animated_images = weakref.WeakSet()
+    _timer_root: Union[tkinter.Tk, None] = None
+    _timer_id: Union[str, None] = None
+    _timer_time: float = 0  # monotonic time of scheduled timer call
+
+    def __init__(self,
+                 light_image: "Image.Image" = None,
+                 dark_image: "Image.Image" = None,
+                 size: Tuple[int, int] = (20, 20),
+                 playing: bool = True):
+
+        super().__init__(light_image=light_image, dark_image=dark_image, size=size)
+
+        self._playing = playing
+        self._frame_index = 0
+        self._frame_durations: List[int] = [self.default_frame_duration]  # durations of last displayed source
+        self._next_frame_time: float = 0
+        self._pinned_frames: Union[tuple, None] = None  # (source, scaled_size, cache_entry) while playing and displayed
+
+        CTkAnimatedImage._animated_images.add(self)
+
+    def play(self):
+        if not self._playing:
+            self._playing = True
+            self._next_frame_time = time.monotonic() + self._get_frame_duration() / 1000
+            self._schedule_timer()
+
+    def pause(self):
+        self._playing = False
+        self._pinned_frames = None
+
+    def add_configure_callback(self, callback):
+        """ add function, that gets called when image got configured or the next frame is due """
+        if len(self._configure_callback_list) == 0:
+            self._next_frame_time = time.monotonic() + self._get_frame_duration() / 1000
+        super().add_configure_callback(callback)
+        self._schedule_timer()
+
+    def remove_configure_callback(self, callback):
+        super().remove_configure_callback(callback)
+        if len(self._configure_callback_list) == 0:
+            self._pinned_frames = None  # not displayed anymore
+
+    def configure(self, **kwargs):
+        if "playing" in kwargs:
+            if kwargs.pop("playing"):
+                self.play()
+            else:
+                self.pause()
+        if "light_image" in kwargs or "dark_image" in kwargs:
+            self._frame_index = 0
+            self._pinned_frames = None
+        super().configure(**kwargs)
+
+    def cget(self, attribute_name: str) -> any:
+        if attribute_name == "playing":
+            return self._playing
+        return super().cget(attribute_name)
+
+    def create_scaled_photo_image(self, widget_scaling: float, appearance_mode: str) -> "ImageTk.PhotoImage":
+        scaled_size = self._get_scaled_size(widget_scaling)
+        has_light_image = self._light_image is not None or self._light_image_path is not None
+        has_dark_image = self._dark_image is not None or self._dark_image_path is not None
+
+        if (appearance_mode == "light" and has_light_image) or not has_dark_image:
+            source = self._light_image_path if self._light_image_path is not None else self._light_image
+        else:
+            source = self._dark_image_path if self._dark_image_path is not None else self._dark_image
+
+        frames = self._get_scaled_frames(source, scaled_size)
+        return frames[self._frame_index % len(frames)]
+
+    def _get_scaled_frames(self, source: Any, scaled_size: Tuple[int, int]) -> List["ImageTk.PhotoImage"]:
+        # one cache entry holds all frames and their durations
+        cache_entry = ImageCache.get(source, scaled_size, "frames")
+        if cache_entry is None:
+            pinned_frames = self._pinned_frames
+            if pinned_frames is not None and pinned_frames[0] is source and pinned_frames[1] == scaled_size:
+                cache_entry = pinned_frames[2]  # evicted, but still referenced, so only account for it again
+            else:
+                cache_entry = self._decode_frames(source, scaled_size)
+            ImageCache.put(source, scaled_size, "frames", cache_entry,
+                           size_bytes=len(cache_entry[0]) * scaled_size[0] * scaled_size[1] * 4)
+
+        if self._playing and len(self._configure_callback_list) > 0:
+            self._pinned_frames = (source, scaled_size, cache_entry)
+        else:
+            self._pinned_frames = None
+
+        frames, self._frame_durations = cache_entry
+        return frames
+
+    def _decode_frames(self, source: Any, scaled_size: Tuple[int, int]) -> Tuple[List["ImageTk.PhotoImage"], List[int]]:
+        high_quality_filter, _ = self._get_resample_filters()
+        image = Image.open(source) if isinstance(source, str) else source
+        frames, durations = [], []
+
+        try:
+            for frame_index in range(getattr(image, "n_frames", 1)):
+                image.seek(frame_index)
+                duration = image.info.get("duration") or self.default_frame_duration
+                durations.append(max(round(duration), self.min_frame_duration))
+                frames.append(ImageTk.PhotoImage(image.convert("RGBA").resize(scaled_size, high_quality_filter)))
+        finally:
+            if image is source:
+                image.seek(0)
+            else:
+                image.close()
+
+        return frames, durations
+
+    def _get_frame_duration(self) -> int:
+        return self._frame_durations[self._frame_index % len(self._frame_durations)]
+
+    def _is_visible(self) -> bool:
+        """ returns True if at least one widget which displays the image is viewable """
+        for callback in self._configure_callback_list:
+            widget = getattr(callback, "__self__", None)
+            if not isinstance(widget, tkinter.Misc):
+                return True  # callback was not added by a widget
+            try:
+                if widget.winfo_viewable():
+                    return True
+            except tkinter.TclError:
+                pass  # widget got destroyed
+        return False
+
+    def _advance_frame(self, current_time: float):
+        if not self._is_visible():
+            self._next_frame_time = current_time + self.paused_check_interval / 1000
+            return
+
+        self._frame_index = (self._frame_index + 1) % len(self._frame_durations)
+        frame_duration = self._get_frame_duration() / 1000
+
+        # keep constant frame rate, but do not try to catch up after a long pause
+        self._next_frame_time += frame_duration
+        if self._next_frame_time < current_time:
+            self._next_frame_time = current_time + frame_duration
+
+        self._call_configure_callbacks()
+
+    @classmethod
+    def _schedule_timer(cls):
+        """ schedule shared timer for the next due frame of all playing and displayed animations """
+        next_frame_times = [animated_image._next_frame_time for animated_image in cls._animated_images
+                            if animated_image._playing and len(animated_image._configure_callback_list) > 0]
+        if len(next_frame_times) == 0:
+            return
+        next_frame_time = min(next_frame_times)
+
+        # timer of a destroyed root window never fires, so forget it
+        if cls._timer_id is not None and (cls._timer_root is None or not cls._root_exists(cls._timer_root)):
+            cls._timer_root, cls._timer_id, cls._timer_time = None, None, 0
+
+        if cls._timer_id is not None:
+            if cls._timer_time <= next_frame_time:
+                return  # timer already runs early enough
+            try:
+                cls._timer_root.after_cancel(cls._timer_id)
+            except tkinter.TclError:
+                pass
+            cls._timer_id = None
+
+        root = tkinter._default_root
+        if root is None:
+            return
+
+        try:
+            delay = max(1, round((next_frame_time - time.monotonic()) * 1000))
+            cls._timer_id = root.after(delay, cls._on_timer)
+            cls._timer_root, cls._timer_time = root, next_frame_time
+        except tkinter.TclError:
+            pass  # root window got destroyed
+
+    @classmethod
+    def _on_timer(cls):
+        cls._timer_id = None
+        current_time = time.monotonic()
+
+        for animated_image in list(cls._animated_images):
+            if (animated_image._playing and len(animated_image._configure_callback_list) > 0
+                    and animated_image._next_frame_time <= current_time + 0.001):
+                animated_image._advance_frame(current_time)
+
+        cls._schedule_timer()
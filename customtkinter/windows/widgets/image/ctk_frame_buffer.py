@@ -0,0 +1,196 @@
+import tkinter
+import threading
+from fractions import Fraction
+from typing import Tuple, Dict, Union, Any
+
+from .ctk_image import CTkImage
+
+
+class CTkFrameBuffer(CTkImage):
+    """
+    Image for live video (camera feeds, simulations), can be used in every widget that supports CTkImage:
+
+    size: tuple (<width>, <height>) with display size, None means size of the frames
+    max_fps: maximum display rate, frames that arrive faster get dropped
+
+    New frames are passed with put_frame(), either as NumPy array (height x width x 3 RGB or RGBA, height x width
+    grayscale, dtype uint8) or as raw RGB bytes with width and height. The frame is written directly into one
+    Tk photo image per display size, which is updated in place, so no PIL objects and no new Tk images are created
+    per frame. PIL and NumPy are not required. Scaling is done by Tk (nearest-neighbor zoom and subsample).
+
+    put_frame() only keeps a reference to the latest frame, so the frame must not be modified after it was passed.
+    put_frame() makes no Tk calls and can be called from a capture thread, the latest frame is handed over with
+    a lock. While a widget displays the frame buffer, the main thread polls the latest frame max_fps times per second.
+    """
+
+    def __init__(self,
+                 size: Union[Tuple[int, int], None] = None,
+                 max_fps: float = 60):
+
+        # no call of CTkImage.__init__(), because CTkFrameBuffer does not need PIL
+        self._size = size
+        self._max_fps = max_fps
+        self._configure_callback_list = []
+
+        self._frame_size: Union[Tuple[int, int], None] = None  # size of last displayed frame
+        self._frame_data: Union[bytes, None] = None  # last displayed frame as PPM/PGM data
+        self._pending_frame: Union[tuple, None] = None  # (frame, width, height) of latest frame, not yet displayed
+        self._frame_lock = threading.Lock()  # guards _pending_frame and _dropped_frames, which are set by put_frame()
+        self._poll_root: Union[tkinter.Misc, None] = None  # root window of the running poll loop
+        self._displayed_frames = 0
+        self._dropped_frames = 0
+
+        self._scaled_photo_images: Dict[Tuple[int, int], tkinter.PhotoImage] = {}  # one photo image per display size
+        self._source_photo_image: Union[tkinter.PhotoImage, None] = None  # frame in original size, used for scaling
+        self._source_frame_number = 0  # value of _displayed_frames when frame was written to source photo image
+        self._scale_factors: Dict[tuple, Tuple[int, int, int, int]] = {}  # (frame size, scaled size) -> zoom and subsample
+
+    def put_frame(self, frame: Any, width: Union[int, None] = None, height: Union[int, None] = None):
+        """ display frame (NumPy array or raw RGB bytes with width and height), frames faster than max_fps are dropped """
+        if hasattr(frame, "shape"):
+            if str(frame.dtype) != "uint8":
+                raise ValueError(f"CTkFrameBuffer: frame array must have dtype uint8, not {frame.dtype}, convert it with frame.astype(numpy.uint8)")
+        elif width is None or height is None:
+            raise ValueError("CTkFrameBuffer: width and height must be given for raw RGB frames")
+        elif len(frame) != width * height * 3:
+            raise ValueError(f"CTkFrameBuffer: raw RGB frame must have {width * height * 3} bytes for size {width}x{height}, not {len(frame)}")
+
+        with self._frame_lock:
+            if self._pending_frame is not None:
+                self._dropped_frames += 1
+            self._pending_frame = (frame, width, height)
+
+    def add_configure_callback(self, callback):
+        """ add function, that gets called when image got configured, starts polling frames on the main thread """
+        super().add_configure_callback(callback)
+        self._start_polling()
+
+    def _start_polling(self):
+        if self._poll_root is not None and self._root_exists(self._poll_root):
+            return  # poll loop is running
+        root = self._poll_root = tkinter._default_root
+        if root is not None:
+            root.after(self._get_poll_interval(), lambda: self._poll(root))
+
+    def _get_poll_interval(self) -> int:
+        return max(1, round(1000 / self._max_fps))
+
+    def _poll(self, root: tkinter.Misc):
+        """ runs on main thread, displays latest frame, stops when no widget displays the frame buffer anymore """
+        if self._poll_root is not root:
+            return  # poll loop was restarted on another root window
+
+        self._flush_pending_frame()
+
+        if len(self._configure_callback_list) > 0:
+            try:
+                root.after(self._get_poll_interval(), lambda: self._poll(root))
+                return
+            except tkinter.TclError:
+                pass  # root window got destroyed, the loop gets restarted when a widget requests the image
+        self._poll_root = None
+
+    def configure(self, **kwargs):
+        if "size" in kwargs:
+            self._size = kwargs.pop("size")
+            self._scaled_photo_images.clear()
+        if "max_fps" in kwargs:
+            self._max_fps = kwargs.pop("max_fps")
+
+        self._call_configure_callbacks()
+
+    def cget(self, attribute_name: str) -> any:
+        if attribute_name == "size":
+            return self._size
+        if attribute_name == "max_fps":
+            return self._max_fps
+        if attribute_name == "frame_size":
+            return self._frame_size
+        if attribute_name == "displayed_frames":
+            return self._displayed_frames
+        if attribute_name == "dropped_frames":
+            return self._dropped_frames
+
+    def _get_scaled_size(self, widget_scaling: float) -> Tuple[int, int]:
+        size = self._size if self._size is not None else (self._frame_size or (1, 1))
+        return max(1, round(size[0] * widget_scaling)), max(1, round(size[1] * widget_scaling))
+
+    def create_scaled_photo_image(self, widget_scaling: float, appearance_mode: str) -> tkinter.PhotoImage:
+        self._flush_pending_frame()
+        self._start_polling()
+
+        scaled_size = self._get_scaled_size(widget_scaling)
+        photo_image = self._scaled_photo_images.get(scaled_size)
+        if photo_image is None:
+            photo_image = tkinter.PhotoImage(width=scaled_size[0], height=scaled_size[1])
+            self._scaled_photo_images[scaled_size] = photo_image
+            if self._frame_data is not None:
+                self._update_photo_image(photo_image, scaled_size)
+        return photo_image
+
+    def _flush_pending_frame(self):
+        with self._frame_lock:
+            if self._pending_frame is None:
+                return
+            frame, width, height = self._pending_frame
+            self._pending_frame = None
+
+        frame_size, self._frame_data = self._convert_frame(frame, width, height)
+        self._displayed_frames += 1
+
+        if frame_size != self._frame_size:
+            self._frame_size = frame_size
+            if self._size is None:
+                # display size follows frame size, widgets have to request photo images with the new size
+                self._scaled_photo_images.clear()
+                self._call_configure_callbacks()
+                return
+
+        for scaled_size, photo_image in self._scaled_photo_images.items():
+            self._update_photo_image(photo_image, scaled_size)
+
+    @staticmethod
+    def _convert_frame(frame: Any, width: Union[int, None], height: Union[int, None]) -> Tuple[Tuple[int, int], bytes]:
+        """ returns frame size and frame as binary PPM (RGB) or PGM (grayscale) data, which Tk reads without conversion """
+        if hasattr(frame, "shape"):
+            if len(frame.shape) == 2:
+                height, width = frame.shape
+                return (width, height), b"P5 %d %d 255\n" % (width, height) + frame.tobytes()
+            height, width, channels = frame.shape
+            if channels == 4:
+                frame = frame[:, :, :3]  # Tk photo data can not contain alpha channel
+            elif channels != 3:
+                raise ValueError(f"CTkFrameBuffer: frame must have 3 (RGB) or 4 (RGBA) channels, not {channels}")
+            return (width, height), b"P6 %d %d 255\n" % (width, height) + frame.tobytes()
+
+        return (width, height), b"P6 %d %d 255\n" % (width, height) + bytes(frame)
+
+    def _update_photo_image(self, photo_image: tkinter.PhotoImage, scaled_size: Tuple[int, int]):
+        if scaled_size == self._frame_size:
+            photo_image.tk.call(photo_image.name, "put", self._frame_data)
+            return
+
+        # write frame once into source photo image, Tk scales it into every display size
+        if self._source_photo_image is None:
+            self._source_photo_image = tkinter.PhotoImage()
+        if self._source_frame_number != self._displayed_frames:
+            self._source_photo_image.tk.call(self._source_photo_image.name, "configure", "-width", 0, "-height", 0, "-data", self._frame_data)
+            self._source_frame_number = self._displayed_frames
+
+        zoom_x, subsample_x, zoom_y, subsample_y = self._get_scale_factors(scaled_size)
+        photo_image.tk.call(photo_image.name, "copy", self._source_photo_image.name,
+                            "-zoom", zoom_x, zoom_y, "-subsample", subsample_x, subsample_y)
+
+    def _get_scale_factors(self, scaled_size: Tuple[int, int]) -> Tuple[int, int, int, int]:
+        """ returns zoom and subsample factors for x and y, result covers at least scaled_size and gets clipped by the photo image """
+        cache_key = (self._frame_size, scaled_size)
+        if cache_key not in self._scale_factors:
+            scale_factors = []
+            for frame_length, scaled_length in zip(self._frame_size, scaled_size):
+                ratio = Fraction(scaled_length, frame_length).limit_denominator(16)
+                zoom, subsample = ratio.numerator, ratio.denominator
+                while frame_length * zoom // subsample < scaled_length:
+                    zoom += 1
+                scale_factors += [zoom, subsample]
+            self._scale_factors[cache_key] = tuple(scale_factors)
+        return self._scale_factors[cache_key]
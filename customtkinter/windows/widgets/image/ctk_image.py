@@ -1,9 +1,16 @@
-from typing import Tuple, Dict, Callable, List
+import os
+import sys
+import tkinter
+import weakref
+from concurrent.futures import ThreadPoolExecutor, Future
+from typing import Tuple, Callable, List, Dict, Union
 try:
     from PIL import Image, ImageTk
 except ImportError:
     pass
 
+from .image_cache import ImageCache
+
 
 class CTkImage:
     """
@@ -14,10 +21,31 @@ class CTkImage:
     size: tuple (<width>, <height>) with display size for both images
 
     One of the two images can be None and will be replaced by the other image.
+
+    CTkImage.from_file() creates a lazy CTkImage from image file paths. The files are only decoded when a scaled
+    photo image is needed (JPEG files are decoded directly at reduced size with Pillow's draft mode) and the
+    decoded source is dropped afterwards, so only the scaled variants in the ImageCache stay in memory.
+    Scaled photo images are stored in the process-wide ImageCache, widgets must keep a reference to the
+    photo image they display.
+
+    Large images (at least async_resize_min_pixels source pixels) are resized with high quality in a thread pool,
+    meanwhile a fast nearest-neighbor placeholder is returned. When the resized image is ready, all functions
+    registered with add_configure_callback() are called, so widgets fetch the final image.
     """
 
     _checked_PIL_import = False
 
+    async_resize_enabled: bool = True
+    async_resize_min_pixels: int = 512 * 512
+    _resize_executor: Union[ThreadPoolExecutor, None] = None
+    _resize_jobs: Dict[tuple, list] = {}  # key: (id(source), size), value: [future, source, set of CTkImage weak references]
+    _resize_jobs_check_interval: int = 15  # ms
+    _resize_jobs_check_root: Union[tkinter.Misc, None] = None  # root window of the running check loop
+    _failed_resize_jobs: set = set()  # keys of failed resize jobs, these images are resized synchronously
+
+    _light_image_path: Union[str, None] = None  # set by from_file()
+    _dark_image_path: Union[str, None] = None
+
     def __init__(self,
                  light_image: "Image.Image" = None,
                  dark_image: "Image.Image" = None,
@@ -32,8 +60,26 @@ class CTkImage:
         self._size = size
 
         self._configure_callback_list: List[Callable] = []
-        self._scaled_light_photo_images: Dict[Tuple[int, int], ImageTk.PhotoImage] = {}
-        self._scaled_dark_photo_images: Dict[Tuple[int, int], ImageTk.PhotoImage] = {}
+
+    @classmethod
+    def from_file(cls,
+                  light_image_path: Union[str, None] = None,
+                  dark_image_path: Union[str, None] = None,
+                  size: Tuple[int, int] = (20, 20)) -> "CTkImage":
+        """ create CTkImage which decodes the image files only when a scaled photo image is needed """
+        if light_image_path is None and dark_image_path is None:
+            raise ValueError("CTkImage: No image path given, light_image_path is None and dark_image_path is None.")
+
+        ctk_image = cls.__new__(cls)
+        # interned absolute paths are the ImageCache source, so lazy images of the same file share scaled variants
+        for attribute_name, path in (("_light_image_path", light_image_path), ("_dark_image_path", dark_image_path)):
+            if path is not None:
+                if not os.path.isfile(path):
+                    raise FileNotFoundError(f"CTkImage: image file '{path}' does not exist")
+                setattr(ctk_image, attribute_name, sys.intern(os.path.abspath(path)))
+
+        ctk_image.__init__(size=size)
+        return ctk_image
 
     @classmethod
     def _check_pil_import(cls):
@@ -52,19 +98,22 @@ class CTkImage:
 
     def configure(self, **kwargs):
         if "light_image" in kwargs:
+            self._invalidate_source(self._light_image)
             self._light_image = kwargs.pop("light_image")
-            self._scaled_light_photo_images = {}
+            self._light_image_path = None
             self._check_images()
+            self._invalidate_source(self._light_image)  # image could have been modified in place
         if "dark_image" in kwargs:
+            self._invalidate_source(self._dark_image)
             self._dark_image = kwargs.pop("dark_image")
-            self._scaled_dark_photo_images = {}
+            self._dark_image_path = None
             self._check_images()
+            self._invalidate_source(self._dark_image)
         if "size" in kwargs:
             self._size = kwargs.pop("size")
 
         # call all functions registered with add_configure_callback()
-        for callback in self._configure_callback_list:
-            callback()
+        self._call_configure_callbacks()
 
     def cget(self, attribute_name: str) -> any:
         if attribute_name == "light_image":
@@ -73,6 +122,10 @@ class CTkImage:
             return self._dark_image
         if attribute_name == "size":
             return self._size
+        if attribute_name == "light_image_path":
+            return self._light_image_path
+        if attribute_name == "dark_image_path":
+            return self._dark_image_path
 
     def _check_images(self):
         # check types
@@ -82,41 +135,172 @@ class CTkImage:
             raise ValueError(f"CTkImage: dark_image must be instance if PIL.Image.Image, not {type(self._dark_image)}")
 
         # check values
-        if self._light_image is None and self._dark_image is None:
+        if self._light_image is None and self._dark_image is None and self._light_image_path is None and self._dark_image_path is None:
             raise ValueError("CTkImage: No image given, light_image is None and dark_image is None.")
 
         # check sizes
         if self._light_image is not None and self._dark_image is not None and self._light_image.size != self._dark_image.size:
             raise ValueError(f"CTkImage: light_image size {self._light_image.size} must be the same as dark_image size {self._dark_image.size}.")
 
+    @classmethod
+    def _invalidate_source(cls, source: Union["Image.Image", None]):
+        """ remove cached variants and pending resize jobs of source image """
+        if source is None:
+            return
+        ImageCache.invalidate(source)
+        for job_key, (_, cache_source, waiting_images) in list(CTkImage._resize_jobs.items()):
+            if cache_source is source:
+                del CTkImage._resize_jobs[job_key]  # result of running job is discarded
+                for ctk_image in list(waiting_images):
+                    ctk_image._call_configure_callbacks()  # fetch image again, which starts a new resize job
+        CTkImage._failed_resize_jobs = {job_key for job_key in CTkImage._failed_resize_jobs if job_key[0] != id(source)}
+
     def _get_scaled_size(self, widget_scaling: float) -> Tuple[int, int]:
         return round(self._size[0] * widget_scaling), round(self._size[1] * widget_scaling)
 
+    @staticmethod
+    def _get_resample_filters() -> Tuple[int, int]:
+        """ returns high quality and placeholder resample filter """
+        resampling = getattr(Image, "Resampling", Image)  # Image.Resampling exists since Pillow 9.1
+        return resampling.LANCZOS, resampling.NEAREST
+
+    def _get_scaled_photo_image(self, image: "Image.Image", scaled_size: Tuple[int, int], cache_source: any = None) -> "ImageTk.PhotoImage":
+        """ cache_source is the ImageCache source of the image (default: image itself) """
+        high_quality_filter, placeholder_filter = self._get_resample_filters()
+        if cache_source is None:
+            cache_source = image
+
+        photo_image = ImageCache.get(cache_source, scaled_size, high_quality_filter)
+        if photo_image is not None:
+            return photo_image
+        return self._create_scaled_photo_image(image, scaled_size, cache_source)
+
+    def _create_scaled_photo_image(self, image: "Image.Image", scaled_size: Tuple[int, int], cache_source: any) -> "ImageTk.PhotoImage":
+        """ called after a missed ImageCache lookup, returns high quality image or placeholder while image is resized in background """
+        high_quality_filter, placeholder_filter = self._get_resample_filters()
+
+        root = tkinter._default_root  # resized images are passed back to the main thread with after() of the root window
+        if (not self.async_resize_enabled or root is None or image.width * image.height < self.async_resize_min_pixels
+                or (id(cache_source), scaled_size) in CTkImage._failed_resize_jobs):
+            photo_image = ImageTk.PhotoImage(image.resize(scaled_size, high_quality_filter))
+            ImageCache.put(cache_source, scaled_size, high_quality_filter, photo_image)
+            return photo_image
+
+        self._start_resize_job(root, image, scaled_size, high_quality_filter, cache_source)
+
+        # placeholder is a fallback of the missed request, so it is not counted again in the statistics
+        photo_image = ImageCache.get(cache_source, scaled_size, placeholder_filter, count_statistics=False)
+        if photo_image is None:
+            photo_image = ImageTk.PhotoImage(image.resize(scaled_size, placeholder_filter))
+            ImageCache.put(cache_source, scaled_size, placeholder_filter, photo_image)
+        return photo_image
+
+    def _get_scaled_file_photo_image(self, image_path: str, scaled_size: Tuple[int, int]) -> "ImageTk.PhotoImage":
+        high_quality_filter, placeholder_filter = self._get_resample_filters()
+
+        photo_image = ImageCache.get(image_path, scaled_size, high_quality_filter)
+        if photo_image is not None:
+            return photo_image
+
+        # file is already being resized, do not decode it again for the placeholder
+        if (id(image_path), scaled_size) in CTkImage._resize_jobs:
+            photo_image = ImageCache.get(image_path, scaled_size, placeholder_filter, count_statistics=False)
+            if photo_image is not None:
+                CTkImage._resize_jobs[(id(image_path), scaled_size)][2].add(self)
+                return photo_image
+
+        # decoded image is not stored, it gets released after resizing (load() closes the file of single frame images)
+        image = Image.open(image_path)
+        image.draft(None, scaled_size)  # JPEG only: decode at reduced size (power of two), no effect for other formats
+        image.load()
+        return self._create_scaled_photo_image(image, scaled_size, cache_source=image_path)
+
+    def _start_resize_job(self, root: tkinter.Tk, image: "Image.Image", scaled_size: Tuple[int, int], resample_filter: int,
+                          cache_source: any = None):
+        if cache_source is None:
+            cache_source = image
+
+        job_key = (id(cache_source), scaled_size)
+        if job_key not in CTkImage._resize_jobs:
+            if CTkImage._resize_executor is None:
+                CTkImage._resize_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="CTkImage_resize")
+
+            image.load()  # lazy loading is not thread safe, so load image data on main thread
+            future = CTkImage._resize_executor.submit(image.resize, scaled_size, resample_filter)
+            CTkImage._resize_jobs[job_key] = [future, cache_source, weakref.WeakSet()]
+        CTkImage._resize_jobs[job_key][2].add(self)
+
+        # start check loop, also if the root window of the last check loop got destroyed while jobs were pending
+        check_root = CTkImage._resize_jobs_check_root
+        if check_root is None or not self._root_exists(check_root):
+            CTkImage._resize_jobs_check_root = root
+            root.after(self._resize_jobs_check_interval, lambda: CTkImage._check_resize_jobs(root))
+
+    @staticmethod
+    def _root_exists(root: tkinter.Misc) -> bool:
+        try:
+            return bool(root.winfo_exists())
+        except tkinter.TclError:
+            return False
+
+    @classmethod
+    def _check_resize_jobs(cls, root: tkinter.Tk):
+        """ runs on main thread, creates photo images of finished resize jobs and notifies the waiting CTkImage objects """
+        high_quality_filter, _ = cls._get_resample_filters()
+
+        if cls._resize_jobs_check_root is not root:
+            return  # check loop was restarted on another root window
+
+        for job_key, (future, cache_source, waiting_images) in list(cls._resize_jobs.items()):
+            if not future.done():
+                continue
+            del cls._resize_jobs[job_key]
+
+            if future.exception() is None:
+                ImageCache.put(cache_source, job_key[1], high_quality_filter, ImageTk.PhotoImage(future.result()))
+            else:
+                # report once, waiting images get resized synchronously when they fetch the image again
+                sys.stderr.write(f"CTkImage warning: resizing image to {job_key[1]} in background failed, "
+                                 f"resizing synchronously: {future.exception()!r}\n")
+                cls._failed_resize_jobs.add(job_key)
+            for ctk_image in list(waiting_images):
+                ctk_image._call_configure_callbacks()
+
+        if len(cls._resize_jobs) > 0:
+            try:
+                root.after(cls._resize_jobs_check_interval, lambda: cls._check_resize_jobs(root))
+                return
+            except tkinter.TclError:
+                pass  # root window got destroyed, the loop gets restarted on the next root window
+        cls._resize_jobs_check_root = None
+
+    def _call_configure_callbacks(self):
+        for callback in self._configure_callback_list:
+            callback()
+
     def _get_scaled_light_photo_image(self, scaled_size: Tuple[int, int]) -> "ImageTk.PhotoImage":
-        if scaled_size in self._scaled_light_photo_images:
-            return self._scaled_light_photo_images[scaled_size]
-        else:
-            self._scaled_light_photo_images[scaled_size] = ImageTk.PhotoImage(self._light_image.resize(scaled_size))
-            return self._scaled_light_photo_images[scaled_size]
+        if self._light_image_path is not None:
+            return self._get_scaled_file_photo_image(self._light_image_path, scaled_size)
+        return self._get_scaled_photo_image(self._light_image, scaled_size)
 
     def _get_scaled_dark_photo_image(self, scaled_size: Tuple[int, int]) -> "ImageTk.PhotoImage":
-        if scaled_size in self._scaled_dark_photo_images:
-            return self._scaled_dark_photo_images[scaled_size]
-        else:
-            self._scaled_dark_photo_images[scaled_size] = ImageTk.PhotoImage(self._dark_image.resize(scaled_size))
-            return self._scaled_dark_photo_images[scaled_size]
+        if self._dark_image_path is not None:
+            return self._get_scaled_file_photo_image(self._dark_image_path, scaled_size)
+        return self._get_scaled_photo_image(self._dark_image, scaled_size)
 
     def create_scaled_photo_image(self, widget_scaling: float, appearance_mode: str) -> "ImageTk.PhotoImage":
         scaled_size = self._get_scaled_size(widget_scaling)
+        has_light_image = self._light_image is not None or self._light_image_path is not None
+        has_dark_image = self._dark_image is not None or self._dark_image_path is not None
 
-        if appearance_mode == "light" and self._light_image is not None:
+        if appearance_mode == "light" and has_light_image:
             return self._get_scaled_light_photo_image(scaled_size)
-        elif appearance_mode == "light" and self._light_image is None:
+        elif appearance_mode == "light" and not has_light_image:
             return self._get_scaled_dark_photo_image(scaled_size)
 
-        elif appearance_mode == "dark" and self._dark_image is not None:
+        elif appearance_mode == "dark" and has_dark_image:
             return self._get_scaled_dark_photo_image(scaled_size)
-        elif appearance_mode == "dark" and self._dark_image is None:
+        elif appearance_mode == "dark" and not has_dark_image:
             return self._get_scaled_light_photo_image(scaled_size)
 
 
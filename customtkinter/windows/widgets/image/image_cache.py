@@ -0,0 +1,144 @@
+import time
+import tkinter
+import weakref
+from collections import OrderedDict
+from typing import Union, Tuple, Dict, Any
+
+
+class ImageCache:
+    """
+    Process-wide cache of scaled photo images, shared by all CTkImage objects. Entries are keyed by
+    identity of the source image, target size and resampling mode, so CTkImage objects created from the
+    same source share their scaled variants. The cache is bounded by max_bytes (least recently used
+    variants are evicted first), variants that were not used for idle_release_time seconds are released
+    by a timer of the root window. Sources are identified by id(), so a source image which got modified
+    in place has to be removed with invalidate().
+
+    Evicted photo images stay valid as long as a widget holds a reference to them.
+    """
+
+    max_bytes: int = 64 * 1024 * 1024
+    idle_release_time: float = 60  # seconds
+
+    _entries: "OrderedDict[tuple, list]" = OrderedDict()  # key: (id(source), size, resample), value: [photo_image, bytes, last_used, source_ref]
+    _current_bytes: int = 0
+    _statistics: Dict[str, int] = {"hits": 0, "misses": 0, "evictions": 0, "idle_releases": 0}
+    _idle_release_root: Union[tkinter.Misc, None] = None
+    _idle_release_id: Union[str, None] = None
+    _idle_release_min_interval: int = 1000  # ms
+
+    @classmethod
+    def get(cls, source: Any, size: Tuple[int, int], resample: Union[int, str, None] = None, count_statistics: bool = True) -> Union[Any, None]:
+        """ returns cached photo image or None, fallback lookups for the same request use count_statistics=False """
+        key = (id(source), size, resample)
+        entry = cls._entries.get(key)
+
+        if entry is None or entry[3]() is not source:
+            if count_statistics:
+                cls._statistics["misses"] += 1
+            return None
+
+        if count_statistics:
+            cls._statistics["hits"] += 1
+        entry[2] = time.monotonic()
+        cls._entries.move_to_end(key)
+        return entry[0]
+
+    @classmethod
+    def put(cls, source: Any, size: Tuple[int, int], resample: Union[int, str, None], photo_image: Any, size_bytes: Union[int, None] = None):
+        """ add photo image for source, evicts least recently used variants if max_bytes is exceeded, size_bytes defaults to RGBA size of one image """
+        key = (id(source), size, resample)
+        cls._remove(key)
+
+        try:
+            # entry gets removed when source image is garbage collected
+            source_ref = weakref.ref(source, lambda ref, key=key: cls._remove(key, ref))
+        except TypeError:
+            source_ref = lambda source=source: source  # source does not support weak references
+
+        if size_bytes is None:
+            size_bytes = size[0] * size[1] * 4
+        cls._entries[key] = [photo_image, size_bytes, time.monotonic(), source_ref]
+        cls._current_bytes += size_bytes
+
+        cls.release_idle_variants()
+        while cls._current_bytes > cls.max_bytes and len(cls._entries) > 1:
+            cls._remove(next(iter(cls._entries)))
+            cls._statistics["evictions"] += 1
+
+        cls._schedule_idle_release()
+
+    @classmethod
+    def invalidate(cls, source: Any) -> int:
+        """ remove all variants (every size and resampling mode) of source, returns number of removed variants """
+        keys = [key for key, entry in cls._entries.items() if key[0] == id(source) and entry[3]() is source]
+        for key in keys:
+            cls._remove(key)
+        return len(keys)
+
+    @classmethod
+    def release_idle_variants(cls, idle_time: Union[float, None] = None) -> int:
+        """ release variants which were not used for idle_time (default: idle_release_time) seconds, returns number of released variants """
+        idle_time = cls.idle_release_time if idle_time is None else idle_time
+        oldest_allowed_time = time.monotonic() - idle_time
+        released_variants = 0
+
+        # entries are ordered by last use, so only the beginning has to be checked
+        while len(cls._entries) > 0:
+            key, entry = next(iter(cls._entries.items()))
+            if entry[2] >= oldest_allowed_time:
+                break
+            cls._remove(key)
+            released_variants += 1
+
+        cls._statistics["idle_releases"] += released_variants
+        return released_variants
+
+    @classmethod
+    def get_statistics(cls) -> Dict[str, int]:
+        """ returns dict with number of entries, bytes, max_bytes, hits, misses, evictions and idle_releases """
+        return {"entries": len(cls._entries), "bytes": cls._current_bytes, "max_bytes": cls.max_bytes, **cls._statistics}
+
+    @classmethod
+    def _schedule_idle_release(cls):
+        """ schedule timer of the root window for the time the least recently used variant becomes idle """
+        # timer of a destroyed root window never fires, so forget it
+        if cls._idle_release_id is not None:
+            try:
+                if cls._idle_release_root.winfo_exists():
+                    return  # timer is already running
+            except tkinter.TclError:
+                pass
+            cls._idle_release_root, cls._idle_release_id = None, None
+
+        root = tkinter._default_root
+        if root is None or len(cls._entries) == 0:
+            return
+
+        oldest_last_used = next(iter(cls._entries.values()))[2]
+        delay = round((oldest_last_used + cls.idle_release_time - time.monotonic()) * 1000)
+        try:
+            cls._idle_release_id = root.after(max(delay, cls._idle_release_min_interval), lambda: cls._on_idle_release_timer(root))
+            cls._idle_release_root = root
+        except tkinter.TclError:
+            pass  # root window got destroyed
+
+    @classmethod
+    def _on_idle_release_timer(cls, root: tkinter.Misc):
+        if cls._idle_release_root is not root:
+            return  # timer was restarted on another root window
+        cls._idle_release_root, cls._idle_release_id = None, None
+        cls.release_idle_variants()
+        cls._schedule_idle_release()
+
+    @classmethod
+    def clear(cls):
+        cls._entries.clear()
+        cls._current_bytes = 0
+
+    @classmethod
+    def _remove(cls, key: tuple, source_ref: Union[weakref.ref, None] = None):
+        entry = cls._entries.get(key)
+        if entry is not None and (source_ref is None or entry[3] is source_ref):
+            del cls._entries[key]
+            cls._current_bytes -= entry[1]
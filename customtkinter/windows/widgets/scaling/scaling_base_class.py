@@ -1,4 +1,5 @@
-from typing import Union, Tuple
+import tkinter
+from typing import Union, Tuple, Dict, Hashable
 import copy
 import re
 try:
@@ -7,7 +8,7 @@ except ImportError:
     from typing_extensions import Literal
 
 from .scaling_tracker import ScalingTracker
-from ..font import CTkFont
+from ..font import CTkFont, FontManager
 
 
 class CTkScalingBaseClass:
@@ -23,6 +24,9 @@ class CTkScalingBaseClass:
     - _apply_window_scaling()
     - _reverse_window_scaling()
     - _apply_font_scaling()
+    - _scale_font_tuple()
+    - _release_font_scaling()
+    - _configure_scaled_font()
     - _apply_argument_scaling()
     - _apply_geometry_scaling()
     - _reverse_geometry_scaling()
@@ -31,6 +35,7 @@ class CTkScalingBaseClass:
     """
     def __init__(self, scaling_type: Literal["widget", "window"] = "widget"):
         self.__scaling_type = scaling_type
+        self.__named_fonts: Dict[Hashable, Tuple[tuple, str]] = {}  # shared named fonts used by this widget, key: font slot, value: (scaled font tuple, name)
 
         if self.__scaling_type == "widget":
             ScalingTracker.add_widget(self._set_scaling, self)  # add callback for automatic scaling changes
@@ -41,6 +46,9 @@ class CTkScalingBaseClass:
             self.__window_scaling = ScalingTracker.get_window_scaling(self)
 
     def destroy(self):
+        for font_slot in list(self.__named_fonts.keys()):
+            self._release_font_scaling(font_slot)
+
         if self.__scaling_type == "widget":
             ScalingTracker.remove_widget(self._set_scaling, self)
         elif self.__scaling_type == "window":
@@ -73,25 +81,63 @@ class CTkScalingBaseClass:
         assert self.__scaling_type == "window"
         return int(scaled_value / self.__window_scaling)
 
-    def _apply_font_scaling(self, font: Union[Tuple, CTkFont]) -> tuple:
-        """ Takes CTkFont object and returns tuple font with scaled size, has to be called again for every change of font object """
+    def _apply_font_scaling(self, font: Union[Tuple, CTkFont], font_slot: Hashable = "font") -> Union[tuple, str]:
+        """
+        Takes CTkFont object or tuple font and returns name of named tkinter font with scaled size, has to be called again
+        for every scaling change or if a tuple font is replaced. Named fonts of CTkFont objects follow changes of the CTkFont,
+        named fonts of tuple fonts are shared by all widgets with the same family, scaled size and style.
+        Every font slot holds one named font, the previous named font of the slot is released when it gets replaced.
+        """
         assert self.__scaling_type == "widget"
 
         if type(font) == tuple:
-            if len(font) == 1:
-                return font
-            elif len(font) == 2:
-                return font[0], -abs(round(font[1] * self.__widget_scaling))
-            elif len(font) == 3:
-                return font[0], -abs(round(font[1] * self.__widget_scaling)), font[2]
-            else:
-                raise ValueError(f"Can not scale font {font}. font needs to be tuple of len 1, 2 or 3")
+            scaled_font = self._scale_font_tuple(font)
+            if len(scaled_font) == 1:
+                self._release_font_scaling(font_slot)
+                return scaled_font
+
+            current_font = self.__named_fonts.get(font_slot)
+            if current_font is not None and current_font[0] == scaled_font:
+                return current_font[1]
+
+            # acquire before release, so a named font used by other slots is not deleted and created again
+            font_name = FontManager.acquire_named_font(self, scaled_font)
+            self._release_font_scaling(font_slot)
+            self.__named_fonts[font_slot] = scaled_font, font_name
+            return font_name
 
         elif isinstance(font, CTkFont):
-            return font.create_scaled_tuple(self.__widget_scaling)
+            self._release_font_scaling(font_slot)
+            return font.create_scaled_font(self.__widget_scaling)
         else:
             raise ValueError(f"Can not scale font '{font}' of type {type(font)}. font needs to be tuple or instance of CTkFont")
 
+    def _scale_font_tuple(self, font: Tuple) -> tuple:
+        """ returns tuple font with scaled size in pixel (negative size), fonts without size are returned unchanged """
+        assert self.__scaling_type == "widget"
+
+        if len(font) == 1:
+            return font
+        elif len(font) == 2:
+            return font[0], -abs(round(font[1] * self.__widget_scaling))
+        elif len(font) == 3:
+            return font[0], -abs(round(font[1] * self.__widget_scaling)), font[2]
+        else:
+            raise ValueError(f"Can not scale font {font}. font needs to be tuple of len 1, 2 or 3")
+
+    def _release_font_scaling(self, font_slot: Hashable = "font"):
+        """ release named font of tuple font acquired by _apply_font_scaling() for font_slot """
+        current_font = self.__named_fonts.pop(font_slot, None)
+        if current_font is not None:
+            FontManager.release_named_font(self, current_font[0])
+
+    @staticmethod
+    def _configure_scaled_font(widget: tkinter.Misc, font: Union[tuple, str]):
+        """ pass scaled font to tkinter widget, skipped if the widget uses this named font already,
+            because changes of a named font are applied to all widgets using it by Tk """
+        if str(widget.cget("font")) != str(font):
+            widget.configure(font=font)
+
     def _apply_argument_scaling(self, kwargs: dict) -> dict:
         assert self.__scaling_type == "widget"
 
@@ -0,0 +1 @@
+from .ctk_style import CTkStyle
@@ -0,0 +1,109 @@
+import tkinter
+import weakref
+from typing import Union, Tuple, Set
+
+from ..font import CTkFont
+from ..appearance_mode import CTkAppearanceModeBaseClass
+
+
+class CTkStyle:
+    """
+    Shared style object that can be passed to multiple widgets with the style argument.
+    All values are validated once when the style is created or configured, widgets reference the style
+    and only use values which were not set explicitly on the widget itself.
+
+    Configuring the style updates all referencing widgets in one batched pass on the next idle event,
+    so a restyle of hundreds of widgets is a single .configure() call.
+    The style only checks the value types, every widget checks the values again for its own class
+    (for example fg_color="transparent" is valid for CTkButton, but not for CTkCheckBox).
+
+    Supported attributes: fg_color, hover_color, border_color, text_color, text_color_disabled,
+    checkmark_color, placeholder_text_color, corner_radius, border_width, font
+    """
+
+    _valid_attributes: Set[str] = {"fg_color", "hover_color", "border_color", "text_color", "text_color_disabled",
+                                   "checkmark_color", "placeholder_text_color", "corner_radius", "border_width", "font"}
+
+    def __init__(self, **kwargs):
+        self._attributes: dict = {}
+        self._widgets = weakref.WeakSet()  # widgets which reference this style
+        self._changed_attributes: Set[str] = set()
+        self._update_root: Union[tkinter.Tk, None] = None  # root window of the scheduled update
+
+        self._attributes.update(self._check_attributes(kwargs))
+
+    def __contains__(self, attribute_name: str) -> bool:
+        return attribute_name in self._attributes
+
+    def _check_attributes(self, kwargs: dict) -> dict:
+        checked_attributes = {}
+        for attribute_name, value in kwargs.items():
+            if attribute_name not in self._valid_attributes:
+                raise ValueError(f"CTkStyle: '{attribute_name}' is not a supported attribute, supported are {sorted(self._valid_attributes)}")
+            elif "color" in attribute_name:
+                checked_attributes[attribute_name] = CTkAppearanceModeBaseClass._check_color_type(value, transparency=(attribute_name == "fg_color"))
+            elif attribute_name == "font":
+                if not isinstance(value, CTkFont) and not (type(value) == tuple and 2 <= len(value) <= 3):
+                    raise ValueError(f"CTkStyle: font must be tuple of len 2 or 3 or instance of CTkFont, not {value}")
+                checked_attributes[attribute_name] = value
+            elif not isinstance(value, (int, float)):
+                raise ValueError(f"CTkStyle: {attribute_name} must be int or float, not {type(value)}")
+            else:
+                checked_attributes[attribute_name] = value
+        return checked_attributes
+
+    def _add_widget(self, widget):
+        self._widgets.add(widget)
+
+    def _remove_widget(self, widget):
+        self._widgets.discard(widget)
+
+    def configure(self, **kwargs):
+        """ change style attributes, all referencing widgets get updated on the next idle event """
+        self._attributes.update(self._check_attributes(kwargs))
+        self._changed_attributes.update(kwargs.keys())
+
+        # the update is scheduled on the root window, because the callback of after_idle() gets deleted
+        # with the widget it is registered on, and a single widget can be destroyed before the idle event
+        if self._update_root is not None and not self._root_exists(self._update_root):
+            self._update_root = None  # root window got destroyed before the idle event
+
+        if self._update_root is None:
+            for widget in list(self._widgets):
+                try:
+                    root = widget._root()
+                    root.after_idle(self._update_widgets)
+                except tkinter.TclError:
+                    continue  # widget got destroyed without calling destroy() of the CTk widget
+                self._update_root = root
+                break
+
+    def cget(self, attribute_name: str) -> any:
+        if attribute_name in self._attributes:
+            return self._attributes[attribute_name]
+        elif attribute_name in self._valid_attributes:
+            return None
+        else:
+            raise ValueError(f"'{attribute_name}' is not a supported argument. Look at the documentation for supported arguments.")
+
+    def _update_widgets(self):
+        """ pass all attributes changed since the last update to the referencing widgets """
+        changed_attributes, self._changed_attributes = self._changed_attributes, set()
+        self._update_root = None
+
+        for widget in list(self._widgets):
+            try:
+                widget_exists = widget.winfo_exists()
+            except tkinter.TclError:
+                widget_exists = False
+            if not widget_exists:
+                self._widgets.discard(widget)  # widget got destroyed in the meantime
+                continue
+            widget._apply_style_changes(changed_attributes)
+
+    @staticmethod
+    def _root_exists(root: tkinter.Tk) -> bool:
+        try:
+            return bool(root.winfo_exists())
+        except tkinter.TclError:
+            return False
@@ -0,0 +1,4 @@
+from .mapped_document import MappedDocument
+from .lexer import CTkLexer, RegexLexer, PythonLexer
+from .highlighter import CTkHighlighter
+from .text_search import CTkTextSearch
@@ -0,0 +1,258 @@
+from __future__ import annotations
+import re
+import time
+import bisect
+import tkinter
+from typing import Dict, List, Tuple, Union, Optional, TYPE_CHECKING
+
+from ..theme import ThemeManager
+from .lexer import CTkLexer
+
+if TYPE_CHECKING:
+    from ..ctk_textbox import CTkTextbox
+
+
+class CTkHighlighter:
+    """
+    Incremental highlighting of a CTkTextbox with the tokens of a CTkLexer, created by CTkTextbox(lexer=...).
+
+    The visible lines are highlighted first, the rest of the text is highlighted in chunks of lines, which are
+    processed in time slices on the main loop. Pending ranges are stored as text marks, so they move with edits.
+    The Tcl command of the tkinter.Text is replaced by a Tcl proxy, which records the lines changed by
+    insert, delete and replace (also by the class bindings and undo/redo), only these lines are highlighted again.
+    """
+
+    _chunk_lines: int = 100  # number of lines tokenized together in the background
+    _time_slice: float = 0.008  # seconds of highlighting per main loop iteration
+    _tag_prefix: str = "ctk_highlight_"
+
+    _proxy_script = """
+        proc ::ctk_text_edit_proxy {orig var callback cmd args} {
+            switch -exact -- $cmd {
+                insert - delete - replace {
+                    # text inserted at end goes before the final newline of the text, one line above 'end'
+                    set index [$orig index [lindex $args 0]]
+                    if {[$orig compare $index == end]} {
+                        set index [$orig index end-1c]
+                    }
+                    set first [lindex [split $index .] 0]
+                    set result [$orig $cmd {*}$args]
+                    set newlines 0
+                    if {$cmd eq "insert"} {
+                        foreach {chars tags} [lrange $args 1 end] {incr newlines [regexp -all \\n $chars]}
+                    } elseif {$cmd eq "replace"} {
+                        foreach {chars tags} [lrange $args 2 end] {incr newlines [regexp -all \\n $chars]}
+                    }
+                    ::ctk_text_edit_record $var $callback $first [expr {$first + $newlines}]
+                    return $result
+                }
+                edit {
+                    if {[lindex $args 0] ni {undo redo}} {
+                        return [$orig $cmd {*}$args]
+                    }
+                    # the changed range is not reported, so record the lines around the insert cursor,
+                    # extended by the number of lines which were added or removed by undo/redo
+                    set lines_before [$orig count -lines 1.0 end]
+                    set result [$orig $cmd {*}$args]
+                    set span [expr {abs([$orig count -lines 1.0 end] - $lines_before) + 1}]
+                    set line [lindex [split [$orig index insert] .] 0]
+                    ::ctk_text_edit_record $var $callback [expr {$line - $span}] [expr {$line + $span}]
+                    return $result
+                }
+                default {
+                    return [$orig $cmd {*}$args]
+                }
+            }
+        }
+        proc ::ctk_text_edit_record {var callback first last} {
+            upvar #0 $var edits
+            if {![info exists edits] || [llength $edits] == 0} {
+                after idle $callback
+            }
+            lappend edits $first $last
+        }
+    """
+
+    _counter: int = 0  # used for unique Tcl variable and mark names
+
+    def __init__(self, textbox: CTkTextbox, lexer: CTkLexer, highlight_colors: Optional[Dict[str, Union[str, Tuple[str, str]]]] = None):
+        self._ctk_textbox = textbox
+        self._textbox: tkinter.Text = textbox._textbox
+        self._lexer = lexer
+        self._highlight_colors = {} if highlight_colors is None else highlight_colors
+
+        self._tags: Dict[str, str] = {}  # token type -> tag name
+        self._pending_ranges: List[Tuple[str, str]] = []  # (start mark, end mark) of lines to highlight
+        self._process_after_id = None
+        self._view_after_id = None
+
+        # replace widget command with edit recording proxy
+        CTkHighlighter._counter += 1
+        self._id = CTkHighlighter._counter
+        self._edits_variable = f"::ctk_text_edits_{self._id}"
+        self._path = str(self._textbox)
+        self._original_command = f"{self._path}_ctk_original"
+        self._edit_callback = self._textbox.register(self._process_edits)
+
+        self._textbox.tk.eval(self._proxy_script)
+        self._textbox.tk.call("rename", self._path, self._original_command)
+        self._textbox.tk.call("interp", "alias", "", self._path, "", "::ctk_text_edit_proxy",
+                              self._original_command, self._edits_variable, self._edit_callback)
+
+        self.rehighlight()
+
+    def destroy(self):
+        for after_id in (self._process_after_id, self._view_after_id):
+            if after_id is not None:
+                self._textbox.after_cancel(after_id)
+        self._process_after_id, self._view_after_id = None, None
+
+        # restore widget command, the original command does not exist anymore if the tkinter.Text was destroyed
+        self._textbox.tk.call("after", "cancel", self._edit_callback)
+        self._textbox.tk.call("rename", self._path, "")
+        if self._textbox.tk.call("info", "commands", self._original_command) != "":
+            self._textbox.tk.call("rename", self._original_command, self._path)
+
+            self._clear_pending_ranges()
+            if len(self._tags) > 0:
+                self._textbox.tag_delete(*self._tags.values())
+
+        self._textbox.tk.call("unset", "-nocomplain", self._edits_variable)
+        self._textbox.deletecommand(self._edit_callback)
+        self._tags = {}
+
+    def rehighlight(self):
+        """ highlight the whole text again, visible lines first """
+        self._clear_pending_ranges()
+        self._queue_lines(1, self._get_line_count())
+
+    def set_highlight_colors(self, highlight_colors: Optional[Dict[str, Union[str, Tuple[str, str]]]]):
+        self._highlight_colors = {} if highlight_colors is None else highlight_colors
+        self.update_colors()
+
+    def update_colors(self):
+        """ configure tag colors for current theme and appearance mode """
+        for token_type, tag in self._tags.items():
+            self._textbox.tag_configure(tag, foreground=self._get_color(token_type))
+
+    def _get_color(self, token_type: str) -> str:
+        color = self._highlight_colors.get(token_type)
+        if color is None:
+            color = ThemeManager.theme.get("CTkTextboxHighlighting", {}).get(f"{token_type}_color")
+        return "" if color is None else self._ctk_textbox._apply_appearance_mode(color)
+
+    def _get_tag(self, token_type: str) -> str:
+        tag = self._tags.get(token_type)
+        if tag is None:
+            tag = self._tags[token_type] = f"{self._tag_prefix}{token_type}"
+            self._textbox.tag_configure(tag, foreground=self._get_color(token_type))
+            self._textbox.tag_lower(tag)  # keep selection and search tags visible
+        return tag
+
+    def _get_line_count(self) -> int:
+        return int(self._textbox.index("end-1c").split(".")[0])
+
+    def _get_visible_lines(self) -> Tuple[int, int]:
+        return (int(self._textbox.index("@0,0").split(".")[0]),
+                int(self._textbox.index(f"@0,{self._textbox.winfo_height()}").split(".")[0]))
+
+    def _highlight_lines(self, first_line: int, last_line: int):
+        """ tokenize lines first_line to last_line together and replace their tags with one tag call per token type """
+        text = self._textbox.get(f"{first_line}.0", f"{last_line}.end")
+        line_starts = [0] + [match.end() for match in re.finditer("\n", text)]
+
+        def text_index(offset: int) -> str:
+            line = bisect.bisect_right(line_starts, offset) - 1
+            return f"{first_line + line}.{offset - line_starts[line]}"
+
+        tag_ranges: Dict[str, List[str]] = {}
+        for start, end, token_type in self._lexer.tokenize(text):
+            tag_ranges.setdefault(self._get_tag(token_type), []).extend((text_index(start), text_index(end)))
+
+        for tag in self._tags.values():
+            self._textbox.tag_remove(tag, f"{first_line}.0", f"{last_line}.end")
+        for tag, indices in tag_ranges.items():
+            self._textbox.tk.call(self._path, "tag", "add", tag, *indices)
+
+    def _queue_lines(self, first_line: int, last_line: int):
+        """ highlight visible part of the lines now, queue the lines after and before the view """
+        visible_first, visible_last = self._get_visible_lines()
+        view_first, view_last = max(first_line, visible_first), min(last_line, visible_last)
+
+        if view_first <= view_last:
+            self._highlight_lines(view_first, view_last)
+            self._add_pending_range(view_last + 1, last_line)
+            self._add_pending_range(first_line, view_first - 1)
+        else:
+            self._add_pending_range(first_line, last_line)
+
+    def _add_pending_range(self, first_line: int, last_line: int):
+        if first_line > last_line:
+            return
+
+        CTkHighlighter._counter += 1
+        start_mark, end_mark = f"ctk_highlight_start_{CTkHighlighter._counter}", f"ctk_highlight_end_{CTkHighlighter._counter}"
+        self._textbox.mark_set(start_mark, f"{first_line}.0")
+        self._textbox.mark_gravity(start_mark, "left")
+        self._textbox.mark_set(end_mark, f"{last_line}.end")
+        self._pending_ranges.append((start_mark, end_mark))
+
+        if self._process_after_id is None:
+            self._process_after_id = self._textbox.after(1, self._process_pending_ranges)
+
+    def _clear_pending_ranges(self):
+        for start_mark, end_mark in self._pending_ranges:
+            self._textbox.mark_unset(start_mark, end_mark)
+        self._pending_ranges = []
+
+    def _process_pending_ranges(self):
+        """ highlight chunks of pending lines for one time slice """
+        self._process_after_id = None
+        start_time = time.perf_counter()
+
+        while len(self._pending_ranges) > 0 and time.perf_counter() - start_time < self._time_slice:
+            start_mark, end_mark = self._pending_ranges[0]
+            first_line = int(self._textbox.index(start_mark).split(".")[0])
+            last_line = int(self._textbox.index(end_mark).split(".")[0])
+            chunk_last_line = min(last_line, first_line + self._chunk_lines - 1)
+
+            if first_line <= chunk_last_line:
+                self._highlight_lines(first_line, chunk_last_line)
+
+            if chunk_last_line >= last_line:
+                self._textbox.mark_unset(start_mark, end_mark)
+                self._pending_ranges.pop(0)
+            else:
+                self._textbox.mark_set(start_mark, f"{chunk_last_line + 1}.0")
+
+        if len(self._pending_ranges) > 0:
+            self._process_after_id = self._textbox.after(1, self._process_pending_ranges)
+
+    def _process_edits(self):
+        """ called on idle after edits, highlights the changed lines """
+        edits = self._textbox.tk.splitlist(self._textbox.tk.call("set", self._edits_variable))
+        self._textbox.tk.call("set", self._edits_variable, "")
+
+        line_count = self._get_line_count()
+        for first_line, last_line in zip(edits[0::2], edits[1::2]):
+            first_line, last_line = max(1, int(first_line)), min(line_count, int(last_line))
+            if last_line - first_line < self._chunk_lines:
+                if first_line <= last_line:
+                    self._highlight_lines(first_line, last_line)
+            else:
+                self._queue_lines(first_line, last_line)
+
+    def view_changed(self):
+        """ called by CTkTextbox if the view changed, visible lines get highlighted first if ranges are pending """
+        if len(self._pending_ranges) > 0 and self._view_after_id is None:
+            self._view_after_id = self._textbox.after_idle(self._highlight_visible_pending_lines)
+
+    def _highlight_visible_pending_lines(self):
+        self._view_after_id = None
+        visible_first, visible_last = self._get_visible_lines()
+
+        for start_mark, end_mark in self._pending_ranges:
+            first_line = max(visible_first, int(self._textbox.index(start_mark).split(".")[0]))
+            last_line = min(visible_last, int(self._textbox.index(end_mark).split(".")[0]))
+            if first_line <= last_line:
+                self._highlight_lines(first_line, last_line)
@@ -0,0 +1,57 @@
+import re
+import keyword
+import builtins
+from typing import Iterable, List, Tuple, Union, Dict
+
+
+class CTkLexer:
+    """
+    Base class for lexers of the CTkTextbox highlighting. Custom lexers implement tokenize(), which gets
+    the text of complete lines and returns the tokens as (start, end, token_type) character offsets.
+    Edited lines are tokenized again without the lines before, so tokens should not depend on previous lines.
+
+    The token_type selects the tag color, which is the theme color '<token_type>_color' of 'CTkTextboxHighlighting'
+    or a color passed with highlight_colors to CTkTextbox.
+    """
+
+    def tokenize(self, text: str) -> Iterable[Tuple[int, int, str]]:
+        raise NotImplementedError
+
+
+class RegexLexer(CTkLexer):
+    """
+    Lexer for a list of (token_type, pattern) rules, which get combined into one regular expression,
+    earlier rules have precedence if they match at the same position. Patterns must not contain named groups.
+    """
+
+    def __init__(self, rules: Union[List[Tuple[str, str]], Dict[str, str]], flags: int = re.MULTILINE):
+        if isinstance(rules, dict):
+            rules = list(rules.items())
+
+        self._token_types: Dict[str, str] = {}
+        group_patterns = []
+        for i, (token_type, pattern) in enumerate(rules):
+            self._token_types[f"t{i}"] = token_type
+            group_patterns.append(f"(?P<t{i}>{pattern})")
+        self._pattern = re.compile("|".join(group_patterns), flags)
+
+    def tokenize(self, text: str) -> Iterable[Tuple[int, int, str]]:
+        token_types = self._token_types
+        for match in self._pattern.finditer(text):
+            if match.end() > match.start():
+                yield match.start(), match.end(), token_types[match.lastgroup]
+
+
+class PythonLexer(RegexLexer):
+    """ lexer for Python source code, multi-line strings are only recognized if they are tokenized together """
+
+    def __init__(self):
+        builtin_names = [name for name in dir(builtins) if not name.startswith("_")]
+        super().__init__([("comment", r"#[^\n]*"),
+                          ("string", r"[rRbBuUfF]{0,2}(?:'''[\s\S]*?'''|\"\"\"[\s\S]*?\"\"\"|'(?:\\.|[^'\\\n])*'|\"(?:\\.|[^\"\\\n])*\")"),
+                          ("decorator", r"^[ \t]*@[\w.]+"),
+                          ("keyword", r"\b(?:" + "|".join(keyword.kwlist) + r")\b"),
+                          ("builtin", r"\b(?:" + "|".join(builtin_names) + r")\b"),
+                          ("number", r"\b(?:0[xX][0-9a-fA-F_]+|0[bB][01_]+|0[oO][0-7_]+|\d[\d_]*\.?[\d_]*(?:[eE][+-]?\d+)?j?)\b"),
+                          ("function", r"(?<=\bdef )\w+"),
+                          ("class", r"(?<=\bclass )\w+")])
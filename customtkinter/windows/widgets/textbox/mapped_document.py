@@ -0,0 +1,182 @@
+import os
+import re
+import mmap
+import bisect
+import threading
+from array import array
+from typing import Union, Tuple, Optional
+
+
+class MappedDocument:
+    """
+    Read-only text file which is memory-mapped instead of loaded into memory. The byte offsets of the
+    line starts are indexed in a background thread, lines can be decoded by line number as soon as they
+    are indexed. Line numbers start at 1 like the line numbers of tkinter.Text indices.
+    Used by CTkTextbox.open_document(), but can also be used on its own.
+    """
+
+    _index_chunk_lines: int = 65536  # number of lines after which the indexed line count is published
+    _find_chunk_size: int = 1 << 20  # bytes searched per regex call, the GIL is released between the calls
+
+    def __init__(self, path: Union[str, os.PathLike], encoding: str = "utf-8"):
+        self._path = path
+        self._encoding = encoding
+
+        self._file = open(path, "rb")
+        if os.fstat(self._file.fileno()).st_size > 0:
+            self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            self._data = b""  # empty files can not be memory-mapped
+
+        # byte offsets of the line starts, only appended by the index thread
+        self._line_starts = array("Q", [0])
+        self._line_count: int = 0  # number of completely indexed lines
+        self._index_complete = threading.Event()
+        self._stop_indexing = threading.Event()
+        self._closed = False
+        self._data_lock = threading.Lock()  # held by find() while using the mapped data, so close() waits for it
+
+        self._index_thread = threading.Thread(target=self._build_index, name="MappedDocument_index", daemon=True)
+        self._index_thread.start()
+
+    def _build_index(self):
+        """ runs in the background thread, collects the offsets of the line starts """
+        data, line_starts, size = self._data, self._line_starts, len(self._data)
+        position = 0
+
+        while not self._stop_indexing.is_set():
+            for _ in range(self._index_chunk_lines):
+                position = data.find(b"\n", position) + 1
+                if position <= 0 or position >= size:
+                    break
+                line_starts.append(position)
+            else:
+                self._line_count = len(line_starts) - 1
+                continue
+            break
+
+        if not self._stop_indexing.is_set():
+            self._line_count = len(line_starts) if size > 0 else 0
+            self._index_complete.set()
+
+    @property
+    def path(self) -> Union[str, os.PathLike]:
+        return self._path
+
+    @property
+    def size(self) -> int:
+        """ size of the file in bytes """
+        return len(self._data)
+
+    @property
+    def line_count(self) -> int:
+        """ number of lines indexed so far, final number of lines if index_complete is True """
+        return self._line_count
+
+    @property
+    def index_complete(self) -> bool:
+        return self._index_complete.is_set()
+
+    def wait_for_index(self, timeout: Optional[float] = None) -> bool:
+        """ block until the line index is complete, returns index_complete """
+        return self._index_complete.wait(timeout)
+
+    def get_index_progress(self) -> float:
+        """ fraction of the file which is indexed (0 to 1) """
+        if self.index_complete or self.size == 0:
+            return 1.0
+        return self._line_starts[self._line_count] / self.size
+
+    def get_lines(self, first_line: int, last_line: int) -> str:
+        """ decoded text of the lines first_line to last_line (inclusive), without trailing newline """
+        first_line = max(1, first_line)
+        last_line = min(self._line_count, last_line)
+        if first_line > last_line:
+            return ""
+
+        start = self._line_starts[first_line - 1]
+        if last_line < len(self._line_starts):
+            end = self._line_starts[last_line] - 1  # newline of last_line
+        else:
+            end = self.size - 1 if self._data[-1:] == b"\n" else self.size
+
+        text = self._data[start:end].decode(self._encoding, errors="replace")
+        if "\r" in text:
+            text = text.replace("\r\n", "\n")
+            if text.endswith("\r"):
+                text = text[:-1]
+        return text
+
+    def get_line(self, line: int) -> str:
+        return self.get_lines(line, line)
+
+    def find(self, pattern: str, start_line: int = 1, start_column: int = 0,
+             regex: bool = False, nocase: bool = False) -> Optional[Tuple[int, int, int]]:
+        """ search pattern in the mapped file starting at start_line.start_column, without decoding the file,
+            returns (line, column, length) of the first match or None, length is the number of characters.
+            The file is searched in chunks ending at line ends, so matches spanning more than a chunk are not found.
+            Blocks until the match is found and waits for the index if start_line is not indexed yet,
+            so call it from a background thread for large files (CTkTextbox.find_in_document() does). """
+        byte_pattern = pattern if regex else re.escape(pattern)
+        compiled_pattern = re.compile(byte_pattern.encode(self._encoding), re.MULTILINE | (re.IGNORECASE if nocase else 0))
+
+        while start_line > len(self._line_starts) and not self.index_complete:
+            if self._closed:
+                return None
+            self._index_complete.wait(0.05)
+        if start_line > len(self._line_starts):
+            return None
+
+        with self._data_lock:
+            if self._closed:
+                return None
+            line_start = self._line_starts[max(1, start_line) - 1]
+            position = line_start + len(self.get_line(start_line)[:start_column].encode(self._encoding))
+
+        match = None
+        while match is None and position < self.size:
+            with self._data_lock:
+                if self._closed:
+                    return None
+                end = self._data.find(b"\n", min(self.size, position + self._find_chunk_size))
+                end = self.size if end < 0 else end
+                match = compiled_pattern.search(self._data, position, end)
+                position = end if end > position else self.size
+
+        if match is None:
+            return None
+
+        line = self._get_line_of_offset(match.start())
+        with self._data_lock:
+            if self._closed:
+                return None
+            line_start = self._data.rfind(b"\n", 0, match.start()) + 1
+            column = len(self._data[line_start:match.start()].decode(self._encoding, errors="replace"))
+            length = len(self._data[match.start():match.end()].decode(self._encoding, errors="replace"))
+        return line, column, length
+
+    def _get_line_of_offset(self, offset: int) -> int:
+        indexed_count = len(self._line_starts)
+        if offset < self._line_starts[indexed_count - 1] or self.index_complete:
+            return bisect.bisect_right(self._line_starts, offset)
+
+        # offset is behind the indexed part, count the remaining newlines in chunks
+        line, position = indexed_count, self._line_starts[indexed_count - 1]
+        while position < offset:
+            chunk_end = min(offset, position + (1 << 24))
+            with self._data_lock:
+                if self._closed:
+                    return line
+                line += self._data[position:chunk_end].count(b"\n")
+            position = chunk_end
+        return line
+
+    def close(self):
+        """ stop indexing and release the memory-mapped file """
+        self._stop_indexing.set()
+        self._index_thread.join()
+        with self._data_lock:
+            self._closed = True
+            if isinstance(self._data, mmap.mmap):
+                self._data.close()
+            self._file.close()
@@ -0,0 +1,206 @@
+from __future__ import annotations
+import re
+import bisect
+import threading
+import tkinter
+from typing import Callable, List, Tuple, Union, Optional, TYPE_CHECKING
+
+from ..theme import ThemeManager
+
+if TYPE_CHECKING:
+    from ..ctk_textbox import CTkTextbox
+
+
+class CTkTextSearch:
+    """
+    Find-all search of a CTkTextbox, created by CTkTextbox.find_all().
+
+    The matches are searched in a background thread on a snapshot of the text and are indexed by line,
+    the main loop polls the found matches, tags the visible matches first and the others in batches.
+    The text is searched in chunks ending at line ends, so the search thread releases the GIL regularly
+    and the main loop stays responsive, matches spanning more than a chunk are not found.
+    get_match_count() and the callback report the number of matches found so far before all are tagged.
+    """
+
+    _poll_interval: int = 30  # interval in ms, to tag new matches and report the count
+    _search_chunk_size: int = 1 << 16  # characters searched per regex call
+    _astral_pattern = re.compile("[\U00010000-\U0010FFFF]")  # characters outside the BMP
+    _tag_batch: int = 2000  # maximum number of matches tagged per poll (besides the visible ones)
+    match_tag: str = "ctk_search_match"
+    current_tag: str = "ctk_search_current"
+
+    def __init__(self, textbox: CTkTextbox, pattern: str, regex: bool = False, whole_word: bool = False, nocase: bool = False,
+                 callback: Union[Callable[[int, bool], None], None] = None):
+        self._ctk_textbox = textbox
+        self._textbox: tkinter.Text = textbox._textbox
+        self._pattern = pattern
+        self._callback = callback
+
+        expression = pattern if regex else re.escape(pattern)
+        if whole_word:
+            expression = rf"\b(?:{expression})\b"
+        self._compiled_pattern = re.compile(expression, re.MULTILINE | (re.IGNORECASE if nocase else 0))  # raises re.error
+
+        self._text = self._textbox.get("1.0", "end-1c")
+        self._matches: List[Tuple[int, int, int]] = []  # (line, column, length), appended by the search thread
+
+        # Tk 8.6 counts characters outside the BMP (like emoji) as two characters in text indices
+        self._count_astral_twice = self._textbox.tk.call("string", "length", "\U0001F600") == 2
+        self._tagged_count = 0
+        self._reported_count = -1
+        self._complete = threading.Event()
+        self._stop = threading.Event()
+        self._poll_after_id = None
+
+        self._configure_tags()
+        self._textbox.tag_remove(self.match_tag, "1.0", "end")
+        self._textbox.tag_remove(self.current_tag, "1.0", "end")
+
+        if pattern == "":
+            self._complete.set()
+            self._poll()
+        else:
+            threading.Thread(target=self._search, name="CTkTextSearch", daemon=True).start()
+            self._poll_after_id = self._textbox.after(self._poll_interval, self._poll)
+
+    @property
+    def pattern(self) -> str:
+        return self._pattern
+
+    @property
+    def text(self) -> str:
+        """ snapshot of the text, which is searched """
+        return self._text
+
+    def is_complete(self) -> bool:
+        """ True if all matches are found """
+        return self._complete.is_set()
+
+    def get_match_count(self) -> int:
+        """ number of matches found so far, final number if is_complete() """
+        return len(self._matches)
+
+    def get_matches(self) -> List[Tuple[int, int, int]]:
+        """ (line, column, length) of the matches found so far, column and length count characters like Tk text indices """
+        return self._matches[:]
+
+    def _search(self):
+        """ runs in the background thread, indexes the matches by line and column """
+        text, text_length = self._text, len(self._text)
+        count_astral = self._count_astral_twice and self._astral_pattern.search(text) is not None
+        line, line_start, line_astral = 1, 0, 0  # line_astral: characters outside the BMP from line_start to counted
+        position, counted = 0, 0  # counted: position up to which newlines are counted
+
+        while position < text_length:
+            if self._stop.is_set():
+                return
+
+            chunk_end = text.find("\n", min(text_length, position + self._search_chunk_size)) + 1
+            chunk_end = text_length if chunk_end <= 0 else chunk_end
+            match = self._compiled_pattern.search(text, position, chunk_end)
+            end = chunk_end if match is None else match.start()
+
+            newlines = text.count("\n", counted, end)
+            if newlines > 0:
+                line += newlines
+                line_start = text.rfind("\n", counted, end) + 1
+                line_astral = len(self._astral_pattern.findall(text, line_start, end)) if count_astral else 0
+            elif count_astral:
+                line_astral += len(self._astral_pattern.findall(text, counted, end))
+            counted = end
+
+            if match is None:
+                position = chunk_end
+            elif match.end() == match.start():
+                position = match.end() + 1
+            else:
+                length = match.end() - match.start()
+                if count_astral:
+                    length += len(self._astral_pattern.findall(text, match.start(), match.end()))
+                self._matches.append((line, match.start() - line_start + line_astral, length))
+                position = match.end()
+
+        self._complete.set()
+
+    def _poll(self):
+        """ tag visible matches and a batch of the other matches, report the count """
+        self._poll_after_id = None
+        match_count = len(self._matches)
+
+        # visible matches first
+        visible_first = int(self._textbox.index("@0,0").split(".")[0])
+        visible_last = int(self._textbox.index(f"@0,{self._textbox.winfo_height()}").split(".")[0])
+        first = max(self._tagged_count, bisect.bisect_left(self._matches, (visible_first,), 0, match_count))
+        last = bisect.bisect_left(self._matches, (visible_last + 1,), 0, match_count)
+        self._tag_matches(first, last)
+
+        batch_end = min(match_count, self._tagged_count + self._tag_batch)
+        self._tag_matches(self._tagged_count, batch_end)
+        self._tagged_count = batch_end
+
+        # count is final if search is complete and no match was added after reading the count
+        done = self.is_complete() and match_count == len(self._matches) and self._tagged_count == match_count
+        if self._callback is not None and (match_count != self._reported_count or done):
+            self._reported_count = match_count
+            self._callback(match_count, done)
+
+        if not done:
+            self._poll_after_id = self._textbox.after(self._poll_interval, self._poll)
+
+    def _tag_matches(self, first: int, last: int):
+        if first >= last:
+            return
+        indices = []
+        for line, column, length in self._matches[first:last]:
+            indices.extend((f"{line}.{column}", f"{line}.{column} + {length} chars"))
+        self._textbox.tk.call(str(self._textbox), "tag", "add", self.match_tag, *indices)
+
+    def _configure_tags(self):
+        theme_colors = ThemeManager.theme.get("CTkTextboxHighlighting", {})
+        for tag, color_name in ((self.match_tag, "search_match_color"), (self.current_tag, "search_current_color")):
+            color = theme_colors.get(color_name)
+            self._textbox.tag_configure(tag, background="" if color is None else self._ctk_textbox._apply_appearance_mode(color))
+        self._textbox.tag_raise(self.match_tag)
+        self._textbox.tag_raise(self.current_tag)
+        self._textbox.tag_raise("sel")
+
+    def update_colors(self):
+        """ configure tag colors for current theme and appearance mode """
+        self._configure_tags()
+
+    def next(self) -> Optional[str]:
+        """ select next match after the insert cursor (wraps around), returns its index or None """
+        return self._select_match(forward=True)
+
+    def previous(self) -> Optional[str]:
+        """ select previous match before the insert cursor (wraps around), returns its index or None """
+        return self._select_match(forward=False)
+
+    def _select_match(self, forward: bool) -> Optional[str]:
+        match_count = len(self._matches)
+        if match_count == 0:
+            return None
+
+        line, column = (int(value) for value in self._textbox.index("insert").split("."))
+        if forward:
+            match_index = bisect.bisect_right(self._matches, (line, column, float("inf")), 0, match_count) % match_count
+        else:
+            match_index = (bisect.bisect_left(self._matches, (line, column), 0, match_count) - 1) % match_count
+
+        line, column, length = self._matches[match_index]
+        index = f"{line}.{column}"
+        self._textbox.tag_remove(self.current_tag, "1.0", "end")
+        self._textbox.tag_add(self.current_tag, index, f"{index} + {length} chars")
+        self._textbox.mark_set("insert", index)
+        self._textbox.see(index)
+        return index
+
+    def cancel(self, remove_tags: bool = True):
+        """ stop searching and tagging, with remove_tags=True the match tags are removed """
+        self._stop.set()
+        if self._poll_after_id is not None:
+            self._textbox.after_cancel(self._poll_after_id)
+            self._poll_after_id = None
+        if remove_tags:
+            self._textbox.tag_remove(self.match_tag, "1.0", "end")
+            self._textbox.tag_remove(self.current_tag, "1.0", "end")
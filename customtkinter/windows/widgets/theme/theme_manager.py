@@ -1,47 +1,226 @@
 import sys
 import os
 import json
-from typing import List, Union
+import marshal
+import hashlib
+import weakref
+from types import MappingProxyType
+from typing import List, Union, Dict, Tuple, Mapping, Any
 
 
 class ThemeManager:
+    """
+    Loads .json theme files into ThemeManager.theme.
 
-    theme: dict = {}  # contains all the theme data
+    Theme files get compiled once into a platform specific snapshot (platform variants resolved, values validated).
+    Snapshots are kept in memory, keyed by modification time and size of the theme file, so loading an
+    unchanged theme again in the same process does not need to parse, filter and validate the theme file.
+    ThemeManager.theme is a read-only view of the snapshot, so loading a theme does not copy it,
+    single values are changed with set_theme_value(), which copies only the changed widget class.
+    get_theme_value() returns a single value with two dict lookups (cheaper than a flattened table, which
+    would have to be built on every load).
+
+    With theme_cache_directory (or the CUSTOMTKINTER_THEME_CACHE environment variable) snapshots are also
+    cached on disk in marshal format, keyed by modification time, size and hash of the theme file.
+    The disk cache is disabled by default, so importing customtkinter does not write any files.
+
+    apply_theme() switches the theme of already existing widgets and windows, which are registered
+    with _add_widget(). Every registered object must implement _apply_theme_colors().
+    """
+
+    theme: Mapping[str, Mapping[str, Any]] = MappingProxyType({})  # contains all the theme data (read-only)
     _built_in_themes: List[str] = ["blue", "green", "dark-blue", "sweetkind"]
     _currently_loaded_theme: Union[str, None] = None
 
+    # compiled theme snapshots, key: absolute path, value: (mtime_ns, size, read-only theme view)
+    _compiled_themes: Dict[str, Tuple[int, int, Mapping]] = {}
+    theme_cache_directory: Union[str, None] = os.environ.get("CUSTOMTKINTER_THEME_CACHE")  # None disables disk cache
+    _theme_cache_version: int = 1
+
+    _widgets = weakref.WeakSet()  # widgets and windows that get recolored by apply_theme()
+
+    if sys.platform == "darwin":
+        _platform_name = "macOS"
+    elif sys.platform.startswith("win"):
+        _platform_name = "Windows"
+    else:
+        _platform_name = "Linux"
+
     @classmethod
     def load_theme(cls, theme_name_or_path: str):
         script_directory = os.path.dirname(os.path.abspath(__file__))
 
         if theme_name_or_path in cls._built_in_themes:
-            with open(os.path.join(script_directory, "../../../assets", "themes", f"{theme_name_or_path}.json"), "r") as f:
-                cls.theme = json.load(f)
+            theme_path = os.path.join(script_directory, "../../../assets", "themes", f"{theme_name_or_path}.json")
         else:
-            with open(theme_name_or_path, "r") as f:
-                cls.theme = json.load(f)
+            theme_path = theme_name_or_path
+
+        # snapshot is read-only, so it is used without copy
+        cls.theme = cls._get_compiled_theme(theme_path)
 
         # store theme path for saving
         cls._currently_loaded_theme = theme_name_or_path
 
-        # filter theme values for platform
-        for key in cls.theme.keys():
-            # check if values for key differ on platforms
-            if "macOS" in cls.theme[key].keys():
-                if sys.platform == "darwin":
-                    cls.theme[key] = cls.theme[key]["macOS"]
-                elif sys.platform.startswith("win"):
-                    cls.theme[key] = cls.theme[key]["Windows"]
-                else:
-                    cls.theme[key] = cls.theme[key]["Linux"]
+    @classmethod
+    def get_theme_value(cls, widget_name: str, attribute_name: str) -> Any:
+        """ returns value of attribute_name in widget class widget_name of the loaded theme, raises KeyError if it does not exist """
+        return cls.theme[widget_name][attribute_name]
+
+    @classmethod
+    def set_theme_value(cls, widget_name: str, attribute_name: str, value: Any):
+        """ change value of the loaded theme (used by widgets created afterwards), the snapshot of the theme file is not modified """
+        widget_values = dict(cls.theme.get(widget_name, {}))
+        widget_values[attribute_name] = value
+        theme = dict(cls.theme)
+        theme[widget_name] = MappingProxyType(widget_values)
+        cls.theme = MappingProxyType(theme)
+
+    @classmethod
+    def apply_theme(cls, theme_name_or_path: str, live: bool = True):
+        """
+        load theme, with live=True all existing widgets and windows get recolored for every color
+        that changed and that is still the theme default of the widget, explicitly set colors are kept
+        """
+        old_theme = cls.theme
+        cls.load_theme(theme_name_or_path)
+
+        if live:
+            # map old theme color objects to new ones, widgets hold references to the theme color objects
+            # they were created with, so identity tells which attributes are still theme defaults
+            color_replacements = {}
+            for widget_name, old_values in old_theme.items():
+                new_values = cls.theme.get(widget_name, {})
+                for attribute_name, old_value in old_values.items():
+                    if "color" in attribute_name.lower() and attribute_name in new_values:
+                        color_replacements[id(old_value)] = (old_value, new_values[attribute_name])
+
+            for widget in list(cls._widgets):
+                if cls._replace_theme_colors(widget, color_replacements):
+                    widget._apply_theme_colors()
+
+    @staticmethod
+    def _replace_theme_colors(widget, color_replacements: dict) -> bool:
+        """ replace theme color attributes of widget, returns True if a color value changed and widget must be redrawn """
+        requires_redraw = False
+        for attribute_name, value in list(vars(widget).items()):
+            if "color" in attribute_name and id(value) in color_replacements:
+                old_value, new_value = color_replacements[id(value)]
+                if value is old_value:
+                    setattr(widget, attribute_name, new_value)  # also replace equal values to keep identity with new theme
+                    requires_redraw = requires_redraw or new_value != old_value
+        return requires_redraw
+
+    @classmethod
+    def _add_widget(cls, widget):
+        cls._widgets.add(widget)
+
+    @classmethod
+    def _remove_widget(cls, widget):
+        cls._widgets.discard(widget)
 
     @classmethod
     def save_theme(cls):
         if cls._currently_loaded_theme is not None:
             if cls._currently_loaded_theme not in cls._built_in_themes:
                 with open(cls._currently_loaded_theme, "r") as f:
-                    json.dump(cls.theme, f, indent=2)
+                    json.dump({widget_name: dict(widget_values) for widget_name, widget_values in cls.theme.items()}, f, indent=2)
             else:
                 raise ValueError(f"cannot modify builtin theme '{cls._currently_loaded_theme}'")
         else:
             raise ValueError(f"cannot save theme, no theme is loaded")
+
+    @classmethod
+    def _get_compiled_theme(cls, theme_path: str) -> Mapping:
+        """ returns read-only view of compiled theme snapshot from memory, disk cache or theme file """
+        theme_path = os.path.abspath(theme_path)
+        theme_stat = os.stat(theme_path)
+
+        # in memory snapshot with unchanged modification time and size
+        if theme_path in cls._compiled_themes:
+            mtime_ns, size, theme_view = cls._compiled_themes[theme_path]
+            if mtime_ns == theme_stat.st_mtime_ns and size == theme_stat.st_size:
+                return theme_view
+
+        compiled_theme = cls._read_theme_cache(theme_path, theme_stat)
+        if compiled_theme is None:
+            with open(theme_path, "rb") as f:
+                theme_source = f.read()
+            compiled_theme = cls._read_theme_cache(theme_path, theme_stat, theme_source)  # touched, but unchanged file
+            if compiled_theme is None:
+                compiled_theme = cls._compile_theme(json.loads(theme_source), theme_path)
+                cls._write_theme_cache(theme_path, theme_stat, theme_source, compiled_theme)
+
+        theme_view = MappingProxyType({widget_name: MappingProxyType(widget_values) for widget_name, widget_values in compiled_theme.items()})
+        cls._compiled_themes[theme_path] = (theme_stat.st_mtime_ns, theme_stat.st_size, theme_view)
+        return theme_view
+
+    @classmethod
+    def _compile_theme(cls, theme: dict, theme_path: str) -> dict:
+        """ resolve platform specific values and validate theme, raises ValueError for invalid themes """
+        if not isinstance(theme, dict):
+            raise ValueError(f"theme '{theme_path}' must contain a dict of widget names, not {type(theme).__name__}")
+
+        compiled_theme = {}
+        for widget_name, widget_values in theme.items():
+            # check if values for widget differ on platforms
+            if isinstance(widget_values, dict) and "macOS" in widget_values.keys():
+                widget_values = widget_values[cls._platform_name]
+
+            if not isinstance(widget_values, dict):
+                raise ValueError(f"theme '{theme_path}': values of '{widget_name}' must be a dict, not {type(widget_values).__name__}")
+
+            for attribute_name, value in widget_values.items():
+                if "color" in attribute_name.lower():
+                    if not (isinstance(value, str) or (isinstance(value, list) and len(value) == 2 and all(isinstance(v, str) for v in value))):
+                        raise ValueError(f"theme '{theme_path}': color '{widget_name}.{attribute_name}' must be string or list of two strings, not {value}")
+
+            compiled_theme[widget_name] = widget_values
+        return compiled_theme
+
+    @classmethod
+    def _get_theme_cache_path(cls, theme_path: str) -> Union[str, None]:
+        if cls.theme_cache_directory is None:
+            return None
+        path_hash = hashlib.sha256(f"{theme_path}|{cls._platform_name}".encode("utf-8")).hexdigest()[:32]
+        return os.path.join(os.path.expanduser(cls.theme_cache_directory), f"{path_hash}.marshal")
+
+    @classmethod
+    def _get_theme_cache_header(cls, theme_stat: os.stat_result) -> tuple:
+        # marshal format depends on the Python version
+        return cls._theme_cache_version, marshal.version, sys.version_info[:2], cls._platform_name, theme_stat.st_mtime_ns, theme_stat.st_size
+
+    @classmethod
+    def _read_theme_cache(cls, theme_path: str, theme_stat: os.stat_result, theme_source: Union[bytes, None] = None) -> Union[dict, None]:
+        """ returns cached compiled theme if modification time and size are unchanged, or if theme_source is given and its hash is unchanged """
+        cache_path = cls._get_theme_cache_path(theme_path)
+        if cache_path is None:
+            return None
+
+        try:
+            with open(cache_path, "rb") as f:
+                header, theme_hash, compiled_theme = marshal.loads(f.read())  # marshal.load() reads in small pieces
+        except (OSError, ValueError, EOFError, TypeError):
+            return None  # no cache or invalid cache file
+
+        if theme_source is None:
+            valid = header == cls._get_theme_cache_header(theme_stat)
+        else:
+            valid = header[:4] == cls._get_theme_cache_header(theme_stat)[:4] and theme_hash == hashlib.sha256(theme_source).hexdigest()
+            if valid:
+                cls._write_theme_cache(theme_path, theme_stat, theme_source, compiled_theme)  # store new modification time
+        return compiled_theme if valid else None
+
+    @classmethod
+    def _write_theme_cache(cls, theme_path: str, theme_stat: os.stat_result, theme_source: bytes, compiled_theme: dict):
+        cache_path = cls._get_theme_cache_path(theme_path)
+        if cache_path is None:
+            return
+
+        # write to temporary file and replace, so that the cache file is never incomplete, a read-only cache is ignored
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            with open(f"{cache_path}.{os.getpid()}.tmp", "wb") as f:
+                f.write(marshal.dumps((cls._get_theme_cache_header(theme_stat), hashlib.sha256(theme_source).hexdigest(), compiled_theme)))
+            os.replace(f"{cache_path}.{os.getpid()}.tmp", cache_path)
+        except (OSError, ValueError):
+            pass
@@ -0,0 +1,43 @@
+import io
+import customtkinter
+from PIL import Image, ImageDraw
+
+
+def create_spinner_gif(color: str) -> Image.Image:
+    frames = []
+    for i in range(12):
+        frame = Image.new("RGBA", (64, 64), (0, 0, 0, 0))
+        ImageDraw.Draw(frame).pieslice((4, 4, 60, 60), start=i * 30, end=i * 30 + 90, fill=color)
+        frames.append(frame)
+
+    gif_file = io.BytesIO()
+    frames[0].save(gif_file, format="GIF", save_all=True, append_images=frames[1:], duration=60, loop=0, disposal=2)
+    gif_file.seek(0)
+    return Image.open(gif_file)
+
+
+app = customtkinter.CTk()
+app.geometry("500x500")
+app.title("test_animated_image.py")
+
+spinner = customtkinter.CTkAnimatedImage(light_image=create_spinner_gif("#1f538d"), dark_image=create_spinner_gif("#dce4ee"), size=(32, 32))
+
+tabview = customtkinter.CTkTabview(app)
+tabview.pack(padx=10, pady=10, fill="both", expand=True)
+tabview.add("animations")
+tabview.add("empty")  # animations pause while this tab is selected
+
+# all 30 labels and the button share the decoded frames and one timer
+for i in range(30):
+    customtkinter.CTkLabel(tabview.tab("animations"), text="", image=spinner).grid(row=i // 6, column=i % 6, padx=5, pady=5)
+customtkinter.CTkButton(tabview.tab("animations"), text="loading", image=spinner).grid(row=5, column=0, columnspan=6, pady=10)
+
+
+def toggle_playing():
+    spinner.configure(playing=not spinner.cget("playing"))
+
+
+customtkinter.CTkButton(app, text="play/pause", command=toggle_playing).pack(pady=5)
+customtkinter.CTkSegmentedButton(app, values=["light", "dark"], command=customtkinter.set_appearance_mode).pack(pady=5)
+customtkinter.CTkSegmentedButton(app, values=[0.8, 1.0, 1.5, 2.0], command=customtkinter.set_widget_scaling).pack(pady=5)
+app.mainloop()
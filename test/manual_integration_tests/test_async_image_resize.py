@@ -0,0 +1,25 @@
+import os
+import time
+import customtkinter
+from PIL import Image
+
+file_path = os.path.dirname(os.path.realpath(__file__))
+large_image = Image.open(file_path + "/test_images/bg_gradient.jpg").resize((3000, 2000))
+
+app = customtkinter.CTk()
+app.geometry("800x600")
+app.title("test_async_image_resize.py")
+
+images = [customtkinter.CTkImage(light_image=large_image.rotate(i * 30), size=(180, 120)) for i in range(12)]
+for i, image in enumerate(images):
+    customtkinter.CTkLabel(app, text="", image=image).grid(row=i // 4, column=i % 4, padx=5, pady=5)
+
+
+def set_scaling(value):
+    start_time = time.perf_counter()
+    customtkinter.set_widget_scaling(value)  # shows nearest-neighbor placeholders, final images follow from thread pool
+    print(f"scaling change blocked UI for {time.perf_counter() - start_time:.3f} s")
+
+
+customtkinter.CTkSegmentedButton(app, values=[0.8, 1.0, 1.25, 1.5], command=set_scaling).grid(row=3, column=0, columnspan=4, pady=10)
+app.mainloop()
@@ -0,0 +1,52 @@
+import time
+import tkinter
+import customtkinter
+
+app = customtkinter.CTk()
+app.geometry("1100x800")
+app.title("test_canvas_container.py")
+
+
+def count_windows(widget: tkinter.Misc) -> int:
+    return 1 + sum(count_windows(child) for child in widget.winfo_children())
+
+
+# 50 x 20 grid of lightweight buttons and labels on one canvas
+small_font = customtkinter.CTkFont(size=10)
+start_time = time.perf_counter()
+container = customtkinter.CTkCanvasContainer(app, width=1060, height=600)
+container.grid(row=0, column=0, columnspan=2, padx=10, pady=10)
+for i in range(1000):
+    row, column = i // 20, i % 20
+    if column % 2 == 0:
+        item = customtkinter.CTkCanvasButton(container, width=48, height=20, text=str(i), font=small_font,
+                                             command=lambda i=i: print("button", i))
+    else:
+        item = customtkinter.CTkCanvasLabel(container, width=48, height=20, text=str(i), font=small_font)
+    if row < 25:
+        item.place(x=4 + column * 52, y=4 + row * 23)  # second half is created but not placed
+app.update()
+print(f"1000 lightweight widgets in {time.perf_counter() - start_time:.3f} s, {count_windows(container)} windows, {len(container.winfo_items())} items in container")
+
+# other lightweight widgets
+controls = customtkinter.CTkCanvasContainer(app, width=520, height=140)
+controls.grid(row=1, column=0, padx=10, pady=10)
+
+progress_variable = customtkinter.DoubleVar(value=0.3)
+check_variable = customtkinter.StringVar(value="on")
+customtkinter.CTkCanvasCheckBox(controls, text="checkbox with variable", variable=check_variable, onvalue="on", offvalue="off",
+                                command=lambda: print("checkbox", check_variable.get())).place(x=10, y=10)
+customtkinter.CTkCanvasCheckBox(controls, text="disabled checkbox", state="disabled").place(x=10, y=50)
+customtkinter.CTkCanvasSwitch(controls, text="switch with same variable", variable=check_variable, onvalue="on", offvalue="off").place(x=260, y=10)
+customtkinter.CTkCanvasSwitch(controls, text="disabled switch", state="disabled").place(x=260, y=50)
+customtkinter.CTkCanvasProgressBar(controls, variable=progress_variable).place(x=10, y=100)
+customtkinter.CTkCanvasProgressBar(controls, orientation="vertical", height=120, variable=progress_variable).place(x=500, y=10)
+customtkinter.CTkCanvasButton(controls, text="progress +0.1", width=100,
+                              command=lambda: progress_variable.set(min(1, progress_variable.get() + 0.1))).place(x=260, y=95)
+
+settings_frame = customtkinter.CTkFrame(app)
+settings_frame.grid(row=1, column=1, padx=10, pady=10)
+customtkinter.CTkSegmentedButton(settings_frame, values=["light", "dark"], command=customtkinter.set_appearance_mode).pack(pady=10)
+customtkinter.CTkSegmentedButton(settings_frame, values=[0.8, 1.0, 1.5], command=customtkinter.set_widget_scaling).pack(pady=10)
+customtkinter.CTkButton(settings_frame, text="container fg_color", command=lambda: controls.configure(fg_color="gray40")).pack(pady=10)
+app.mainloop()
@@ -0,0 +1,17 @@
+import customtkinter
+
+app = customtkinter.CTk()
+app.geometry("400x400")
+app.title("test_derived_colors.py")
+
+for fg_color in ["#3B8ED0", "red", "gray40", ("#2CC985", "#2FA572")]:
+    customtkinter.CTkButton(app, text=f"auto hover {fg_color}", fg_color=fg_color, hover_color="auto").pack(pady=5)
+
+customtkinter.CTkButton(app, text="auto disabled text", state="disabled", text_color_disabled="auto").pack(pady=5)
+
+print(customtkinter.ColorManager.lighten("gray92", 0.5), customtkinter.ColorManager.alpha_over("#FFFFFF", ("gray92", "gray14"), 0.3))
+
+mode_switch = customtkinter.CTkSwitch(app, text="dark mode",
+                                      command=lambda: customtkinter.set_appearance_mode("dark" if mode_switch.get() == 1 else "light"))
+mode_switch.pack(pady=20)
+app.mainloop()
@@ -0,0 +1,38 @@
+import time
+import threading
+import numpy as np
+import customtkinter
+
+app = customtkinter.CTk()
+app.geometry("500x500")
+app.title("test_frame_buffer.py")
+
+frame_buffer = customtkinter.CTkFrameBuffer(size=(320, 240), max_fps=30)
+customtkinter.CTkLabel(app, text="", image=frame_buffer).pack(padx=10, pady=10)
+info_label = customtkinter.CTkLabel(app, text="")
+info_label.pack()
+
+y, x = np.mgrid[0:240, 0:320]
+
+
+def produce_frames():
+    # simulated camera with 200 fps, frames above max_fps get dropped
+    while True:
+        t = time.perf_counter()
+        frame = np.empty((240, 320, 3), dtype=np.uint8)
+        frame[:, :, 0] = (x + t * 100) % 256
+        frame[:, :, 1] = (y + t * 50) % 256
+        frame[:, :, 2] = 128
+        frame_buffer.put_frame(frame)
+        time.sleep(1 / 200)
+
+
+def update_info():
+    info_label.configure(text=f"displayed: {frame_buffer.cget('displayed_frames')}, dropped: {frame_buffer.cget('dropped_frames')}")
+    app.after(500, update_info)
+
+
+threading.Thread(target=produce_frames, daemon=True).start()
+update_info()
+customtkinter.CTkSegmentedButton(app, values=[0.8, 1.0, 1.25, 1.5, 2.0], command=customtkinter.set_widget_scaling).pack(pady=10)
+app.mainloop()
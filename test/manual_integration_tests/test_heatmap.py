@@ -0,0 +1,44 @@
+import time
+import numpy as np
+import customtkinter
+
+app = customtkinter.CTk()
+app.geometry("700x700")
+app.title("test_heatmap.py")
+
+heatmap = customtkinter.CTkHeatmap(app, width=512, height=512, colormap=("viridis", "magma"), vmin=-1, vmax=1)
+heatmap.pack(padx=10, pady=10, fill="both", expand=True)
+
+y, x = np.mgrid[0:512, 0:512] / 512
+render_times = []
+
+
+def update_full():
+    # full 512x512 update at 30 Hz
+    start_time = time.perf_counter()
+    heatmap.set_data(np.sin(x * 10 + time.perf_counter()) * np.cos(y * 10))
+    render_times.append(time.perf_counter() - start_time)
+    if len(render_times) == 30:
+        print(f"average set_data() time: {sum(render_times) / len(render_times) * 1000:.2f} ms")
+        render_times.clear()
+    app.after(33, update_full)
+
+
+def update_region():
+    # only a 32x32 block changes, only the covered part of the image gets rendered
+    row, column = np.random.randint(0, 480, size=2)
+    heatmap.update_region(row, column, np.random.uniform(-1, 1, (32, 32)))
+    app.after(33, update_region)
+
+
+control_frame = customtkinter.CTkFrame(app)
+control_frame.pack(pady=10)
+customtkinter.CTkSegmentedButton(control_frame, values=["nearest", "bilinear"], command=lambda value: heatmap.configure(interpolation=value)).pack(pady=5)
+# configuring vmin and vmax maps the displayed values again without set_data()
+customtkinter.CTkSegmentedButton(control_frame, values=["-1 to 1", "0 to 1", "-0.5 to 0.5"],
+                                 command=lambda value: heatmap.configure(vmin=float(value.split(" to ")[0]), vmax=float(value.split(" to ")[1]))).pack(pady=5)
+customtkinter.CTkSegmentedButton(control_frame, values=["light", "dark"], command=customtkinter.set_appearance_mode).pack(pady=5)
+customtkinter.CTkButton(control_frame, text="full updates", command=update_full).pack(side="left", padx=5, pady=5)
+customtkinter.CTkButton(control_frame, text="region updates", command=lambda: (heatmap.set_data(np.zeros((512, 512))), update_region())).pack(side="left", padx=5, pady=5)
+customtkinter.CTkButton(control_frame, text="NaN values", command=lambda: heatmap.set_data(np.where(x > 0.5, np.nan, np.sin(x * 10) * np.cos(y * 10)))).pack(side="left", padx=5, pady=5)
+app.mainloop()
@@ -0,0 +1,42 @@
+import os
+import customtkinter
+from PIL import Image, ImageDraw
+
+file_path = os.path.dirname(os.path.realpath(__file__))
+source_image = Image.open(file_path + "/test_images/bg_gradient.jpg")
+
+app = customtkinter.CTk()
+app.geometry("600x500")
+app.title("test_image_cache.py")
+
+customtkinter.ImageCache.max_bytes = 4 * 1024 * 1024  # small budget to see evictions
+customtkinter.ImageCache.idle_release_time = 10
+
+frame = customtkinter.CTkFrame(app)
+frame.pack(padx=10, pady=10, fill="both", expand=True)
+
+# 40 CTkImage objects from the same source share one scaled variant per size
+images = []
+for i in range(40):
+    image = customtkinter.CTkImage(light_image=source_image, size=(40, 60))
+    images.append(image)
+    customtkinter.CTkLabel(frame, text="", image=image).grid(row=i // 10, column=i % 10, padx=2, pady=2)
+
+
+def print_statistics():
+    print(customtkinter.ImageCache.get_statistics())
+    app.after(2000, print_statistics)
+
+
+def edit_source_in_place():
+    # configure() invalidates the cached variants of the modified source, all labels must show the red rectangle
+    ImageDraw.Draw(source_image).rectangle((0, 0, source_image.width // 2, source_image.height // 2), fill="red")
+    for image in images:
+        image.configure(light_image=source_image)
+    print("edited source in place:", customtkinter.ImageCache.get_statistics())
+
+
+customtkinter.CTkButton(app, text="edit source in place", command=edit_source_in_place).pack(pady=(0, 10))
+customtkinter.CTkSegmentedButton(app, values=[0.8, 1.0, 1.25, 1.5, 2.0], command=customtkinter.set_widget_scaling).pack(pady=10)
+print_statistics()
+app.mainloop()
@@ -0,0 +1,26 @@
+import os
+import customtkinter
+
+file_path = os.path.dirname(os.path.realpath(__file__))
+
+app = customtkinter.CTk()
+app.geometry("600x500")
+app.title("test_image_from_file.py")
+
+frame = customtkinter.CTkFrame(app)
+frame.pack(padx=10, pady=10, fill="both", expand=True)
+
+# files are only decoded when the labels are drawn, images from the same path share scaled variants
+for i in range(20):
+    image = customtkinter.CTkImage.from_file(file_path + "/test_images/bg_gradient.jpg", size=(50, 75))
+    customtkinter.CTkLabel(frame, text="", image=image).grid(row=i // 10, column=i % 10, padx=2, pady=2)
+
+folder_image = customtkinter.CTkImage.from_file(light_image_path=file_path + "/test_images/add_folder_light.png",
+                                                dark_image_path=file_path + "/test_images/add_folder_dark.png", size=(30, 30))
+customtkinter.CTkButton(frame, text="add folder", image=folder_image).grid(row=2, column=0, columnspan=10, pady=10)
+
+customtkinter.CTkSegmentedButton(app, values=[0.8, 1.0, 1.25, 1.5, 2.0], command=customtkinter.set_widget_scaling).pack(pady=10)
+customtkinter.CTkSegmentedButton(app, values=["light", "dark"], command=customtkinter.set_appearance_mode).pack(pady=10)
+
+print(customtkinter.ImageCache.get_statistics())
+app.mainloop()
@@ -0,0 +1,22 @@
+import time
+import customtkinter
+
+app = customtkinter.CTk()
+app.geometry("700x500")
+app.title("test_label_ellipsis.py")
+app.grid_columnconfigure((0, 1, 2), weight=1)
+
+font = customtkinter.CTkFont(size=13)
+texts = [f"row {i}: some long cell content that will not fit into the column" for i in range(60)]
+
+start_time = time.perf_counter()
+widths = font.measure_many(texts)  # one Tcl call for all texts
+print(f"measure_many of {len(texts)} texts took {time.perf_counter() - start_time:.4f} s, max width {max(widths)}")
+
+for i, text in enumerate(texts):
+    label = customtkinter.CTkLabel(app, text=text, font=font, width=100, anchor="w", ellipsis=True)
+    label.grid(row=i // 3, column=i % 3, sticky="ew", padx=5)
+
+customtkinter.CTkButton(app, text="bigger font", command=lambda: font.configure(size=16)).grid(row=21, column=0, pady=10)
+customtkinter.CTkSegmentedButton(app, values=[0.8, 1.0, 1.5], command=customtkinter.set_widget_scaling).grid(row=21, column=1, pady=10)
+app.mainloop()
@@ -0,0 +1,27 @@
+import time
+import customtkinter
+
+app = customtkinter.CTk()
+app.geometry("500x600")
+app.title("test_live_theme_switching.py")
+
+frame = customtkinter.CTkFrame(app)
+frame.pack(padx=20, pady=20, fill="both", expand=True)
+
+for i in range(20):
+    customtkinter.CTkButton(frame, text=f"theme button {i}").grid(row=i // 4, column=i % 4, padx=3, pady=3)
+customtkinter.CTkButton(frame, text="override", fg_color="gray30").grid(row=5, column=0, padx=3, pady=3)
+customtkinter.CTkCheckBox(frame).grid(row=5, column=1, padx=3, pady=3)
+customtkinter.CTkSwitch(frame).grid(row=5, column=2, padx=3, pady=3)
+customtkinter.CTkSlider(frame, width=150).grid(row=6, column=0, columnspan=2, padx=3, pady=3)
+customtkinter.CTkOptionMenu(frame, values=["a", "b"]).grid(row=6, column=2, columnspan=2, padx=3, pady=3)
+
+
+def switch_theme(theme_name: str):
+    start_time = time.perf_counter()
+    customtkinter.ThemeManager.apply_theme(theme_name, live=True)  # "override" button keeps its fg_color
+    print(f"switched to {theme_name} in {time.perf_counter() - start_time:.4f} s")
+
+
+customtkinter.CTkSegmentedButton(app, values=["blue", "green", "dark-blue"], command=switch_theme).pack(pady=10)
+app.mainloop()
@@ -0,0 +1,49 @@
+import time
+import customtkinter
+
+app = customtkinter.CTk()
+app.geometry("900x650")
+app.title("test_native_hover.py")
+
+widget_classes = (customtkinter.CTkButton, customtkinter.CTkSlider, customtkinter.CTkCheckBox,
+                  customtkinter.CTkSwitch, customtkinter.CTkScrollbar)
+
+# left column: Python hover callbacks, right column: native hover, both must look and behave the same
+for column, native_hover in enumerate((False, True)):
+    for widget_class in widget_classes:
+        widget_class.native_hover = native_hover
+    frame = customtkinter.CTkFrame(app)
+    frame.grid(row=0, column=column, padx=10, pady=10, sticky="nsew")
+    customtkinter.CTkLabel(frame, text=f"native_hover={native_hover}").pack(pady=5)
+
+    customtkinter.CTkButton(frame, text="button", command=lambda: print("button clicked")).pack(pady=5)
+    customtkinter.CTkButton(frame, text="transparent button", fg_color="transparent", border_width=2).pack(pady=5)
+    customtkinter.CTkButton(frame, text="disabled button", state="disabled").pack(pady=5)
+    button_hover_off = customtkinter.CTkButton(frame, text="hover toggled on click")
+    button_hover_off.configure(command=lambda b=button_hover_off: b.configure(hover=not b.cget("hover")))
+    button_hover_off.pack(pady=5)
+
+    # user binding, only this widget calls Python on Enter in native hover mode
+    bound_button = customtkinter.CTkButton(frame, text="button with <Enter> binding")
+    bound_button.bind("<Enter>", lambda event, n=native_hover: print(f"<Enter> binding, native_hover={n}"), add="+")
+    bound_button.pack(pady=5)
+
+    customtkinter.CTkSlider(frame).pack(pady=5)
+    customtkinter.CTkCheckBox(frame, text="checkbox").pack(pady=5)
+    customtkinter.CTkSwitch(frame, text="switch").pack(pady=5)
+    customtkinter.CTkScrollbar(frame, orientation="horizontal").pack(pady=5)
+
+    # toolbar to move the mouse over quickly
+    start_time = time.perf_counter()
+    toolbar = customtkinter.CTkFrame(frame)
+    toolbar.pack(pady=5)
+    for i in range(40):
+        customtkinter.CTkButton(toolbar, text=str(i), width=28).grid(row=i // 10, column=i % 10, padx=1, pady=1)
+    app.update()
+    print(f"native_hover={native_hover}: toolbar with 40 buttons in {time.perf_counter() - start_time:.3f} s")
+
+for widget_class in widget_classes:
+    widget_class.native_hover = False
+customtkinter.CTkSegmentedButton(app, values=["light", "dark"], command=customtkinter.set_appearance_mode).grid(row=1, column=0, pady=10)
+customtkinter.CTkSegmentedButton(app, values=[0.8, 1.0, 1.5], command=customtkinter.set_widget_scaling).grid(row=1, column=1, pady=10)
+app.mainloop()
@@ -0,0 +1,46 @@
+import time
+import customtkinter
+
+app = customtkinter.CTk()
+app.geometry("1000x700")
+app.title("test_shared_bindings.py")
+
+print("before:", customtkinter.SharedBindings.count_tcl_commands(app))
+
+# widgets with internal bindings, hover, click and focus must work like before
+frame = customtkinter.CTkFrame(app)
+frame.pack(padx=10, pady=10)
+customtkinter.CTkButton(frame, text="button", command=lambda: print("button clicked")).pack(pady=5)
+customtkinter.CTkCheckBox(frame, text="checkbox").pack(pady=5)
+customtkinter.CTkSwitch(frame, text="switch").pack(pady=5)
+customtkinter.CTkRadioButton(frame, text="radiobutton").pack(pady=5)
+customtkinter.CTkSlider(frame).pack(pady=5)
+customtkinter.CTkOptionMenu(frame, values=["option 1", "option 2"]).pack(pady=5)
+customtkinter.CTkEntry(frame, placeholder_text="placeholder").pack(pady=5)
+
+# user bindings run after the shared bindings, also when bound without add="+"
+user_button = customtkinter.CTkButton(frame, text="button with user <Button-1> binding", command=lambda: print("command"))
+user_button.bind("<Button-1>", lambda event: print("user binding"))
+user_button.pack(pady=5)
+
+# many widgets
+start_time = time.perf_counter()
+grid_frame = customtkinter.CTkFrame(app)
+grid_frame.pack(padx=10, pady=10)
+buttons = [customtkinter.CTkButton(grid_frame, text=str(i), width=40) for i in range(500)]
+for i, button in enumerate(buttons):
+    button.grid(row=i // 25, column=i % 25, padx=1, pady=1)
+app.update()
+print(f"500 buttons in {time.perf_counter() - start_time:.3f} s")
+print("after:", customtkinter.SharedBindings.count_tcl_commands(app))
+
+
+def destroy_buttons():
+    for button in buttons:
+        button.destroy()
+    buttons.clear()
+    print("after destroy:", customtkinter.SharedBindings.count_tcl_commands(app))
+
+
+customtkinter.CTkButton(app, text="destroy 500 buttons", command=destroy_buttons).pack(pady=10)
+app.mainloop()
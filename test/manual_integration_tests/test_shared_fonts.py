@@ -0,0 +1,27 @@
+import time
+import customtkinter
+
+app = customtkinter.CTk()
+app.geometry("600x600")
+app.title("test_shared_fonts.py")
+
+shared_font = customtkinter.CTkFont(size=12)
+frame = customtkinter.CTkFrame(app)
+frame.pack(padx=10, pady=10, fill="both", expand=True)
+
+for i in range(200):
+    customtkinter.CTkLabel(frame, text=f"{i}", font=shared_font if i % 2 == 0 else ("Arial", 12)).grid(row=i // 10, column=i % 10, padx=2)
+
+print("named tuple fonts in pool:", len(customtkinter.FontManager._named_fonts))  # expected: 1
+
+
+def change_size():
+    start_time = time.perf_counter()
+    shared_font.configure(size=16)  # reconfigures one named font, all 100 labels follow
+    app.update_idletasks()
+    print(f"font size change took {time.perf_counter() - start_time:.4f} s")
+
+
+customtkinter.CTkButton(app, text="change font size", command=change_size).pack(pady=5)
+customtkinter.CTkSegmentedButton(app, values=[0.8, 1.0, 1.5], command=customtkinter.set_widget_scaling).pack(pady=5)
+app.mainloop()
@@ -0,0 +1,47 @@
+import os
+import time
+import tkinter
+import customtkinter
+from PIL import Image
+
+file_path = os.path.dirname(os.path.realpath(__file__))
+image = customtkinter.CTkImage(Image.open(file_path + "/test_images/add_folder_light.png"),
+                               Image.open(file_path + "/test_images/add_folder_dark.png"), size=(20, 20))
+
+app = customtkinter.CTk()
+app.geometry("900x700")
+app.title("test_single_canvas_button.py")
+
+
+def count_windows(widget: tkinter.Misc) -> int:
+    return 1 + sum(count_windows(child) for child in widget.winfo_children())
+
+
+# left column: label rendering, right column: single canvas rendering, both must look the same
+for column, single_canvas_rendering in enumerate((False, True)):
+    customtkinter.CTkButton.single_canvas_rendering = single_canvas_rendering
+    frame = customtkinter.CTkFrame(app)
+    frame.grid(row=0, column=column, padx=10, pady=10, sticky="nsew")
+
+    for row, (compound, anchor) in enumerate([("left", "center"), ("right", "w"), ("top", "n"), ("bottom", "se"), ("left", "e")]):
+        customtkinter.CTkButton(frame, text=f"{compound} {anchor}", image=image, compound=compound, anchor=anchor,
+                                width=200, height=60).grid(row=row, column=0, padx=10, pady=5)
+
+    text_variable = customtkinter.StringVar(value="textvariable")
+    customtkinter.CTkButton(frame, textvariable=text_variable, command=lambda v=text_variable: v.set(v.get() + "+")).grid(row=5, column=0, pady=5)
+    customtkinter.CTkButton(frame, text="disabled", state="disabled").grid(row=6, column=0, pady=5)
+    customtkinter.CTkButton(frame, text="long text that does not fit into the button", width=60).grid(row=7, column=0, pady=5)
+
+    start_time = time.perf_counter()
+    benchmark_frame = customtkinter.CTkFrame(frame)
+    benchmark_frame.grid(row=8, column=0, pady=5)
+    for i in range(200):
+        customtkinter.CTkButton(benchmark_frame, text=str(i), width=30, height=20).grid(row=i // 20, column=i % 20)
+    app.update()
+    print(f"single_canvas_rendering={single_canvas_rendering}: 200 buttons in {time.perf_counter() - start_time:.3f} s, "
+          f"{count_windows(benchmark_frame)} windows")
+
+customtkinter.CTkButton.single_canvas_rendering = False
+customtkinter.CTkSegmentedButton(app, values=["light", "dark"], command=customtkinter.set_appearance_mode).grid(row=1, column=0, pady=10)
+customtkinter.CTkSegmentedButton(app, values=[0.8, 1.0, 1.5], command=customtkinter.set_widget_scaling).grid(row=1, column=1, pady=10)
+app.mainloop()
@@ -0,0 +1,47 @@
+import time
+import tkinter
+import customtkinter
+
+app = customtkinter.CTk()
+app.geometry("1000x750")
+app.title("test_single_canvas_text.py")
+
+widget_classes = (customtkinter.CTkLabel, customtkinter.CTkCheckBox, customtkinter.CTkSwitch, customtkinter.CTkRadioButton)
+
+
+def count_windows(widget: tkinter.Misc) -> int:
+    return 1 + sum(count_windows(child) for child in widget.winfo_children())
+
+
+# left column: label rendering, right column: single canvas rendering, both must look the same
+for column, single_canvas_rendering in enumerate((False, True)):
+    for widget_class in widget_classes:
+        widget_class.single_canvas_rendering = single_canvas_rendering
+    frame = customtkinter.CTkFrame(app)
+    frame.grid(row=0, column=column, padx=10, pady=10, sticky="nsew")
+
+    text_variable = customtkinter.StringVar(value="textvariable")
+    customtkinter.CTkButton(frame, text="change textvariable", command=lambda v=text_variable: v.set(v.get() + "+")).grid(row=0, column=0, pady=5)
+    customtkinter.CTkLabel(frame, textvariable=text_variable, fg_color="gray30", corner_radius=6).grid(row=1, column=0, pady=5)
+    customtkinter.CTkLabel(frame, text="wraplength=150, " * 4, wraplength=150, anchor="w", justify="left").grid(row=2, column=0, pady=5)
+    customtkinter.CTkLabel(frame, text="disabled label", state="disabled").grid(row=3, column=0, pady=5)
+    customtkinter.CTkLabel(frame, text="ellipsis label with long text", width=120, ellipsis=True).grid(row=4, column=0, pady=5)
+    customtkinter.CTkCheckBox(frame, textvariable=text_variable).grid(row=5, column=0, pady=5)
+    customtkinter.CTkSwitch(frame, text="disabled switch", state="disabled").grid(row=6, column=0, pady=5)
+    customtkinter.CTkRadioButton(frame, text="radiobutton\nwith two lines").grid(row=7, column=0, pady=5)
+
+    start_time = time.perf_counter()
+    benchmark_frame = customtkinter.CTkFrame(frame)
+    benchmark_frame.grid(row=8, column=0, pady=5)
+    for i in range(100):
+        customtkinter.CTkCheckBox(benchmark_frame, text=str(i), width=40).grid(row=i // 10, column=(i % 10) * 2)
+        customtkinter.CTkSwitch(benchmark_frame, text="", width=40).grid(row=i // 10, column=(i % 10) * 2 + 1)
+    app.update()
+    print(f"single_canvas_rendering={single_canvas_rendering}: 100 checkboxes and 100 switches in {time.perf_counter() - start_time:.3f} s, "
+          f"{count_windows(benchmark_frame)} windows")
+
+for widget_class in widget_classes:
+    widget_class.single_canvas_rendering = False
+customtkinter.CTkSegmentedButton(app, values=["light", "dark"], command=customtkinter.set_appearance_mode).grid(row=1, column=0, pady=10)
+customtkinter.CTkSegmentedButton(app, values=[0.8, 1.0, 1.5], command=customtkinter.set_widget_scaling).grid(row=1, column=1, pady=10)
+app.mainloop()
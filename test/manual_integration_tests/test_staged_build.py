@@ -0,0 +1,23 @@
+import customtkinter
+
+app = customtkinter.CTk()
+app.geometry("600x800")
+app.title("test_staged_build.py")
+app.grid_columnconfigure(0, weight=1)
+
+
+def build_section(placeholder: customtkinter.CTkFrame):
+    placeholder.grid_columnconfigure((0, 1, 2, 3), weight=1)
+    for row in range(5):
+        for column in range(4):
+            customtkinter.CTkButton(placeholder, width=60, text=f"{row}/{column}").grid(row=row, column=column, padx=5, pady=5)
+
+
+# placeholder frames get painted with the first frame, content is created afterwards (visible sections first)
+for i in range(8):
+    placeholder_frame = customtkinter.CTkFrame(app, height=220)
+    placeholder_frame.grid(row=i, column=0, padx=20, pady=10, sticky="ew")
+    app.add_build_stage(build_section, placeholder=placeholder_frame)
+
+app.after(3000, lambda: print("startup times:", app.get_startup_times()))
+app.mainloop()
@@ -0,0 +1,34 @@
+import time
+import customtkinter
+
+app = customtkinter.CTk()
+app.geometry("600x700")
+app.title("test_style.py")
+
+button_style = customtkinter.CTkStyle(fg_color=("#3a7ebf", "#1f538d"), hover_color=("#325882", "#14375e"),
+                                      corner_radius=6, font=customtkinter.CTkFont(size=12))
+label_style = customtkinter.CTkStyle(text_color="gray50", corner_radius=0)
+
+frame = customtkinter.CTkFrame(app)
+frame.pack(padx=20, pady=20, fill="both", expand=True)
+
+start_time = time.perf_counter()
+for i in range(300):
+    customtkinter.CTkButton(frame, text=f"{i}", width=30, height=20, style=button_style).grid(row=i // 15, column=i % 15, padx=1, pady=1)
+print(f"created 300 styled buttons in {time.perf_counter() - start_time:.3f} s")
+
+override_button = customtkinter.CTkButton(app, text="fg_color override", fg_color="green", style=button_style)
+override_button.pack(pady=5)
+customtkinter.CTkLabel(app, text="styled label", style=label_style).pack(pady=5)
+customtkinter.CTkEntry(app, placeholder_text="styled entry", style=customtkinter.CTkStyle(border_color="orange")).pack(pady=5)
+
+
+def restyle():
+    # one configure call updates all 300 buttons in one batch, override_button keeps its fg_color
+    button_style.configure(fg_color="#bf3a3a", corner_radius=10)
+    label_style.configure(text_color="red")
+    assert override_button.cget("fg_color") == "green"
+
+
+app.after(2000, restyle)
+app.mainloop()
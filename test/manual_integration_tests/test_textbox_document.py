@@ -0,0 +1,60 @@
+import os
+import tempfile
+import customtkinter
+
+# create a large log file (about 60 MB, 1 million lines)
+path = os.path.join(tempfile.gettempdir(), "test_textbox_document.log")
+if not os.path.isfile(path):
+    with open(path, "w", encoding="utf-8") as file:
+        for i in range(1_000_000):
+            file.write(f"{i + 1:>8} INFO  request handled in {i % 97} ms by worker {i % 13}\n")
+
+app = customtkinter.CTk()
+app.title("test_textbox_document.py")
+app.geometry("900x700")
+app.grid_rowconfigure(1, weight=1)
+app.grid_columnconfigure(1, weight=1)
+
+textbox = customtkinter.CTkTextbox(app, wrap="none")
+textbox.grid(row=1, column=0, columnspan=4, padx=10, pady=10, sticky="nsew")
+document = textbox.open_document(path)
+
+status_label = customtkinter.CTkLabel(app, text="")
+status_label.grid(row=2, column=0, columnspan=4, padx=10, pady=(0, 10))
+
+line_entry = customtkinter.CTkEntry(app, placeholder_text="line")
+line_entry.grid(row=0, column=0, padx=10, pady=10)
+customtkinter.CTkButton(app, text="goto line", command=lambda: textbox.goto_line(int(line_entry.get()))).grid(row=0, column=1, sticky="w")
+
+search_entry = customtkinter.CTkEntry(app, placeholder_text="search (regex)")
+search_entry.grid(row=0, column=2, padx=10, pady=10)
+last_match = [1, 0]
+
+
+def show_match(match):
+    if match is None:
+        status_label.configure(text="no more matches")
+        last_match[:] = [1, 0]
+    else:
+        last_match[:] = [match[0], match[1] + max(1, match[2])]
+        status_label.configure(text=f"match at line {match[0]}, column {match[1]}")
+
+
+def find_next():
+    status_label.configure(text="searching ...")
+    textbox.find_in_document(search_entry.get(), last_match[0], last_match[1], regex=True, callback=show_match)
+
+
+customtkinter.CTkButton(app, text="find next", command=find_next).grid(row=0, column=3, padx=(0, 10))
+
+
+def update_status():
+    if not document.index_complete:
+        status_label.configure(text=f"indexing: {document.get_index_progress():.0%}, {document.line_count} lines")
+        app.after(100, update_status)
+    else:
+        status_label.configure(text=f"{document.line_count} lines, {document.size / 1e6:.1f} MB")
+
+
+update_status()
+app.mainloop()
@@ -0,0 +1,38 @@
+import customtkinter
+
+app = customtkinter.CTk()
+app.title("test_textbox_find_all.py")
+app.geometry("900x700")
+app.grid_rowconfigure(1, weight=1)
+app.grid_columnconfigure(0, weight=1)
+
+textbox = customtkinter.CTkTextbox(app, wrap="none")
+textbox.grid(row=1, column=0, columnspan=6, padx=10, pady=10, sticky="nsew")
+textbox.insert("1.0", "".join(f"{i + 1:>7} the quick brown fox jumps over the lazy dog, foxes and foxtrot\n" for i in range(300_000)))
+
+search_entry = customtkinter.CTkEntry(app, placeholder_text="search on every keystroke")
+search_entry.grid(row=0, column=0, padx=10, pady=10, sticky="ew")
+regex_var = customtkinter.BooleanVar(value=False)
+whole_word_var = customtkinter.BooleanVar(value=False)
+customtkinter.CTkCheckBox(app, text="regex", variable=regex_var).grid(row=0, column=1)
+customtkinter.CTkCheckBox(app, text="whole word", variable=whole_word_var).grid(row=0, column=2)
+customtkinter.CTkButton(app, text="previous", width=80, command=textbox.find_previous).grid(row=0, column=3)
+customtkinter.CTkButton(app, text="next", width=80, command=textbox.find_next).grid(row=0, column=4, padx=10)
+
+count_label = customtkinter.CTkLabel(app, text="")
+count_label.grid(row=0, column=5, padx=(0, 10))
+
+
+def show_count(count: int, complete: bool):
+    count_label.configure(text=f"{count} matches" if complete else f"{count}+ matches ...")
+
+
+def search(event=None):
+    try:
+        textbox.find_all(search_entry.get(), regex=regex_var.get(), whole_word=whole_word_var.get(), callback=show_count)
+    except Exception as error:
+        count_label.configure(text=f"invalid pattern: {error}")
+
+
+search_entry.bind("<KeyRelease>", search)
+app.mainloop()
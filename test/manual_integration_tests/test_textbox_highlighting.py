@@ -0,0 +1,32 @@
+import time
+import customtkinter
+
+app = customtkinter.CTk()
+app.title("test_textbox_highlighting.py")
+app.geometry("900x700")
+app.grid_rowconfigure(0, weight=1)
+app.grid_columnconfigure(0, weight=1)
+
+textbox = customtkinter.CTkTextbox(app, wrap="none", undo=True, lexer=customtkinter.PythonLexer(),
+                                   font=customtkinter.CTkFont(family="Courier", size=13))
+textbox.grid(row=0, column=0, columnspan=3, padx=10, pady=10, sticky="nsew")
+
+# large buffer (about 50000 lines), the visible lines are highlighted immediately, the rest in the background
+with open(customtkinter.windows.widgets.ctk_textbox.__file__, encoding="utf-8") as file:
+    source = file.read()
+start_time = time.perf_counter()
+textbox.insert("1.0", source * 70)
+app.after_idle(lambda: print(f"insert and first highlighting: {time.perf_counter() - start_time:.3f}s"))
+
+log_lexer = customtkinter.RegexLexer([("error", r"\bERROR\b.*"), ("warning", r"\bWARNING\b.*"), ("number", r"\b\d+\b")])
+log_textbox = customtkinter.CTkTextbox(app, height=120, lexer=log_lexer,
+                                       highlight_colors={"error": ("#C00000", "#FF6B6B"), "warning": ("#B06000", "#FFB347")})
+log_textbox.grid(row=1, column=0, columnspan=3, padx=10, pady=(0, 10), sticky="ew")
+log_textbox.insert("end", "INFO started 3 workers\nWARNING queue is 90% full\nERROR worker 2 crashed\n")
+
+appearance_mode_button = customtkinter.CTkSegmentedButton(app, values=["Light", "Dark"], command=customtkinter.set_appearance_mode)
+appearance_mode_button.grid(row=2, column=0, padx=10, pady=(0, 10))
+customtkinter.CTkButton(app, text="lexer off", command=lambda: textbox.configure(lexer=None)).grid(row=2, column=1, pady=(0, 10))
+customtkinter.CTkButton(app, text="lexer on", command=lambda: textbox.configure(lexer=customtkinter.PythonLexer())).grid(row=2, column=2, pady=(0, 10))
+
+app.mainloop()
@@ -0,0 +1,35 @@
+import time
+import random
+import customtkinter
+
+app = customtkinter.CTk()
+app.title("test_textbox_stream.py")
+app.geometry("800x600")
+app.grid_rowconfigure(0, weight=1)
+app.grid_columnconfigure(0, weight=1)
+
+textbox = customtkinter.CTkTextbox(app, wrap="none", stream_max_lines=5000, state="disabled")
+textbox.grid(row=0, column=0, padx=10, pady=10, sticky="nsew")
+textbox.tag_config("INFO", foreground="gray60")
+textbox.tag_config("WARNING", foreground="orange")
+textbox.tag_config("ERROR", foreground="red")
+
+lines_sent = 0
+label = customtkinter.CTkLabel(app, text="")
+label.grid(row=1, column=0, padx=10, pady=(0, 10))
+
+
+def produce_lines():
+    """ append 500 lines every 20ms (about 1.5 million lines per minute) """
+    global lines_sent
+    for _ in range(500):
+        level = random.choice(("INFO", "INFO", "INFO", "WARNING", "ERROR"))
+        textbox.append_stream(f"{time.time():.3f} {level:<8} line {lines_sent}\n", tags=level)
+        lines_sent += 1
+    label.configure(text=f"lines sent: {lines_sent}, lines in textbox: {textbox.index('end-1c').split('.')[0]} "
+                         f"(scroll up to stop autoscroll)")
+    app.after(20, produce_lines)
+
+
+app.after(500, produce_lines)
+app.mainloop()
@@ -0,0 +1,30 @@
+import customtkinter
+
+app = customtkinter.CTk()
+app.geometry("400x300")
+app.title("test_toplevel_pool.py")
+
+dialog_pool = customtkinter.CTkToplevelPool(customtkinter.CTkInputDialog, max_size=1)
+dialog_pool.prefill()  # dialog is built now and appears instantly later
+
+toplevel_pool = customtkinter.CTkToplevelPool(max_size=2)
+
+
+def open_dialog():
+    dialog = dialog_pool.acquire(text="Type in a number:", title="Pooled dialog")
+    print("Number:", dialog.get_input(), "pooled dialogs:", len(dialog_pool))
+
+
+def open_toplevel():
+    toplevel = toplevel_pool.acquire(title="Pooled toplevel")
+    if len(toplevel.winfo_children()) == 0:
+        customtkinter.CTkLabel(toplevel, text="close me, I will be reused").pack(padx=20, pady=20)
+
+
+customtkinter.CTkButton(app, text="Open dialog", command=open_dialog).pack(pady=20)
+customtkinter.CTkButton(app, text="Open toplevel", command=open_toplevel).pack(pady=20)
+mode_switch = customtkinter.CTkSwitch(app, text="dark mode",
+                                      command=lambda: customtkinter.set_appearance_mode("dark" if mode_switch.get() == 1 else "light"))
+mode_switch.pack(pady=20)
+
+app.mainloop()